@@ -16,7 +16,7 @@ import tomllib
 import asyncio
 
 from .exceptions import ServiceUnavailableError
-from . import health
+from . import health, ors_client, overpass_client
 from .models import (
     RecommendRequest,
     RecommendResponse,
@@ -136,6 +136,10 @@ def create_app() -> FastAPI:
             uptime_human=f"{uptime // 3600}h {(uptime % 3600) // 60}m {uptime % 60}s"
         )
 
+        # Release pooled keep-alive connections to upstream services
+        ors_client.close_session()
+        overpass_client.close_session()
+
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request, exc):
         logger.warning(
@@ -210,6 +214,26 @@ def create_app() -> FastAPI:
             "version": get_version()
         }
 
+    # Concurrent /ready calls share one in-flight batch of upstream probes
+    ready_inflight: asyncio.Task | None = None
+
+    def _clear_ready_inflight(task: asyncio.Task) -> None:
+        nonlocal ready_inflight
+        ready_inflight = None
+
+    async def _check_readiness() -> dict[str, health.HealthCheckResult]:
+        # Get service URLs from environment variables
+        nominatim_url = os.getenv("NOMINATIM_BASE_URL", "https://nominatim.openstreetmap.org")
+        ors_url = os.getenv("ORS_BASE_URL", "https://api.openrouteservice.org")
+        overpass_url = os.getenv("OVERPASS_BASE_URL", "https://overpass-api.de/api")
+
+        # Check all services concurrently, answering as soon as one fails
+        return await health.check_until_first_failure({
+            "nominatim": health.check_nominatim_health(nominatim_url),
+            "ors": health.check_ors_health(ors_url),
+            "overpass": health.check_overpass_health(overpass_url)
+        })
+
     @app.get("/ready")
     async def readiness_check():
         """Readiness check endpoint.
@@ -217,25 +241,19 @@ def create_app() -> FastAPI:
         Checks if all external service dependencies are healthy.
         Returns 200 if all services are available, 503 if any service is unavailable.
         This endpoint is designed for readiness probes in Kubernetes/Docker environments.
+        Requests arriving while a check is running wait for its result instead of
+        probing the upstream services again.
         """
-        # Get service URLs from environment variables
-        nominatim_url = os.getenv("NOMINATIM_BASE_URL", "https://nominatim.openstreetmap.org")
-        ors_url = os.getenv("ORS_BASE_URL", "https://api.openrouteservice.org")
-        overpass_url = os.getenv("OVERPASS_BASE_URL", "https://overpass-api.de/api")
+        nonlocal ready_inflight
+        if ready_inflight is None:
+            ready_inflight = asyncio.create_task(_check_readiness())
+            ready_inflight.add_done_callback(_clear_ready_inflight)
 
-        # Check all services concurrently
-        nominatim_result, ors_result, overpass_result = await asyncio.gather(
-            health.check_nominatim_health(nominatim_url),
-            health.check_ors_health(ors_url),
-            health.check_overpass_health(overpass_url)
-        )
+        # Shield the shared check so one disconnecting caller cannot cancel it for the rest
+        services = await asyncio.shield(ready_inflight)
 
         # Determine overall readiness
-        all_healthy = (
-            nominatim_result["healthy"] and
-            ors_result["healthy"] and
-            overpass_result["healthy"]
-        )
+        all_healthy = all(result["healthy"] for result in services.values())
 
         status_code = 200 if all_healthy else 503
         status = "ready" if all_healthy else "not_ready"
@@ -243,11 +261,7 @@ def create_app() -> FastAPI:
         response_data = {
             "status": status,
             "ts": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-            "services": {
-                "nominatim": nominatim_result,
-                "ors": ors_result,
-                "overpass": overpass_result
-            }
+            "services": services
         }
 
         return JSONResponse(status_code=status_code, content=response_data)
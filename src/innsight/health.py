@@ -1,7 +1,8 @@
 """Health check functions for external APIs."""
 
+import asyncio
 import time
-from typing import TypedDict
+from typing import Awaitable, TypedDict
 
 import httpx
 
@@ -9,12 +10,25 @@ import httpx
 class HealthCheckResult(TypedDict):
     """Result of a health check operation."""
     service: str
-    healthy: bool
+    healthy: bool | None  # None when the check was skipped and the service never probed
     response_time_ms: float
     status_code: int | None
     error: str | None
 
 
+async def _probe(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """
+    Probe a URL with HEAD, falling back to GET for servers that reject HEAD.
+
+    Only the status code matters for a health check, so HEAD avoids
+    transferring a response body we would discard.
+    """
+    response = await client.head(url)
+    if response.status_code == 405:
+        response = await client.get(url)
+    return response
+
+
 async def _check_service_health(
     service_name: str,
     base_url: str,
@@ -31,14 +45,14 @@ async def _check_service_health(
     Returns:
         HealthCheckResult dictionary with service status
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(base_url)
+            response = await _probe(client, base_url)
             response.raise_for_status()
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
 
         return {
             "service": service_name,
@@ -49,7 +63,7 @@ async def _check_service_health(
         }
 
     except httpx.TimeoutException as e:
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
         return {
             "service": service_name,
             "healthy": False,
@@ -59,7 +73,7 @@ async def _check_service_health(
         }
 
     except httpx.ConnectError as e:
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
         return {
             "service": service_name,
             "healthy": False,
@@ -69,7 +83,7 @@ async def _check_service_health(
         }
 
     except httpx.HTTPStatusError as e:
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
         return {
             "service": service_name,
             "healthy": False,
@@ -79,7 +93,7 @@ async def _check_service_health(
         }
 
     except Exception as e:
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
         return {
             "service": service_name,
             "healthy": False,
@@ -91,7 +105,7 @@ async def _check_service_health(
 
 async def check_nominatim_health(base_url: str, timeout: float = 3.0) -> HealthCheckResult:
     """
-    Check health of Nominatim API.
+    Check health of Nominatim API via its lightweight /status endpoint.
 
     Args:
         base_url: Base URL of the Nominatim API
@@ -100,7 +114,7 @@ async def check_nominatim_health(base_url: str, timeout: float = 3.0) -> HealthC
     Returns:
         HealthCheckResult dictionary with service status
     """
-    return await _check_service_health("nominatim", base_url, timeout)
+    return await _check_service_health("nominatim", f"{base_url.rstrip('/')}/status", timeout)
 
 
 async def check_ors_health(base_url: str, timeout: float = 3.0) -> HealthCheckResult:
@@ -119,7 +133,7 @@ async def check_ors_health(base_url: str, timeout: float = 3.0) -> HealthCheckRe
 
 async def check_overpass_health(base_url: str, timeout: float = 3.0) -> HealthCheckResult:
     """
-    Check health of Overpass API.
+    Check health of Overpass API via its lightweight /status endpoint.
 
     Args:
         base_url: Base URL of the Overpass API
@@ -128,7 +142,50 @@ async def check_overpass_health(base_url: str, timeout: float = 3.0) -> HealthCh
     Returns:
         HealthCheckResult dictionary with service status
     """
-    return await _check_service_health("overpass", base_url, timeout)
+    return await _check_service_health("overpass", f"{base_url.rstrip('/')}/status", timeout)
+
+
+async def check_until_first_failure(
+    checks: dict[str, Awaitable[HealthCheckResult]]
+) -> dict[str, HealthCheckResult]:
+    """
+    Run health checks concurrently, stopping as soon as one reports unhealthy.
+
+    Checks still pending when a failure arrives are cancelled and reported as
+    skipped (healthy None, since the service was never probed), so a readiness
+    verdict costs the fastest failure rather than the slowest probe.
+
+    Args:
+        checks: Mapping of service name to a pending health check
+
+    Returns:
+        Mapping of service name to its HealthCheckResult, in the order given
+    """
+    tasks = {name: asyncio.ensure_future(check) for name, check in checks.items()}
+    pending = set(tasks.values())
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(not task.result()["healthy"] for task in done):
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+
+    results: dict[str, HealthCheckResult] = {}
+    for name, task in tasks.items():
+        if task in pending:
+            results[name] = {
+                "service": name,
+                "healthy": None,
+                "response_time_ms": 0.0,
+                "status_code": None,
+                "error": "Check skipped: another service is unavailable"
+            }
+        else:
+            results[name] = task.result()
+    return results
 
 
 def get_cache_stats(recommender) -> dict:
@@ -1,16 +1,29 @@
+import asyncio
+import hashlib
+import json
 import os
+import struct
+import threading
 import time
-from functools import wraps
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, wraps
 from json import JSONDecodeError
-from typing import Dict, List, Tuple
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import requests
+import shapely
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 from shapely.geometry import Polygon
 
 from .exceptions import IsochroneError, NetworkError, APIError
 from .logging_config import get_logger
+from .utils import backoff_delay, json_loads, parse_retry_after
 
 # Get module logger
 logger = get_logger(__name__)
@@ -20,18 +33,99 @@ load_dotenv()
 # Configuration constants
 DEFAULT_CACHE_MAXSIZE = 128
 DEFAULT_CACHE_TTL_HOURS = 24
+DEFAULT_CACHE_STALE_HOURS = 7 * 24  # how long expired disk entries remain as an outage fallback
 DEFAULT_MAX_ATTEMPTS = 3
 DEFAULT_RETRY_DELAY = 1
 DEFAULT_BACKOFF_MULTIPLIER = 2
+DEFAULT_MAX_RETRY_DELAY = 30
+DEFAULT_RETRY_JITTER = 0.5
 DEFAULT_REQUEST_TIMEOUT = (5, 30)
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 20
+DEFAULT_BATCH_WORKERS = 8
+DEFAULT_COORD_PRECISION = 6  # decimal places, ~0.1 m
 
 
-def retry_on_network_error(max_attempts=DEFAULT_MAX_ATTEMPTS, delay=DEFAULT_RETRY_DELAY, backoff=DEFAULT_BACKOFF_MULTIPLIER):
+def _create_session() -> requests.Session:
+    """Create a keep-alive session so repeated ORS calls reuse pooled connections.
+
+    Retries are left to retry_on_network_error, so the adapter never retries.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session = _create_session()
+
+
+def close_session() -> None:
+    """Close pooled ORS connections; called from the app's shutdown handler."""
+    _session.close()
+
+
+@dataclass(frozen=True)
+class OrsConfig:
+    """ORS endpoint settings, parsed from the environment once."""
+    url: Optional[str]
+    api_key: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> "OrsConfig":
+        return cls(url=os.getenv("ORS_URL"), api_key=os.getenv("ORS_API_KEY"))
+
+
+_CFG: Optional[OrsConfig] = None
+
+
+def _ors_config() -> OrsConfig:
+    """Return the ORS settings, reading the environment on first use.
+
+    Parsing is deferred to the first request rather than import so that
+    settings loaded after import (e.g. by the CLI or test setup) are seen.
+    """
+    global _CFG
+    if _CFG is None:
+        _CFG = OrsConfig.from_env()
+    return _CFG
+
+
+@lru_cache(maxsize=1)
+def _request_headers(api_key: Optional[str]) -> Dict[str, Optional[str]]:
+    """Build the ORS request headers once per API key instead of on every call.
+
+    Callers must not mutate the returned dict.
+    """
+    return {
+        "Accept": "application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8",
+        "Content-Type": "application/json; charset=utf-8",
+        "Authorization": api_key,
+    }
+
+
+def retry_on_network_error(
+    max_attempts=DEFAULT_MAX_ATTEMPTS,
+    delay=DEFAULT_RETRY_DELAY,
+    backoff=DEFAULT_BACKOFF_MULTIPLIER,
+    max_delay=DEFAULT_MAX_RETRY_DELAY,
+    jitter=DEFAULT_RETRY_JITTER,
+):
+    """
+    Retry transient ORS failures with capped exponential backoff.
+    - The n-th retry waits delay * backoff**n, stretched by a random factor
+      in [1, 1 + jitter] so concurrent clients do not retry in lockstep
+    - A Retry-After header on a 429/5xx response takes precedence
+    - No single wait exceeds max_delay
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            current_delay = delay
-            
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
@@ -61,6 +155,9 @@ def retry_on_network_error(max_attempts=DEFAULT_MAX_ATTEMPTS, delay=DEFAULT_RETR
                         )
                         raise
 
+                    retry_after = parse_retry_after(e.response) if isinstance(e, HTTPError) else None
+                    retry_delay = backoff_delay(attempt, delay, backoff, max_delay, jitter, retry_after)
+
                     logger.warning(
                         "API call failed, retrying",
                         service="openrouteservice",
@@ -68,10 +165,9 @@ def retry_on_network_error(max_attempts=DEFAULT_MAX_ATTEMPTS, delay=DEFAULT_RETR
                         max_attempts=max_attempts,
                         error_type=type(e).__name__,
                         error_message=str(e),
-                        retry_delay_seconds=current_delay
+                        retry_delay_seconds=round(retry_delay, 3)
                     )
-                    time.sleep(current_delay)
-                    current_delay *= backoff
+                    time.sleep(retry_delay)
             return None
 
         return wrapper
@@ -80,59 +176,181 @@ def retry_on_network_error(max_attempts=DEFAULT_MAX_ATTEMPTS, delay=DEFAULT_RETR
 
 # Custom cache storage
 _fallback_cache: Dict[Tuple, Tuple[List[Polygon], float]] = {}  # (key, (result, timestamp))
+_fallback_cache_lock = threading.RLock()
+# Cache clock seam; wall-clock rather than monotonic because timestamps are
+# persisted to the disk cache and compared across processes
+_clock = time.time
+_inflight: Dict[Tuple, Future] = {}  # (key, future of the call currently fetching it)
 
 
-def fallback_cache(maxsize=DEFAULT_CACHE_MAXSIZE, ttl_hours=DEFAULT_CACHE_TTL_HOURS):
+def _prune_cache(current_time: float, maxsize: int, ttl_hours: float) -> None:
+    """Once over maxsize, drop expired entries, then the oldest until it fits.
+
+    Expired entries are kept while there is room so they can still serve as
+    a fallback. Caller must hold _fallback_cache_lock.
+    """
+    if len(_fallback_cache) <= maxsize:
+        return
+
+    expired_keys = [
+        k for k, (_, timestamp) in _fallback_cache.items()
+        if current_time - timestamp > ttl_hours * 3600
+    ]
+    for expired_key in expired_keys:
+        _fallback_cache.pop(expired_key, None)
+
+    while len(_fallback_cache) > maxsize:
+        oldest_key = min(_fallback_cache, key=lambda k: _fallback_cache[k][1])
+        _fallback_cache.pop(oldest_key, None)
+
+
+_DISK_CACHE_SUFFIX = ".wkb.z"
+
+
+def _encode_cache_entry(polygons: List[Polygon], timestamp: float) -> bytes:
+    """Serialize an entry as zlib-compressed, length-prefixed WKB.
+
+    Layout: timestamp (float64), polygon count (uint32), then each polygon's
+    WKB preceded by its byte length (uint32); all little-endian.
+    """
+    parts = [struct.pack("<dI", timestamp, len(polygons))]
+    for wkb in shapely.to_wkb(polygons):
+        parts.append(struct.pack("<I", len(wkb)))
+        parts.append(wkb)
+    return zlib.compress(b"".join(parts))
+
+
+def _decode_cache_entry(data: bytes) -> Tuple[List[Polygon], float]:
+    """Inverse of _encode_cache_entry."""
+    raw = zlib.decompress(data)
+    timestamp, count = struct.unpack_from("<dI", raw)
+    offset = struct.calcsize("<dI")
+    wkbs = []
+    for _ in range(count):
+        (size,) = struct.unpack_from("<I", raw, offset)
+        offset += 4
+        wkbs.append(raw[offset:offset + size])
+        offset += size
+    return shapely.from_wkb(wkbs).tolist(), timestamp
+
+
+def _disk_cache_path(key: Tuple) -> Optional[Path]:
+    """File backing a cache entry, or None when ORS_CACHE_DIR is not set."""
+    cache_dir = os.getenv("ORS_CACHE_DIR")
+    if not cache_dir:
+        return None
+    # Hash a canonical JSON form so file names do not depend on tuple/list or repr details;
+    # the ORS base URL is included so a directory shared between environments
+    # never serves results fetched from another server
+    canonical = json.dumps([_ors_config().url, key], sort_keys=True, separators=(",", ":"))
+    digest = hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+    return Path(cache_dir) / f"{digest}{_DISK_CACHE_SUFFIX}"
+
+
+def _disk_cache_load(key: Tuple, stale_hours: float) -> Optional[Tuple[List[Polygon], float]]:
+    """Read a persisted (result, timestamp) entry; missing or unreadable files are misses.
+
+    Entries past the TTL are still returned so they can serve as the stale
+    fallback; only files older than stale_hours are deleted rather than read.
+    """
+    path = _disk_cache_path(key)
+    if path is None:
+        return None
+    try:
+        if _clock() - path.stat().st_mtime > stale_hours * 3600:
+            path.unlink(missing_ok=True)
+            return None
+        return _decode_cache_entry(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, zlib.error, struct.error, shapely.errors.GEOSException) as e:
+        logger.warning("Ignoring unreadable isochrone disk cache entry",
+                       path=str(path), error_type=type(e).__name__)
+        return None
+
+
+def _disk_cache_store(key: Tuple, result: List[Polygon], timestamp: float) -> None:
+    """Persist an entry; the file is swapped in atomically so readers never see partial writes."""
+    path = _disk_cache_path(key)
+    if path is None:
+        return
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(_encode_cache_entry(result, timestamp))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Failed to write isochrone disk cache entry",
+                       path=str(path), error_type=type(e).__name__)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _disk_cache_prune(maxsize: int, stale_hours: float) -> None:
+    """Delete files past the stale horizon from ORS_CACHE_DIR, then the oldest until at most maxsize remain.
+
+    Runs after each store, i.e. only on cache misses that already paid for an
+    API round trip, so scanning the directory is comparatively cheap.
+    """
+    cache_dir = os.getenv("ORS_CACHE_DIR")
+    if not cache_dir:
+        return
+    current_time = _clock()
+    entries = []
+    for path in Path(cache_dir).glob(f"*{_DISK_CACHE_SUFFIX}"):
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            continue
+        if current_time - mtime > stale_hours * 3600:
+            path.unlink(missing_ok=True)
+        else:
+            entries.append((mtime, path))
+
+    entries.sort()
+    for _, path in entries[:max(len(entries) - maxsize, 0)]:
+        path.unlink(missing_ok=True)
+
+
+def _disk_cache_clear() -> None:
+    """Remove all persisted entries from ORS_CACHE_DIR, if configured."""
+    cache_dir = os.getenv("ORS_CACHE_DIR")
+    if cache_dir:
+        for path in Path(cache_dir).glob(f"*{_DISK_CACHE_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+
+def fallback_cache(
+    maxsize=DEFAULT_CACHE_MAXSIZE,
+    ttl_hours=DEFAULT_CACHE_TTL_HOURS,
+    stale_hours=DEFAULT_CACHE_STALE_HOURS,
+):
     """
     Cache decorator that falls back to expired cache on failure.
     - maxsize: Maximum number of cache items
     - ttl_hours: Cache validity period (hours)
+    - stale_hours: How long expired disk entries are kept as a fallback (hours)
+
+    When ORS_CACHE_DIR is set, entries are also persisted there so they survive
+    process restarts; in-memory misses are filled from disk before calling out.
+    Expired disk entries still serve as the fallback after a restart until they
+    pass stale_hours, when they are deleted; at most maxsize files are kept.
+
+    Cache access is guarded by a lock; the wrapped call itself runs unlocked so
+    concurrent misses for different keys are not serialized, while concurrent
+    misses for the same key wait on and share the one call already in flight.
     """
     def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Build cache key
-            key = (func.__name__, args, tuple(sorted(kwargs.items())))
-            current_time = time.time()
-            
-            # Check for valid cache
-            if key in _fallback_cache:
-                cached_result, cached_time = _fallback_cache[key]
-                age_hours = (current_time - cached_time) / 3600
-                
-                # Return cached result if still valid
-                if age_hours <= ttl_hours:
-                    return cached_result
-            
+        def load(key, args, kwargs, current_time):
+            """Call func and cache its result, or fall back to a stale entry."""
             try:
                 # Try to execute function
                 result = func(*args, **kwargs)
-                # Update cache on success
-                _fallback_cache[key] = (result, current_time)
-                
-                # Clean up expired cache items
-                if len(_fallback_cache) > maxsize:
-                    expired_keys = [
-                        k for k, (_, timestamp) in _fallback_cache.items()
-                        if current_time - timestamp > ttl_hours * 3600
-                    ]
-                    for expired_key in expired_keys:
-                        _fallback_cache.pop(expired_key, None)
-                    
-                    # If still too many, remove oldest items
-                    if len(_fallback_cache) > maxsize:
-                        oldest_key = min(
-                            _fallback_cache.keys(),
-                            key=lambda k: _fallback_cache[k][1]
-                        )
-                        _fallback_cache.pop(oldest_key, None)
-                
-                return result
-                
             except (Timeout, ConnectionError, HTTPError, JSONDecodeError) as e:
                 # Only fallback to cache for network-related errors
-                if key in _fallback_cache:
-                    cached_result, cached_time = _fallback_cache[key]
+                with _fallback_cache_lock:
+                    cached = _fallback_cache.get(key)
+                if cached is not None:
+                    cached_result, cached_time = cached
                     age_hours = (current_time - cached_time) / 3600
                     logger.warning(
                         "API call failed, using stale cache",
@@ -145,19 +363,109 @@ def fallback_cache(maxsize=DEFAULT_CACHE_MAXSIZE, ttl_hours=DEFAULT_CACHE_TTL_HO
                 else:
                     # Raise custom error when no cache available
                     raise IsochroneError(f"Isochrone request failed and no cache available: {str(e)}") from e
-        
+
+            # Empty results are not cached so a transient empty response is
+            # not served for the whole TTL or kept as a stale fallback
+            if not result:
+                return result
+
+            # Update cache on success and evict expired / excess items
+            with _fallback_cache_lock:
+                _fallback_cache[key] = (result, current_time)
+                _prune_cache(current_time, maxsize, ttl_hours)
+            _disk_cache_store(key, result, current_time)
+            _disk_cache_prune(maxsize, stale_hours)
+
+            return result
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # Build cache key
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            current_time = _clock()
+            
+            # Check for valid cache, in memory first and then on disk
+            with _fallback_cache_lock:
+                cached = _fallback_cache.get(key)
+            if cached is None:
+                cached = _disk_cache_load(key, stale_hours)
+                if cached is not None:
+                    with _fallback_cache_lock:
+                        _fallback_cache[key] = cached
+            if cached is not None:
+                cached_result, cached_time = cached
+                age_hours = (current_time - cached_time) / 3600
+                
+                # Return cached result if still valid
+                if age_hours <= ttl_hours:
+                    return cached_result
+            
+            # Coalesce concurrent misses for the same key onto a single call
+            with _fallback_cache_lock:
+                # Another caller may have stored the key since the check above
+                fresh = _fallback_cache.get(key)
+                if fresh is not None and fresh is not cached:
+                    return fresh[0]
+                future = _inflight.get(key)
+                is_owner = future is None
+                if is_owner:
+                    future = _inflight[key] = Future()
+            if not is_owner:
+                return future.result()
+
+            try:
+                result = load(key, args, kwargs, current_time)
+            except Exception as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                with _fallback_cache_lock:
+                    _inflight.pop(key, None)
+                # KeyboardInterrupt, SystemExit or cancellation bypass the branches
+                # above; still resolve the future so waiters are not blocked forever
+                if not future.done():
+                    future.set_exception(IsochroneError("Isochrone request was interrupted"))
+
         # Add cache management methods
-        wrapper.cache_clear = lambda: _fallback_cache.clear()
-        wrapper.cache_info = lambda: {
-            'size': len(_fallback_cache),
-            'items': {k: (len(v[0]), v[1]) for k, v in _fallback_cache.items()}
-        }
+        def cache_clear():
+            with _fallback_cache_lock:
+                _fallback_cache.clear()
+            _disk_cache_clear()
+
+        def cache_info():
+            with _fallback_cache_lock:
+                return {
+                    'size': len(_fallback_cache),
+                    'items': {k: (len(v[0]), v[1]) for k, v in _fallback_cache.items()}
+                }
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cache_info
         
         return wrapper
     return decorator
 
 
-@fallback_cache(maxsize=DEFAULT_CACHE_MAXSIZE, ttl_hours=DEFAULT_CACHE_TTL_HOURS)
+def _polygons_from_features(features: List[dict]) -> List[Polygon]:
+    """Build polygons from the exterior rings of Polygon features in one vectorized call."""
+    rings = [
+        feature["geometry"]["coordinates"][0]  # Exterior ring coordinates
+        for feature in features
+        if feature.get("geometry", {}).get("type") == "Polygon"
+    ]
+    if not rings:
+        return []
+
+    # Rings differ in length, so flatten them and tag each point with its ring index
+    indices = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+    linearrings = shapely.linearrings(np.concatenate(rings), indices=indices)
+    return shapely.polygons(linearrings).tolist()
+
+
+@fallback_cache(maxsize=DEFAULT_CACHE_MAXSIZE, ttl_hours=DEFAULT_CACHE_TTL_HOURS, stale_hours=DEFAULT_CACHE_STALE_HOURS)
 @retry_on_network_error(max_attempts=DEFAULT_MAX_ATTEMPTS, delay=DEFAULT_RETRY_DELAY, backoff=DEFAULT_BACKOFF_MULTIPLIER)
 def _fetch_isochrones_from_api(
         profile: str,
@@ -167,18 +475,16 @@ def _fetch_isochrones_from_api(
     # Start measuring latency
     start_time = time.perf_counter()
 
-    resp = requests.post(
-        url=f"{os.getenv('ORS_URL')}/isochrones/{profile}",
+    config = _ors_config()
+
+    resp = _session.post(
+        url=f"{config.url}/isochrones/{profile}",
         json={"locations": locations, "range": max_range},
-        headers={
-            "Accept": "application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8",
-            "Content-Type": "application/json; charset=utf-8",
-            "Authorization": os.getenv("ORS_API_KEY"),
-        },
+        headers=_request_headers(config.api_key),
         timeout=DEFAULT_REQUEST_TIMEOUT
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = json_loads(resp.content)
 
     # Check for API errors
     if isinstance(data, dict) and "error" in data:
@@ -187,12 +493,7 @@ def _fetch_isochrones_from_api(
         raise APIError(f"ORS API error {code}: {msg}", status_code=code)
 
     # Convert GeoJSON features to Shapely polygons
-    polygons = []
-    if "features" in data:
-        for feature in data["features"]:
-            if feature.get("geometry", {}).get("type") == "Polygon":
-                coords = feature["geometry"]["coordinates"][0]  # Exterior ring coordinates
-                polygons.append(Polygon(coords))
+    polygons = _polygons_from_features(data["features"]) if "features" in data else []
 
     # Log successful API call with latency
     latency_ms = (time.perf_counter() - start_time) * 1000
@@ -224,14 +525,87 @@ def get_isochrones_by_minutes(
     Returns:
         List of isochrones, each element corresponds to a time interval
     """
-    # Convert minutes to seconds and make single API call
+    # Freeze arguments to tuples so they form a hashable cache key, quantizing
+    # coordinates so float noise (8.6814950000001) still hits the cache
+    location = tuple(round(value, DEFAULT_COORD_PRECISION) for value in coord)
+
+    if not intervals:
+        return []
+
+    # One multi-range request (and one cache entry) covers every interval; the
+    # service always asks for the same interval set, so splitting it would only
+    # multiply ORS requests against the rate-limited quota
     max_range = tuple(minutes * 60 for minutes in intervals)
-    all_polygons = _fetch_isochrones_from_api(profile, (coord,), max_range)
-    
+    all_polygons = _fetch_isochrones_from_api(profile, (location,), max_range)
+
     # ORS API returns one polygon per time range
     # Convert single polygon list to list of lists format for consistency
     return [[polygon] for polygon in all_polygons]
 
+
+def get_isochrones_batch(
+    items: Iterable[Tuple[Tuple[float, float], List[int]]],
+    profile: str = 'driving-car',
+    max_workers: int = DEFAULT_BATCH_WORKERS
+) -> List[List[List[Polygon]]]:
+    """
+    Get isochrones for several coordinates concurrently.
+
+    Requests are dispatched on a thread pool sharing the pooled session, so N
+    lookups take roughly the slowest round trip instead of the sum of all.
+
+    Args:
+        items: (coord, intervals) pairs, as taken by get_isochrones_by_minutes
+        profile: Transportation mode, defaults to 'driving-car'
+        max_workers: Maximum number of concurrent requests
+
+    Returns:
+        Isochrones for each item, in input order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(get_isochrones_by_minutes, coord, intervals, profile)
+            for coord, intervals in items
+        ]
+        return [future.result() for future in futures]
+
+
+async def get_isochrones_async(
+    coord: Tuple[float, float],
+    intervals: List[int],
+    profile: str = 'driving-car'
+) -> List[List[Polygon]]:
+    """
+    Async variant of get_isochrones_by_minutes for use inside the event loop.
+
+    The blocking call runs in a worker thread, so it keeps the same session,
+    cache, retry and de-duplication behaviour without blocking the loop.
+    """
+    return await asyncio.to_thread(get_isochrones_by_minutes, coord, intervals, profile)
+
+
+async def get_isochrones_batch_async(
+    items: Iterable[Tuple[Tuple[float, float], List[int]]],
+    profile: str = 'driving-car',
+    max_concurrency: int = DEFAULT_BATCH_WORKERS
+) -> List[List[List[Polygon]]]:
+    """
+    Async variant of get_isochrones_batch; results are returned in input order.
+
+    At most max_concurrency requests are outstanding at once, so large batches
+    stay within the session pool and do not trip ORS rate limits.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(coord, intervals):
+        async with semaphore:
+            return await get_isochrones_async(coord, intervals, profile)
+
+    return list(await asyncio.gather(
+        *(fetch(coord, intervals) for coord, intervals in items)
+    ))
+
+
 # Expose cache methods
 get_isochrones_by_minutes.cache_info = _fetch_isochrones_from_api.cache_info
 get_isochrones_by_minutes.cache_clear = _fetch_isochrones_from_api.cache_clear
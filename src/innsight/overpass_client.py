@@ -1,18 +1,54 @@
 import os
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Any
 
 from .exceptions import NetworkError, APIError
+from .utils import backoff_delay, json_loads, parse_retry_after
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 20
+DEFAULT_RETRY_DELAY = 1
+DEFAULT_BACKOFF_MULTIPLIER = 2
+DEFAULT_MAX_RETRY_DELAY = 30
+DEFAULT_RETRY_JITTER = 0.5
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session so repeated Overpass queries reuse pooled connections.
+
+    Retries are handled by fetch_overpass, so the adapter never retries.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session = _create_session()
+
+
+def close_session() -> None:
+    """Close pooled Overpass connections; called from the app's shutdown handler."""
+    _session.close()
+
 
 def fetch_overpass(query: str, timeout: int = 25, max_tries: int = 3) -> List[Dict[str, Any]]:
     if "[timeout:" not in query:
         query = query.replace("[out:json]", f"[out:json][timeout:{timeout}]")
 
     for attempt in range(1, max_tries + 1):
+        retry_after = None
         try:
-            resp = requests.post(os.getenv("OVERPASS_URL"), data={"data": query}, timeout=timeout + 5)
+            resp = _session.post(os.getenv("OVERPASS_URL"), data={"data": query}, timeout=timeout + 5)
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
             return data.get("elements", [])
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
             if attempt == max_tries:
@@ -20,9 +56,15 @@ def fetch_overpass(query: str, timeout: int = 25, max_tries: int = 3) -> List[Di
         except requests.exceptions.HTTPError as e:
             # HTTP 429 / 504 常見：流量超限或查詢太大
             status = e.response.status_code
-            if status in (429, 504) and attempt < max_tries:
-                continue
-            raise  # 其他錯誤直接拋出
+            if not (status in (429, 504) and attempt < max_tries):
+                raise  # 其他錯誤直接拋出
+            retry_after = parse_retry_after(e.response)
         except ValueError as e:
             raise APIError(f"Invalid response format: {e}")
+
+        # 指數退避加 jitter，伺服器給了 Retry-After 則優先採用
+        time.sleep(backoff_delay(
+            attempt - 1, DEFAULT_RETRY_DELAY, DEFAULT_BACKOFF_MULTIPLIER,
+            DEFAULT_MAX_RETRY_DELAY, DEFAULT_RETRY_JITTER, retry_after,
+        ))
     raise NetworkError("Unable to fetch data after multiple retries")
@@ -1,5 +1,6 @@
 """Isochrone service for calculating travel time polygons."""
 
+import sys
 from typing import List, Tuple, Optional
 
 from ..config import AppConfig
@@ -19,7 +20,6 @@ class IsochroneService:
         except Exception as e:
             # Check if we can use cached data
             if "cache" in str(e).lower():
-                import sys
                 print("使用快取資料", file=sys.stderr)
                 try:
                     return get_isochrones_by_minutes(coord, intervals)
@@ -1,6 +1,17 @@
 """Utility functions for the innsight application."""
 
-from typing import List
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
+
+# orjson parses large API responses several times faster; it is optional and
+# the stdlib parser is used when it is not installed. Both raise a
+# json.JSONDecodeError (a ValueError) subclass on invalid input.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 def combine_tokens(tokens: List[str]) -> str:
@@ -8,4 +19,39 @@ def combine_tokens(tokens: List[str]) -> str:
     try:
         return ''.join(str(token) for token in tokens if token is not None)
     except (TypeError, AttributeError):
-        return ''
\ No newline at end of file
+        return ''
+
+
+def parse_retry_after(response) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    delay: float,
+    backoff: float,
+    max_delay: float,
+    jitter: float,
+    retry_after: Optional[float] = None,
+) -> float:
+    """Seconds to wait before retry number attempt + 1.
+
+    The n-th retry waits delay * backoff**n, stretched by a random factor in
+    [1, 1 + jitter] so concurrent clients do not retry in lockstep. A
+    server-provided Retry-After takes precedence; neither exceeds max_delay.
+    """
+    if retry_after is None:
+        retry_after = delay * backoff ** attempt * (1 + random.uniform(0, jitter))
+    return min(max_delay, retry_after)
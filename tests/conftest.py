@@ -1,7 +1,124 @@
+import logging
+from contextlib import contextmanager
+from io import StringIO
+from pathlib import Path
 from unittest.mock import Mock
 
+import jieba
 import pytest
+import structlog
+from structlog.testing import LogCapture
 from innsight.config import AppConfig
+from innsight.logging_config import configure_logging
+
+# The user dictionary lives at the repository root, outside the innsight
+# package, so it is resolved from this file rather than importlib.resources
+_USER_DICT_PATH = Path(__file__).resolve().parent.parent / "resources" / "user_dict.txt"
+
+
+@pytest.fixture(scope="session")
+def jieba_ready():
+    """
+    Prime jieba's global tokenizer once per session: build the main
+    dictionary eagerly and load the project's user dictionary.
+    """
+    jieba.initialize()
+    with _USER_DICT_PATH.open("r", encoding="utf-8") as fh:
+        jieba.load_userdict(fh)
+
+
+class _LogBuffer(StringIO):
+    """StringIO that splits its captured contents into lines in one pass."""
+
+    def lines(self) -> list[str]:
+        return self.getvalue().splitlines()
+
+
+@pytest.fixture
+def log_output():
+    """In-memory stream to hand to configure_logging() and read log lines back from."""
+    return _LogBuffer()
+
+
+# structlog configurations already built by configure_logged(), keyed on the
+# settings that shape the processor chain: (log_format, log_level, env)
+_LOGGING_CHAINS = {}
+
+
+@pytest.fixture
+def configure_logged():
+    """
+    Test-only stand-in for configure_logging(config, stream).
+
+    The first call for a given (log_format, log_level, env) runs the real
+    configure_logging() and remembers the resulting structlog configuration.
+    Later calls with the same settings reinstate that configuration and only
+    point the existing root handler at the new stream.
+    """
+    def _configure(config, stream):
+        level = config.log_level.upper()
+        key = (config.log_format, level, config.env)
+        root_logger = logging.getLogger()
+        chain = _LOGGING_CHAINS.get(key)
+        if chain is None or len(root_logger.handlers) != 1:
+            configure_logging(config, stream=stream)
+            _LOGGING_CHAINS[key] = structlog.get_config()
+            return
+        structlog.configure(**chain)
+        root_logger.handlers[0].setStream(stream)
+        root_logger.setLevel(getattr(logging, level, logging.INFO))
+    return _configure
+
+
+@contextmanager
+def _capture_events():
+    # configure_logging() ends its chain with the renderer and
+    # ProcessorFormatter.wrap_for_formatter; swap both for a LogCapture
+    processors = structlog.get_config()["processors"]
+    capture = LogCapture()
+    structlog.configure(processors=[*processors[:-2], capture])
+    try:
+        yield capture.entries
+    finally:
+        structlog.configure(processors=processors)
+
+
+@pytest.fixture
+def capture_events():
+    """
+    Like structlog.testing.capture_logs(), but only the rendering step is
+    replaced: events still go through the configured processors (contextvars,
+    level, timestamp, enrichment) and are collected as dicts instead of being
+    rendered to text and parsed back. Level filtering happens in the stdlib
+    handler, so it is not applied to captured events.
+    """
+    return _capture_events
+
+
+@pytest.fixture(autouse=True)
+def _clean_log_env(monkeypatch):
+    """
+    Start every test without ENV/LOG_FORMAT/LOG_LEVEL from the shell or .env,
+    so tests only set the variables they care about.
+    """
+    for key in ("LOG_FORMAT", "LOG_LEVEL", "ENV"):
+        monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture
+def env(monkeypatch):
+    """
+    Set several environment variables in one call, e.g.
+    env(LOG_FORMAT="json", LOG_LEVEL=None); None unsets the variable.
+    Everything is restored by monkeypatch at teardown.
+    """
+    def _set(**kv):
+        for key, value in kv.items():
+            if value is None:
+                monkeypatch.delenv(key, raising=False)
+            else:
+                monkeypatch.setenv(key, value)
+    return _set
 
 
 @pytest.fixture
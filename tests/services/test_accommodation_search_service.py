@@ -5,15 +5,15 @@ import pandas as pd
 import geopandas as gpd
 import pytest
 
-from src.innsight.services.accommodation_search_service import AccommodationSearchService
-from src.innsight.services.query_service import QueryService
-from src.innsight.services.geocode_service import GeocodeService
-from src.innsight.services.accommodation_service import AccommodationService
-from src.innsight.services.isochrone_service import IsochroneService
-from src.innsight.services.tier_service import TierService
-from src.innsight.rating_service import RatingService
-from src.innsight.config import AppConfig
-from src.innsight.exceptions import NoAccommodationError
+from innsight.services.accommodation_search_service import AccommodationSearchService
+from innsight.services.query_service import QueryService
+from innsight.services.geocode_service import GeocodeService
+from innsight.services.accommodation_service import AccommodationService
+from innsight.services.isochrone_service import IsochroneService
+from innsight.services.tier_service import TierService
+from innsight.rating_service import RatingService
+from innsight.config import AppConfig
+from innsight.exceptions import NoAccommodationError
 
 
 class TestAccommodationSearchService:
@@ -3,7 +3,7 @@
 import pandas as pd
 from unittest.mock import patch
 
-from src.innsight.services.accommodation_service import AccommodationService
+from innsight.services.accommodation_service import AccommodationService
 
 
 class TestAccommodationService:
@@ -24,7 +24,7 @@ class TestAccommodationService:
 
     def test_fetch_accommodations(self):
         """Test fetching accommodations from API."""
-        with patch('src.innsight.services.accommodation_service.fetch_overpass') as mock_fetch:
+        with patch('innsight.services.accommodation_service.fetch_overpass') as mock_fetch:
             mock_elements = [
                 {
                     "id": 1,
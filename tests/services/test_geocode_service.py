@@ -3,9 +3,9 @@
 import pytest
 from unittest.mock import Mock, patch
 
-from src.innsight.services.geocode_service import GeocodeService
-from src.innsight.config import AppConfig
-from src.innsight.exceptions import GeocodeError
+from innsight.services.geocode_service import GeocodeService
+from innsight.config import AppConfig
+from innsight.exceptions import GeocodeError
 
 
 class TestGeocodeService:
@@ -23,7 +23,7 @@ class TestGeocodeService:
         """Test that client is lazily initialized."""
         assert self.service._client is None
         
-        with patch('src.innsight.services.geocode_service.NominatimClient') as mock_client_class:
+        with patch('innsight.services.geocode_service.NominatimClient') as mock_client_class:
             client = self.service.client
             
             mock_client_class.assert_called_once_with(
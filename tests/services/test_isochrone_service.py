@@ -2,8 +2,8 @@
 
 from unittest.mock import Mock, patch
 
-from src.innsight.services.isochrone_service import IsochroneService
-from src.innsight.config import AppConfig
+from innsight.services.isochrone_service import IsochroneService
+from innsight.config import AppConfig
 
 
 class TestIsochroneService:
@@ -16,7 +16,7 @@ class TestIsochroneService:
 
     def test_get_isochrones_with_fallback_success(self):
         """Test successful isochrone retrieval."""
-        with patch('src.innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_get:
+        with patch('innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_get:
             mock_isochrones = [{'geometry': 'polygon1'}, {'geometry': 'polygon2'}]
             mock_get.return_value = mock_isochrones
             
@@ -27,7 +27,7 @@ class TestIsochroneService:
 
     def test_get_isochrones_with_fallback_cache_error(self):
         """Test fallback handling for cache errors."""
-        with patch('src.innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_get:
+        with patch('innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_get:
             mock_get.side_effect = [Exception("cache error"), [{'geometry': 'polygon'}]]
             
             with patch('sys.stderr'):
@@ -37,7 +37,7 @@ class TestIsochroneService:
 
     def test_get_isochrones_with_fallback_non_cache_error(self):
         """Test handling of non-cache errors."""
-        with patch('src.innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_get:
+        with patch('innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_get:
             mock_get.side_effect = Exception("network error")
             
             result = self.service.get_isochrones_with_fallback((123.0, 25.0), [15])
@@ -46,7 +46,7 @@ class TestIsochroneService:
     
     def test_get_isochrones_with_fallback_cache_double_exception(self):
         """Test cache fallback when second call also fails (covers lines 26-27)."""
-        with patch('src.innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_get:
+        with patch('innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_get:
             # First call fails with cache error, second call also fails
             mock_get.side_effect = [
                 Exception("cache error occurred"),  # First call triggers cache logic
@@ -63,7 +63,7 @@ class TestIsochroneService:
     
     def test_get_isochrones_with_fallback_cache_success_on_retry(self):
         """Test cache fallback succeeds on retry."""
-        with patch('src.innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_get:
+        with patch('innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_get:
             # First call fails with cache error, second call succeeds
             mock_isochrones = [{'geometry': 'cached_polygon'}]
             mock_get.side_effect = [
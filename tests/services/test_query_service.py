@@ -3,8 +3,8 @@
 import pytest
 from unittest.mock import patch
 
-from src.innsight.services.query_service import QueryService
-from src.innsight.exceptions import ParseError
+from innsight.services.query_service import QueryService
+from innsight.exceptions import ParseError
 
 
 class TestQueryService:
@@ -16,8 +16,8 @@ class TestQueryService:
 
     def test_extract_search_term_with_location(self):
         """Test extracting search term when location is present."""
-        with patch('src.innsight.services.query_service.parse_query') as mock_parse, \
-             patch('src.innsight.services.query_service.extract_location_from_query') as mock_extract:
+        with patch('innsight.services.query_service.parse_query') as mock_parse, \
+             patch('innsight.services.query_service.extract_location_from_query') as mock_extract:
             
             mock_parse.return_value = {'poi': 'aquarium'}
             mock_extract.return_value = 'Okinawa'
@@ -30,8 +30,8 @@ class TestQueryService:
 
     def test_extract_search_term_with_poi_only(self):
         """Test extracting search term when only POI is present."""
-        with patch('src.innsight.services.query_service.parse_query') as mock_parse, \
-             patch('src.innsight.services.query_service.extract_location_from_query') as mock_extract:
+        with patch('innsight.services.query_service.parse_query') as mock_parse, \
+             patch('innsight.services.query_service.extract_location_from_query') as mock_extract:
             
             mock_parse.return_value = {'poi': 'aquarium'}
             mock_extract.return_value = ''
@@ -42,8 +42,8 @@ class TestQueryService:
 
     def test_extract_search_term_no_location_no_poi(self):
         """Test that missing location and POI raises ParseError."""
-        with patch('src.innsight.services.query_service.parse_query') as mock_parse, \
-             patch('src.innsight.services.query_service.extract_location_from_query') as mock_extract:
+        with patch('innsight.services.query_service.parse_query') as mock_parse, \
+             patch('innsight.services.query_service.extract_location_from_query') as mock_extract:
             
             mock_parse.return_value = {'poi': ''}
             mock_extract.return_value = ''
@@ -5,9 +5,9 @@ from unittest.mock import Mock
 import pandas as pd
 import geopandas as gpd
 
-from src.innsight.services.accommodation_search_service import AccommodationSearchService
-from src.innsight.config import AppConfig
-from src.innsight.exceptions import NoAccommodationError
+from innsight.services.accommodation_search_service import AccommodationSearchService
+from innsight.config import AppConfig
+from innsight.exceptions import NoAccommodationError
 
 
 class TestRankAccommodationsService:
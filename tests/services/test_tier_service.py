@@ -4,7 +4,7 @@ import pandas as pd
 import geopandas as gpd
 from unittest.mock import patch
 
-from src.innsight.services.tier_service import TierService
+from innsight.services.tier_service import TierService
 
 
 class TestTierService:
@@ -25,7 +25,7 @@ class TestTierService:
         
         mock_isochrones = [{'geometry': 'polygon1'}, {'geometry': 'polygon2'}]
         
-        with patch('src.innsight.services.tier_service.assign_tier') as mock_assign:
+        with patch('innsight.services.tier_service.assign_tier') as mock_assign:
             mock_gdf = gpd.GeoDataFrame(df.copy())
             mock_gdf['tier'] = [1, 2]
             mock_assign.return_value = mock_gdf
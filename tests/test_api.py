@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch
 import geopandas as gpd
 import time
 
-from src.innsight.app import create_app
+from innsight.app import create_app
 
 
 class TestRecommendAPI:
@@ -48,9 +48,9 @@ class TestRecommendAPI:
         assert "stats" in response_props
         assert "top" in response_props
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_response_format_stats_and_top(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that response has stats (tier counts) and top (recommendations array)."""
         # Arrange
@@ -94,9 +94,9 @@ class TestRecommendAPI:
         assert isinstance(top, list)
         assert len(top) == 3
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_field_types_and_ranges(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that fields have correct types and ranges: score 0-100 float, tier 0-3 int, name str."""
         # Arrange
@@ -137,9 +137,9 @@ class TestRecommendAPI:
         # Check tier is in range 0-3  
         assert 0 <= first_result["tier"] <= 3
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_field_validation_edge_cases(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that Pydantic validates fields correctly at boundaries."""
         # Arrange - create data with edge values
@@ -170,9 +170,9 @@ class TestRecommendAPI:
         assert first_result["score"] == 0.0
         assert first_result["tier"] == 3
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_custom_weights_support(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that custom weights are passed to recommender and affect results."""
         # Arrange - Create two different result sets for different weight calls
@@ -238,9 +238,9 @@ class TestRecommendAPI:
         second_call_args = mock_recommender.recommend.call_args_list[1][0] 
         assert len(second_call_args) >= 4 and second_call_args[3] is not None
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_success(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test successful recommendation request."""
         # Arrange
@@ -290,9 +290,9 @@ class TestRecommendAPI:
         # Verify recommender was called with correct parameters
         mock_recommender.recommend.assert_called_once_with("台北101", ["parking"], 5, None)
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_empty_query(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test recommendation with empty query."""
         # Act
@@ -311,9 +311,9 @@ class TestRecommendAPI:
         assert len(data["top"]) == 0
         assert data["stats"]["tier_0"] == 0
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_no_results(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test recommendation when no accommodations found."""
         # Arrange
@@ -338,9 +338,9 @@ class TestRecommendAPI:
         assert len(data["top"]) == 0
         assert data["stats"]["tier_0"] == 0
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_with_exception(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test recommendation when service throws exception."""
         # Arrange
@@ -363,9 +363,9 @@ class TestRecommendAPI:
         assert len(data["top"]) == 0
         assert data["stats"]["tier_0"] == 0
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_default_parameters(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test recommendation with default parameters."""
         # Arrange
@@ -456,12 +456,12 @@ class TestRecommendAPI:
         assert data["error"] == "Parse Error"
         assert "Request validation failed" in data["message"]
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_external_dependency_failure_returns_503(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that external dependency failures return HTTP 503."""
-        from src.innsight.exceptions import GeocodeError
+        from innsight.exceptions import GeocodeError
         
         # Arrange
         mock_recommender = Mock()
@@ -480,12 +480,12 @@ class TestRecommendAPI:
         assert "External service unavailable" in data["message"]
         assert "Geocoding service is down" in data["message"]
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')  
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')  
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_network_error_returns_503(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that network errors return HTTP 503."""
-        from src.innsight.exceptions import NetworkError
+        from innsight.exceptions import NetworkError
         
         # Arrange
         mock_recommender = Mock()
@@ -504,12 +504,12 @@ class TestRecommendAPI:
         assert "External service unavailable" in data["message"]
         assert "Network connection failed" in data["message"]
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_api_error_returns_503(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that API errors return HTTP 503."""
-        from src.innsight.exceptions import APIError
+        from innsight.exceptions import APIError
         
         # Arrange
         mock_recommender = Mock()
@@ -528,9 +528,9 @@ class TestRecommendAPI:
         assert "External service unavailable" in data["message"]
         assert "External API returned 500" in data["message"]
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_top_n_limit_enforced(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that top_n is limited to maximum of 20."""
         # Arrange - Create 25 results to test limiting
@@ -601,9 +601,9 @@ class TestRecommendAPI:
         assert data["error"] == "Parse Error"
         assert "Request validation failed" in data["message"]
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_top_n_default_value(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that top_n defaults to 20 when not specified."""
         # Arrange
@@ -631,9 +631,9 @@ class TestRecommendAPI:
         # Verify default top_n=20 was passed to recommender (filters now merged as empty list)
         mock_recommender.recommend.assert_called_once_with("test query", [], 20, None)
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_performance_under_300ms(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that recommendation requests complete within 300ms."""
         # Arrange
@@ -675,9 +675,9 @@ class TestRecommendAPI:
         # Performance requirement: response time should be under 300ms
         assert response_time_ms < 300, f"Response time {response_time_ms:.2f}ms exceeds 300ms requirement"
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_performance_multiple_requests(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test performance consistency across multiple requests."""
         # Arrange
@@ -722,9 +722,9 @@ class TestRecommendAPI:
         assert max_time < 300, f"Maximum response time {max_time:.2f}ms exceeds 300ms requirement"
         assert avg_time < 200, f"Average response time {avg_time:.2f}ms should be well under 300ms for consistency"
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_performance_with_maximum_results(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test performance when requesting maximum results (top_n=20)."""
         # Arrange - Create maximum number of results
@@ -765,9 +765,9 @@ class TestRecommendAPI:
         # Performance requirement even with maximum load
         assert response_time_ms < 300, f"Response time {response_time_ms:.2f}ms exceeds 300ms requirement even with max results"
     
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_isochrone_geometry(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that /recommend API returns isochrone geometry data."""
         # Arrange
@@ -826,9 +826,9 @@ class TestHTTPCaching:
         self.app = create_app()
         self.client = TestClient(self.app)
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_cache_control_header(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that /recommend response includes Cache-Control: no-cache, must-revalidate header."""
         # Arrange
@@ -857,9 +857,9 @@ class TestHTTPCaching:
         assert "cache-control" in response.headers
         assert response.headers["cache-control"] == "no-cache, must-revalidate"
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_etag_header(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that /recommend response includes ETag header."""
         # Arrange
@@ -893,9 +893,9 @@ class TestHTTPCaching:
         assert etag.endswith('"')
         assert len(etag) > 2  # More than just quotes
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_same_content_generates_same_etag(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that identical responses generate the same ETag."""
         # Arrange
@@ -932,9 +932,9 @@ class TestHTTPCaching:
         assert etag2 is not None
         assert etag1 == etag2
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_different_content_generates_different_etag(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that different responses generate different ETags."""
         # Arrange - Create two different response datasets
@@ -981,9 +981,9 @@ class TestHTTPCaching:
         assert etag2 is not None
         assert etag1 != etag2
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_with_if_none_match_returns_304_when_etag_matches(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that /recommend returns 304 Not Modified when If-None-Match matches current ETag."""
         # Arrange
@@ -1019,9 +1019,9 @@ class TestHTTPCaching:
         assert response2.status_code == 304
         assert response2.content == b""  # No body for 304 response
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_with_if_none_match_returns_200_when_etag_differs(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that /recommend returns 200 with full body when If-None-Match does not match current ETag."""
         # Arrange
@@ -1060,9 +1060,9 @@ class TestHTTPCaching:
         assert new_etag is not None
         assert new_etag != old_etag
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_with_multiple_etags_in_if_none_match(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that /recommend handles multiple ETags in If-None-Match header (comma-separated)."""
         # Arrange
@@ -1099,9 +1099,9 @@ class TestHTTPCaching:
         assert response2.status_code == 304
         assert response2.content == b""
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.AccommodationSearchService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.AccommodationSearchService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_with_if_none_match_wildcard(self, mock_recommender_class, mock_search_service_class, mock_config):
         """Test that /recommend returns 304 when If-None-Match is * (wildcard)."""
         # Arrange
@@ -1132,10 +1132,10 @@ class TestHTTPCaching:
 class TestSecurityHeaders:
     """Test suite for security headers."""
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.GeocodeService')
-    @patch('src.innsight.pipeline.IsochroneService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.GeocodeService')
+    @patch('innsight.pipeline.IsochroneService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_x_content_type_options_header(
         self,
         mock_recommender_class,
@@ -1167,10 +1167,10 @@ class TestSecurityHeaders:
         assert "x-content-type-options" in response.headers
         assert response.headers["x-content-type-options"] == "nosniff"
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.GeocodeService')
-    @patch('src.innsight.pipeline.IsochroneService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.GeocodeService')
+    @patch('innsight.pipeline.IsochroneService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_x_frame_options_header(
         self,
         mock_recommender_class,
@@ -1202,10 +1202,10 @@ class TestSecurityHeaders:
         assert "x-frame-options" in response.headers
         assert response.headers["x-frame-options"] == "DENY"
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.GeocodeService')
-    @patch('src.innsight.pipeline.IsochroneService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.GeocodeService')
+    @patch('innsight.pipeline.IsochroneService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_referrer_policy_header(
         self,
         mock_recommender_class,
@@ -1238,10 +1238,10 @@ class TestSecurityHeaders:
         assert response.headers["referrer-policy"] == "strict-origin-when-cross-origin"
 
     @patch.dict('os.environ', {'ENV': 'prod'})
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.GeocodeService')
-    @patch('src.innsight.pipeline.IsochroneService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.GeocodeService')
+    @patch('innsight.pipeline.IsochroneService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_hsts_header_in_production(
         self,
         mock_recommender_class,
@@ -1274,10 +1274,10 @@ class TestSecurityHeaders:
         assert response.headers["strict-transport-security"] == "max-age=63072000; includeSubDomains"
 
     @patch.dict('os.environ', {'ENV': 'local'})
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.GeocodeService')
-    @patch('src.innsight.pipeline.IsochroneService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.GeocodeService')
+    @patch('innsight.pipeline.IsochroneService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_excludes_hsts_header_in_local(
         self,
         mock_recommender_class,
@@ -1308,10 +1308,10 @@ class TestSecurityHeaders:
         # Check Strict-Transport-Security header does not exist in local environment
         assert "strict-transport-security" not in response.headers
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.GeocodeService')
-    @patch('src.innsight.pipeline.IsochroneService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.GeocodeService')
+    @patch('innsight.pipeline.IsochroneService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_excludes_hsts_header_when_env_not_set(
         self,
         mock_recommender_class,
@@ -1351,10 +1351,10 @@ class TestSecurityHeaders:
             if env_backup is not None:
                 os.environ['ENV'] = env_backup
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.GeocodeService')
-    @patch('src.innsight.pipeline.IsochroneService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.GeocodeService')
+    @patch('innsight.pipeline.IsochroneService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_csp_header(
         self,
         mock_recommender_class,
@@ -1386,10 +1386,10 @@ class TestSecurityHeaders:
         assert "content-security-policy" in response.headers
         assert response.headers["content-security-policy"] == "default-src 'none'; frame-ancestors 'none'"
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.GeocodeService')
-    @patch('src.innsight.pipeline.IsochroneService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.GeocodeService')
+    @patch('innsight.pipeline.IsochroneService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_permissions_policy_header(
         self,
         mock_recommender_class,
@@ -1422,10 +1422,10 @@ class TestSecurityHeaders:
         expected_policy = "geolocation=(), camera=(), microphone=(), payment=(), usb=(), magnetometer=(), gyroscope=(), accelerometer=(), ambient-light-sensor=()"
         assert response.headers["permissions-policy"] == expected_policy
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.GeocodeService')
-    @patch('src.innsight.pipeline.IsochroneService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.GeocodeService')
+    @patch('innsight.pipeline.IsochroneService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_coop_header(
         self,
         mock_recommender_class,
@@ -1457,10 +1457,10 @@ class TestSecurityHeaders:
         assert "cross-origin-opener-policy" in response.headers
         assert response.headers["cross-origin-opener-policy"] == "same-origin"
 
-    @patch('src.innsight.pipeline.AppConfig.from_env')
-    @patch('src.innsight.pipeline.GeocodeService')
-    @patch('src.innsight.pipeline.IsochroneService')
-    @patch('src.innsight.pipeline.RecommenderCore')
+    @patch('innsight.pipeline.AppConfig.from_env')
+    @patch('innsight.pipeline.GeocodeService')
+    @patch('innsight.pipeline.IsochroneService')
+    @patch('innsight.pipeline.RecommenderCore')
     def test_recommend_response_includes_corp_header(
         self,
         mock_recommender_class,
@@ -7,8 +7,8 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 import geopandas as gpd
 
-from src.innsight.app import create_app
-from src.innsight.config import AppConfig
+from innsight.app import create_app
+from innsight.config import AppConfig
 
 
 class TestCreateApp:
@@ -24,7 +24,7 @@ class TestCreateApp:
         app = create_app()
         assert app.title == "InnSight API"
     
-    @patch('src.innsight.pipeline.Recommender')
+    @patch('innsight.pipeline.Recommender')
     def test_consecutive_create_app_calls_same_title(self, mock_recommender_class):
         """Test consecutive calls to create_app return apps with same title."""
         # Given: Mock the Recommender to avoid external dependencies
@@ -41,9 +41,9 @@ class TestCreateApp:
     def test_consecutive_create_app_calls_external_dependencies(self, create_mock_config):
         """Test that consecutive create_app calls don't duplicate external connections."""
         # Given: Mock the external dependencies at the point where they're imported
-        with patch('src.innsight.pipeline.AppConfig.from_env') as mock_config_from_env, \
-             patch('src.innsight.pipeline.AccommodationSearchService') as mock_search_service_class, \
-             patch('src.innsight.pipeline.RecommenderCore') as mock_recommender_core_class:
+        with patch('innsight.pipeline.AppConfig.from_env') as mock_config_from_env, \
+             patch('innsight.pipeline.AccommodationSearchService') as mock_search_service_class, \
+             patch('innsight.pipeline.RecommenderCore') as mock_recommender_core_class:
             
             # Setup mocks
             mock_config = create_mock_config()
@@ -69,7 +69,7 @@ class TestCreateApp:
             # Verify that the dependencies are properly isolated
             assert app1 is not app2  # Different app instances
     
-    @patch('src.innsight.pipeline.Recommender')
+    @patch('innsight.pipeline.Recommender')
     def test_create_app_has_recommend_endpoint(self, mock_recommender_class):
         """Test that create_app creates app with /recommend endpoint."""
         # Given: Mock the Recommender
@@ -94,9 +94,9 @@ class TestCreateApp:
         duplicate external connections (verified through mocking).
         """
         # Given: Mock all external dependencies to verify they're not called
-        with patch('src.innsight.pipeline.AppConfig.from_env') as mock_config_from_env, \
-             patch('src.innsight.pipeline.AccommodationSearchService') as mock_service_class, \
-             patch('src.innsight.pipeline.RecommenderCore') as mock_recommender_class:
+        with patch('innsight.pipeline.AppConfig.from_env') as mock_config_from_env, \
+             patch('innsight.pipeline.AccommodationSearchService') as mock_service_class, \
+             patch('innsight.pipeline.RecommenderCore') as mock_recommender_class:
             
             # Setup minimal mocks to prevent actual external calls
             mock_recommender_class.return_value.recommend.return_value = gpd.GeoDataFrame()
@@ -204,7 +204,7 @@ class TestDependencyInjection:
             app.dependency_overrides[get_recommender_dependency] = fake_recommender
         else:
             # Fallback: patch the pipeline Recommender directly
-            with patch('src.innsight.pipeline.Recommender') as mock_recommender_class:
+            with patch('innsight.pipeline.Recommender') as mock_recommender_class:
                 mock_recommender_class.return_value = fake_recommender()
                 
                 # Test the endpoint
@@ -235,7 +235,7 @@ class TestDependencyInjection:
     def test_dependency_injection_with_patch_approach(self):
         """Alternative test using patch to verify DI concept works."""
         # Given: Create app with patched dependencies
-        with patch('src.innsight.pipeline.Recommender') as mock_recommender_class:
+        with patch('innsight.pipeline.Recommender') as mock_recommender_class:
             # Setup fake recommender
             fake_recommender = Mock()
             fake_response = {
@@ -288,7 +288,7 @@ class TestDependencyInjection:
 class TestAppModule:
     """Test suite for the app module level."""
     
-    @patch('src.innsight.app.create_app')
+    @patch('innsight.app.create_app')
     def test_module_level_app_instance(self, mock_create_app):
         """Test that module creates app instance at import time."""
         # Given: Mock create_app to return a fake app
@@ -298,7 +298,7 @@ class TestAppModule:
         
         # When: Import the app module (this happens at test setup)
         # The app instance should already be created
-        from src.innsight.app import app
+        from innsight.app import app
         
         # Then: The app should be the instance returned by create_app
         # Note: This test may be affected by import caching
@@ -308,7 +308,7 @@ class TestAppModule:
 class TestLoggingIntegration:
     """Test suite for logging configuration integration."""
 
-    @patch('src.innsight.app.configure_logging')
+    @patch('innsight.app.configure_logging')
     def test_create_app_configures_logging(self, mock_configure_logging):
         """Test that create_app calls configure_logging."""
         # When: Create app
@@ -328,16 +328,16 @@ class TestLoggingIntegration:
         log_output = StringIO()
 
         # When: Configure logging and create app
-        with patch('src.innsight.app.configure_logging') as mock_configure:
+        with patch('innsight.app.configure_logging') as mock_configure:
             # Configure the actual logging for testing
-            from src.innsight.logging_config import configure_logging
+            from innsight.logging_config import configure_logging
             configure_logging(app_config, stream=log_output)
 
             # Create app (which should use the configured logger)
             app = create_app()
 
             # Trigger a log message by accessing a logger
-            from src.innsight.logging_config import get_logger
+            from innsight.logging_config import get_logger
             logger = get_logger("test.app")
             logger.info("test message from app", key="value")
 
@@ -363,7 +363,7 @@ class TestLoggingIntegration:
         configure_logging(app_config, stream=log_output)
 
         # Create logger and log a message
-        from src.innsight.logging_config import get_logger
+        from innsight.logging_config import get_logger
         logger = get_logger("test.app")
         logger.info("test message from app")
 
@@ -389,12 +389,12 @@ class TestStructuredLogging:
         monkeypatch.setenv("LOG_FORMAT", "json")
         monkeypatch.setenv("LOG_LEVEL", "DEBUG")
 
-        from src.innsight.logging_config import configure_logging
+        from innsight.logging_config import configure_logging
 
         log_output = StringIO()
 
         # Mock the Recommender to avoid external dependencies
-        with patch('src.innsight.pipeline.Recommender') as mock_recommender_class:
+        with patch('innsight.pipeline.Recommender') as mock_recommender_class:
             mock_recommender = Mock()
             mock_recommender.run.return_value = {
                 "stats": {},
@@ -444,12 +444,12 @@ class TestStructuredLogging:
         monkeypatch.setenv("LOG_FORMAT", "json")
         monkeypatch.setenv("LOG_LEVEL", "DEBUG")
 
-        from src.innsight.logging_config import configure_logging
+        from innsight.logging_config import configure_logging
 
         log_output = StringIO()
 
         # Mock the Recommender
-        with patch('src.innsight.pipeline.Recommender') as mock_recommender_class:
+        with patch('innsight.pipeline.Recommender') as mock_recommender_class:
             mock_recommender = Mock()
             mock_recommender.run.return_value = {
                 "stats": {},
@@ -498,12 +498,12 @@ class TestStructuredLogging:
         monkeypatch.setenv("LOG_FORMAT", "json")
         monkeypatch.setenv("LOG_LEVEL", "DEBUG")
 
-        from src.innsight.logging_config import configure_logging
+        from innsight.logging_config import configure_logging
 
         log_output = StringIO()
 
         # Mock the Recommender
-        with patch('src.innsight.pipeline.Recommender') as mock_recommender_class:
+        with patch('innsight.pipeline.Recommender') as mock_recommender_class:
             mock_recommender = Mock()
             mock_recommender_class.return_value = mock_recommender
 
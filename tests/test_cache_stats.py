@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import Mock
 
-from src.innsight.health import get_cache_stats
+from innsight.health import get_cache_stats
 
 
 class TestGetCacheStats:
@@ -1,13 +1,9 @@
 """Tests for CLI integration."""
 
 import subprocess
-import sys
 import os
 import pytest
 
-# Add the src directory to the path so we can import innsight.cli
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 
 class TestCLIRegistration:
     """Test CLI command registration and help functionality."""
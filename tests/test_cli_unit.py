@@ -5,9 +5,6 @@ import os
 from unittest.mock import patch, Mock
 from io import StringIO
 
-# Add the src directory to the path so we can import innsight.cli
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from innsight.cli import main
 
 
@@ -260,7 +257,7 @@ class TestCLIErrorHandling:
     
     def test_generate_report_parse_query_exception(self):
         """Test _generate_report when parse_query raises exception (covers lines 63-65)."""
-        from src.innsight.cli import _generate_report
+        from innsight.cli import _generate_report
         import geopandas as gpd
         
         # Create test data
@@ -270,8 +267,8 @@ class TestCLIErrorHandling:
             'score': [85.0]
         })
         
-        with patch('src.innsight.cli.parse_query') as mock_parse_query, \
-             patch('src.innsight.cli.generate_markdown_report') as mock_generate_report:
+        with patch('innsight.cli.parse_query') as mock_parse_query, \
+             patch('innsight.cli.generate_markdown_report') as mock_generate_report:
             
             # Setup parse_query to raise an exception
             mock_parse_query.side_effect = Exception("Parse error")
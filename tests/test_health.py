@@ -1,7 +1,10 @@
 """Tests for external API health check functions."""
 
+import asyncio
+import time
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import httpx
 
 # Import functions that will be implemented
@@ -21,11 +24,10 @@ class TestNominatimHealthCheck:
         # This test will fail until we implement the function
         from innsight.health import check_nominatim_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
+        with patch('httpx.AsyncClient.head') as mock_head:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_response.elapsed.total_seconds.return_value = 0.5
-            mock_get.return_value = mock_response
+            mock_head.return_value = mock_response
 
             result = await check_nominatim_health("https://nominatim.example.com")
 
@@ -39,8 +41,8 @@ class TestNominatimHealthCheck:
         """Should return unhealthy status when API times out."""
         from innsight.health import check_nominatim_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.side_effect = httpx.TimeoutException("Request timeout")
+        with patch('httpx.AsyncClient.head') as mock_head:
+            mock_head.side_effect = httpx.TimeoutException("Request timeout")
 
             result = await check_nominatim_health("https://nominatim.example.com", timeout=3.0)
 
@@ -54,7 +56,7 @@ class TestNominatimHealthCheck:
         """Should return unhealthy status when API returns 4xx/5xx."""
         from innsight.health import check_nominatim_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
+        with patch('httpx.AsyncClient.head') as mock_head:
             mock_response = AsyncMock()
             mock_response.status_code = 503
 
@@ -70,7 +72,7 @@ class TestNominatimHealthCheck:
                 raise http_error
 
             mock_response.raise_for_status = raise_error
-            mock_get.return_value = mock_response
+            mock_head.return_value = mock_response
 
             result = await check_nominatim_health("https://nominatim.example.com")
 
@@ -83,8 +85,8 @@ class TestNominatimHealthCheck:
         """Should return unhealthy status when connection fails."""
         from innsight.health import check_nominatim_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.side_effect = httpx.ConnectError("Connection refused")
+        with patch('httpx.AsyncClient.head') as mock_head:
+            mock_head.side_effect = httpx.ConnectError("Connection refused")
 
             result = await check_nominatim_health("https://nominatim.example.com")
 
@@ -102,11 +104,10 @@ class TestORSHealthCheck:
         """Should return healthy status when API responds with 200."""
         from innsight.health import check_ors_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
+        with patch('httpx.AsyncClient.head') as mock_head:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_response.elapsed.total_seconds.return_value = 0.3
-            mock_get.return_value = mock_response
+            mock_head.return_value = mock_response
 
             result = await check_ors_health("https://ors.example.com")
 
@@ -120,8 +121,8 @@ class TestORSHealthCheck:
         """Should return unhealthy status when API times out."""
         from innsight.health import check_ors_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.side_effect = httpx.TimeoutException("Request timeout")
+        with patch('httpx.AsyncClient.head') as mock_head:
+            mock_head.side_effect = httpx.TimeoutException("Request timeout")
 
             result = await check_ors_health("https://ors.example.com", timeout=3.0)
 
@@ -135,7 +136,7 @@ class TestORSHealthCheck:
         """Should return unhealthy status when API returns 4xx/5xx."""
         from innsight.health import check_ors_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
+        with patch('httpx.AsyncClient.head') as mock_head:
             mock_response = AsyncMock()
             mock_response.status_code = 500
 
@@ -151,7 +152,7 @@ class TestORSHealthCheck:
                 raise http_error
 
             mock_response.raise_for_status = raise_error
-            mock_get.return_value = mock_response
+            mock_head.return_value = mock_response
 
             result = await check_ors_health("https://ors.example.com")
 
@@ -164,8 +165,8 @@ class TestORSHealthCheck:
         """Should return unhealthy status when connection fails."""
         from innsight.health import check_ors_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.side_effect = httpx.ConnectError("Connection refused")
+        with patch('httpx.AsyncClient.head') as mock_head:
+            mock_head.side_effect = httpx.ConnectError("Connection refused")
 
             result = await check_ors_health("https://ors.example.com")
 
@@ -182,11 +183,10 @@ class TestOverpassHealthCheck:
         """Should return healthy status when API responds with 200."""
         from innsight.health import check_overpass_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
+        with patch('httpx.AsyncClient.head') as mock_head:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_response.elapsed.total_seconds.return_value = 0.4
-            mock_get.return_value = mock_response
+            mock_head.return_value = mock_response
 
             result = await check_overpass_health("https://overpass.example.com")
 
@@ -200,8 +200,8 @@ class TestOverpassHealthCheck:
         """Should return unhealthy status when API times out."""
         from innsight.health import check_overpass_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.side_effect = httpx.TimeoutException("Request timeout")
+        with patch('httpx.AsyncClient.head') as mock_head:
+            mock_head.side_effect = httpx.TimeoutException("Request timeout")
 
             result = await check_overpass_health("https://overpass.example.com", timeout=3.0)
 
@@ -215,7 +215,7 @@ class TestOverpassHealthCheck:
         """Should return unhealthy status when API returns 4xx/5xx."""
         from innsight.health import check_overpass_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
+        with patch('httpx.AsyncClient.head') as mock_head:
             mock_response = AsyncMock()
             mock_response.status_code = 429
 
@@ -231,7 +231,7 @@ class TestOverpassHealthCheck:
                 raise http_error
 
             mock_response.raise_for_status = raise_error
-            mock_get.return_value = mock_response
+            mock_head.return_value = mock_response
 
             result = await check_overpass_health("https://overpass.example.com")
 
@@ -244,8 +244,8 @@ class TestOverpassHealthCheck:
         """Should return unhealthy status when connection fails."""
         from innsight.health import check_overpass_health
 
-        with patch('httpx.AsyncClient.get') as mock_get:
-            mock_get.side_effect = httpx.ConnectError("Connection refused")
+        with patch('httpx.AsyncClient.head') as mock_head:
+            mock_head.side_effect = httpx.ConnectError("Connection refused")
 
             result = await check_overpass_health("https://overpass.example.com")
 
@@ -253,3 +253,79 @@ class TestOverpassHealthCheck:
             assert result["healthy"] is False
             assert result["status_code"] is None
             assert result["error"] is not None
+
+
+class TestHealthProbe:
+    """Test how health checks probe the upstream services."""
+
+    async def test_probes_status_endpoint_with_head(self):
+        """Should send a HEAD request to the service's /status endpoint."""
+        from innsight.health import check_overpass_health
+
+        with patch('httpx.AsyncClient.head') as mock_head, \
+                patch('httpx.AsyncClient.get') as mock_get:
+            mock_head.return_value = Mock(status_code=200)
+
+            result = await check_overpass_health("https://overpass.example.com/api/")
+
+            assert result["healthy"] is True
+            mock_head.assert_called_once_with("https://overpass.example.com/api/status")
+            mock_get.assert_not_called()
+
+    async def test_falls_back_to_get_when_head_not_allowed(self):
+        """Should retry with GET when the server answers HEAD with 405."""
+        from innsight.health import check_ors_health
+
+        with patch('httpx.AsyncClient.head') as mock_head, \
+                patch('httpx.AsyncClient.get') as mock_get:
+            mock_head.return_value = Mock(status_code=405)
+            mock_get.return_value = Mock(status_code=200)
+
+            result = await check_ors_health("https://ors.example.com")
+
+            assert result["healthy"] is True
+            assert result["status_code"] == 200
+            mock_get.assert_called_once_with("https://ors.example.com")
+
+
+class TestCheckUntilFirstFailure:
+    """Test the short-circuiting concurrent readiness check."""
+
+    @staticmethod
+    async def _result(service, healthy, delay=0.0):
+        await asyncio.sleep(delay)
+        return {
+            "service": service,
+            "healthy": healthy,
+            "response_time_ms": delay * 1000,
+            "status_code": 200 if healthy else None,
+            "error": None if healthy else "Connection refused"
+        }
+
+    async def test_returns_all_results_when_healthy(self):
+        """Should wait for every check when all of them succeed."""
+        from innsight.health import check_until_first_failure
+
+        results = await check_until_first_failure({
+            "nominatim": self._result("nominatim", True),
+            "ors": self._result("ors", True, delay=0.01),
+        })
+
+        assert list(results) == ["nominatim", "ors"]
+        assert all(result["healthy"] for result in results.values())
+
+    async def test_skips_slow_checks_after_first_failure(self):
+        """Should return on the first failure and report pending checks as skipped."""
+        from innsight.health import check_until_first_failure
+
+        start = time.perf_counter()
+        results = await check_until_first_failure({
+            "nominatim": self._result("nominatim", False),
+            "ors": self._result("ors", True, delay=5.0),
+        })
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert results["nominatim"]["error"] == "Connection refused"
+        assert results["ors"]["healthy"] is None
+        assert "skipped" in results["ors"]["error"].lower()
@@ -1,35 +1,48 @@
 """Tests for health check API endpoints."""
 
 from fastapi.testclient import TestClient
-from datetime import datetime
+import asyncio
+import httpx
+import re
 import tomllib
 from unittest.mock import patch, AsyncMock
 
-from src.innsight.app import create_app
+import pytest
+
+from innsight.app import create_app
+
+
+# ISO 8601 UTC timestamp with optional fractional seconds, e.g. 2025-01-01T12:00:00.123Z
+_ISO8601 = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})$")
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Build the app once per xdist worker; the endpoints hold no per-test state.
+    The context manager runs lifespan once and keeps the transport open.
+    """
+    with TestClient(create_app()) as c:
+        yield c
 
 
 class TestHealthEndpoint:
     """Test suite for /api/health endpoint."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.app = create_app()
-        self.client = TestClient(self.app)
-
-    def test_health_endpoint_exists(self):
+    def test_health_endpoint_exists(self, client):
         """Should return 200 when accessing /api/health."""
-        response = self.client.get("/api/health")
+        response = client.get("/api/health")
         assert response.status_code == 200
 
-    def test_health_endpoint_returns_json(self):
+    def test_health_endpoint_returns_json(self, client):
         """Should return JSON content type."""
-        response = self.client.get("/api/health")
+        response = client.get("/api/health")
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/json"
 
-    def test_health_endpoint_has_required_fields(self):
+    def test_health_endpoint_has_required_fields(self, client):
         """Should return status, timestamp, and version fields."""
-        response = self.client.get("/api/health")
+        response = client.get("/api/health")
         assert response.status_code == 200
 
         data = response.json()
@@ -37,142 +50,116 @@ class TestHealthEndpoint:
         assert "ts" in data
         assert "version" in data
 
-    def test_health_endpoint_status_is_healthy(self):
+    def test_health_endpoint_status_is_healthy(self, client):
         """Should return status as 'healthy'."""
-        response = self.client.get("/api/health")
+        response = client.get("/api/health")
         assert response.status_code == 200
 
         data = response.json()
         assert data["status"] == "healthy"
 
-    def test_health_endpoint_timestamp_is_valid_iso8601(self):
+    def test_health_endpoint_timestamp_is_valid_iso8601(self, client):
         """Should return valid ISO 8601 timestamp."""
-        response = self.client.get("/api/health")
+        response = client.get("/api/health")
         assert response.status_code == 200
 
         data = response.json()
         timestamp = data["ts"]
 
-        # Try to parse the timestamp as ISO 8601
-        try:
-            datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        except ValueError:
-            assert False, f"Invalid ISO 8601 timestamp: {timestamp}"
+        assert _ISO8601.match(timestamp), f"Invalid ISO 8601 timestamp: {timestamp}"
 
-    def test_health_endpoint_version_matches_project(self):
+    def test_health_endpoint_version_matches_project(self, client):
         """Should return version matching pyproject.toml."""
         # Read version from pyproject.toml
         with open("pyproject.toml", "rb") as f:
             pyproject = tomllib.load(f)
             expected_version = pyproject["project"]["version"]
 
-        response = self.client.get("/api/health")
+        response = client.get("/api/health")
         assert response.status_code == 200
 
         data = response.json()
         assert data["version"] == expected_version
 
-    def test_health_endpoint_response_is_fast(self):
+    def test_health_endpoint_response_is_fast(self, client):
         """Should respond quickly (under 100ms)."""
         import time
 
         start = time.time()
-        response = self.client.get("/api/health")
+        response = client.get("/api/health")
         elapsed = (time.time() - start) * 1000  # Convert to ms
 
         assert response.status_code == 200
         assert elapsed < 100, f"Health check took {elapsed}ms, expected < 100ms"
 
 
+_HEALTHY_NOMINATIM = {
+    "service": "nominatim",
+    "healthy": True,
+    "response_time_ms": 123.0,
+    "status_code": 200,
+    "error": None
+}
+_HEALTHY_ORS = {
+    "service": "ors",
+    "healthy": True,
+    "response_time_ms": 456.0,
+    "status_code": 200,
+    "error": None
+}
+_HEALTHY_OVERPASS = {
+    "service": "overpass",
+    "healthy": True,
+    "response_time_ms": 789.0,
+    "status_code": 200,
+    "error": None
+}
+_UNHEALTHY_NOMINATIM = {
+    "service": "nominatim",
+    "healthy": False,
+    "response_time_ms": 3000.0,
+    "status_code": None,
+    "error": "Connection timeout"
+}
+
+
 class TestReadyEndpoint:
     """Test suite for /api/ready endpoint."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.app = create_app()
-        self.client = TestClient(self.app)
-
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_ready_all_services_healthy(self, mock_nominatim, mock_ors, mock_overpass):
+    @pytest.fixture(autouse=True)
+    def mocks(self):
+        """Patch all three service checks once per test, healthy by default."""
+        with patch('innsight.health.check_nominatim_health', new_callable=AsyncMock) as mock_nominatim, \
+                patch('innsight.health.check_ors_health', new_callable=AsyncMock) as mock_ors, \
+                patch('innsight.health.check_overpass_health', new_callable=AsyncMock) as mock_overpass:
+            mock_nominatim.return_value = _HEALTHY_NOMINATIM
+            mock_ors.return_value = _HEALTHY_ORS
+            mock_overpass.return_value = _HEALTHY_OVERPASS
+            yield mock_nominatim, mock_ors, mock_overpass
+
+    def test_ready_all_services_healthy(self, client):
         """Should return 200 and 'ready' status when all services are healthy."""
-        # Mock all services as healthy
-        mock_nominatim.return_value = {
-            "service": "nominatim",
-            "healthy": True,
-            "response_time_ms": 123.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_ors.return_value = {
-            "service": "ors",
-            "healthy": True,
-            "response_time_ms": 456.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_overpass.return_value = {
-            "service": "overpass",
-            "healthy": True,
-            "response_time_ms": 789.0,
-            "status_code": 200,
-            "error": None
-        }
-
-        response = self.client.get("/api/ready")
+        response = client.get("/api/ready")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "ready"
 
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_ready_nominatim_unhealthy(self, mock_nominatim, mock_ors, mock_overpass):
+    def test_ready_nominatim_unhealthy(self, mocks, client):
         """Should return 503 and 'not_ready' status when Nominatim is unhealthy."""
-        # Mock Nominatim as unhealthy
-        mock_nominatim.return_value = {
-            "service": "nominatim",
-            "healthy": False,
-            "response_time_ms": 3000.0,
-            "status_code": None,
-            "error": "Connection timeout"
-        }
-        mock_ors.return_value = {
-            "service": "ors",
-            "healthy": True,
-            "response_time_ms": 456.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_overpass.return_value = {
-            "service": "overpass",
-            "healthy": True,
-            "response_time_ms": 789.0,
-            "status_code": 200,
-            "error": None
-        }
+        mock_nominatim, _, _ = mocks
+        mock_nominatim.return_value = _UNHEALTHY_NOMINATIM
 
-        response = self.client.get("/api/ready")
+        response = client.get("/api/ready")
 
         assert response.status_code == 503
         data = response.json()
         assert data["status"] == "not_ready"
 
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_ready_multiple_services_unhealthy(self, mock_nominatim, mock_ors, mock_overpass):
+    def test_ready_multiple_services_unhealthy(self, mocks, client):
         """Should return 503 when multiple services are unhealthy."""
-        # Mock multiple services as unhealthy
-        mock_nominatim.return_value = {
-            "service": "nominatim",
-            "healthy": False,
-            "response_time_ms": 3000.0,
-            "status_code": None,
-            "error": "Connection timeout"
-        }
+        mock_nominatim, mock_ors, _ = mocks
+        mock_nominatim.return_value = _UNHEALTHY_NOMINATIM
         mock_ors.return_value = {
             "service": "ors",
             "healthy": False,
@@ -180,49 +167,16 @@ class TestReadyEndpoint:
             "status_code": 503,
             "error": "HTTP error: Service unavailable"
         }
-        mock_overpass.return_value = {
-            "service": "overpass",
-            "healthy": True,
-            "response_time_ms": 789.0,
-            "status_code": 200,
-            "error": None
-        }
 
-        response = self.client.get("/api/ready")
+        response = client.get("/api/ready")
 
         assert response.status_code == 503
         data = response.json()
         assert data["status"] == "not_ready"
 
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_ready_has_required_fields(self, mock_nominatim, mock_ors, mock_overpass):
+    def test_ready_has_required_fields(self, client):
         """Should return all required fields in response."""
-        # Mock all services as healthy
-        mock_nominatim.return_value = {
-            "service": "nominatim",
-            "healthy": True,
-            "response_time_ms": 123.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_ors.return_value = {
-            "service": "ors",
-            "healthy": True,
-            "response_time_ms": 456.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_overpass.return_value = {
-            "service": "overpass",
-            "healthy": True,
-            "response_time_ms": 789.0,
-            "status_code": 200,
-            "error": None
-        }
-
-        response = self.client.get("/api/ready")
+        response = client.get("/api/ready")
         data = response.json()
 
         # Check required top-level fields
@@ -230,35 +184,9 @@ class TestReadyEndpoint:
         assert "ts" in data
         assert "services" in data
 
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_ready_includes_all_services(self, mock_nominatim, mock_ors, mock_overpass):
+    def test_ready_includes_all_services(self, client):
         """Should include all three external services in response."""
-        # Mock all services as healthy
-        mock_nominatim.return_value = {
-            "service": "nominatim",
-            "healthy": True,
-            "response_time_ms": 123.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_ors.return_value = {
-            "service": "ors",
-            "healthy": True,
-            "response_time_ms": 456.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_overpass.return_value = {
-            "service": "overpass",
-            "healthy": True,
-            "response_time_ms": 789.0,
-            "status_code": 200,
-            "error": None
-        }
-
-        response = self.client.get("/api/ready")
+        response = client.get("/api/ready")
         data = response.json()
 
         services = data["services"]
@@ -266,35 +194,9 @@ class TestReadyEndpoint:
         assert "ors" in services
         assert "overpass" in services
 
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_ready_service_details_when_healthy(self, mock_nominatim, mock_ors, mock_overpass):
+    def test_ready_service_details_when_healthy(self, client):
         """Should include service details with healthy status."""
-        # Mock all services as healthy
-        mock_nominatim.return_value = {
-            "service": "nominatim",
-            "healthy": True,
-            "response_time_ms": 123.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_ors.return_value = {
-            "service": "ors",
-            "healthy": True,
-            "response_time_ms": 456.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_overpass.return_value = {
-            "service": "overpass",
-            "healthy": True,
-            "response_time_ms": 789.0,
-            "status_code": 200,
-            "error": None
-        }
-
-        response = self.client.get("/api/ready")
+        response = client.get("/api/ready")
         data = response.json()
 
         services = data["services"]
@@ -311,35 +213,12 @@ class TestReadyEndpoint:
         assert services["overpass"]["healthy"] is True
         assert "response_time_ms" in services["overpass"]
 
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_ready_service_details_when_unhealthy(self, mock_nominatim, mock_ors, mock_overpass):
+    def test_ready_service_details_when_unhealthy(self, mocks, client):
         """Should include error details when service is unhealthy."""
-        # Mock Nominatim as unhealthy with error
-        mock_nominatim.return_value = {
-            "service": "nominatim",
-            "healthy": False,
-            "response_time_ms": 3000.0,
-            "status_code": None,
-            "error": "Connection timeout"
-        }
-        mock_ors.return_value = {
-            "service": "ors",
-            "healthy": True,
-            "response_time_ms": 456.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_overpass.return_value = {
-            "service": "overpass",
-            "healthy": True,
-            "response_time_ms": 789.0,
-            "status_code": 200,
-            "error": None
-        }
+        mock_nominatim, _, _ = mocks
+        mock_nominatim.return_value = _UNHEALTHY_NOMINATIM
 
-        response = self.client.get("/api/ready")
+        response = client.get("/api/ready")
         data = response.json()
 
         services = data["services"]
@@ -349,59 +228,61 @@ class TestReadyEndpoint:
         assert "error" in services["nominatim"]
         assert services["nominatim"]["error"] == "Connection timeout"
 
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_ready_timestamp_is_valid_iso8601(self, mock_nominatim, mock_ors, mock_overpass):
-        """Should return valid ISO 8601 timestamp."""
-        # Mock all services as healthy
-        mock_nominatim.return_value = {
-            "service": "nominatim",
-            "healthy": True,
-            "response_time_ms": 123.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_ors.return_value = {
-            "service": "ors",
-            "healthy": True,
-            "response_time_ms": 456.0,
-            "status_code": 200,
-            "error": None
-        }
-        mock_overpass.return_value = {
-            "service": "overpass",
-            "healthy": True,
-            "response_time_ms": 789.0,
-            "status_code": 200,
-            "error": None
-        }
+    def test_ready_reports_skipped_services_as_unknown(self, mocks, client):
+        """Should report checks cut short by an earlier failure as not probed, not as down."""
+        mock_nominatim, mock_ors, _ = mocks
+        mock_nominatim.return_value = _UNHEALTHY_NOMINATIM
+
+        async def slow_check(*args, **kwargs):
+            await asyncio.sleep(5.0)
+            return _HEALTHY_ORS
+
+        mock_ors.side_effect = slow_check
 
-        response = self.client.get("/api/ready")
+        response = client.get("/api/ready")
+
+        assert response.status_code == 503
+        services = response.json()["services"]
+        assert services["nominatim"]["healthy"] is False
+        assert services["ors"]["healthy"] is None
+        assert "skipped" in services["ors"]["error"].lower()
+
+    def test_ready_timestamp_is_valid_iso8601(self, client):
+        """Should return valid ISO 8601 timestamp."""
+        response = client.get("/api/ready")
         data = response.json()
 
         timestamp = data["ts"]
+        assert _ISO8601.match(timestamp), f"Invalid ISO 8601 timestamp: {timestamp}"
+
+    async def test_concurrent_ready_requests_share_one_check(self, mocks):
+        """Should probe upstream services once for requests that arrive together."""
+        mock_nominatim, mock_ors, mock_overpass = mocks
 
-        # Try to parse the timestamp as ISO 8601
-        try:
-            datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        except ValueError:
-            assert False, f"Invalid ISO 8601 timestamp: {timestamp}"
+        async def slow_healthy_nominatim(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return _HEALTHY_NOMINATIM
+
+        mock_nominatim.side_effect = slow_healthy_nominatim
+
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            responses = await asyncio.gather(*(async_client.get("/ready") for _ in range(3)))
+
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        assert mock_nominatim.call_count == 1
+        assert mock_ors.call_count == 1
+        assert mock_overpass.call_count == 1
 
 
 class TestStatusEndpoint:
     """Test suite for /api/status endpoint."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.app = create_app()
-        self.client = TestClient(self.app)
-
-    @patch('src.innsight.health.get_cache_stats')
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_status_endpoint_exists(self, mock_nominatim, mock_ors, mock_overpass, mock_cache):
+    @patch('innsight.health.get_cache_stats')
+    @patch('innsight.health.check_overpass_health')
+    @patch('innsight.health.check_ors_health')
+    @patch('innsight.health.check_nominatim_health')
+    def test_status_endpoint_exists(self, mock_nominatim, mock_ors, mock_overpass, mock_cache, client):
         """Should return 200 when accessing /api/status."""
         # Mock all services as healthy
         mock_nominatim.return_value = {
@@ -435,14 +316,14 @@ class TestStatusEndpoint:
             "cache_max_size": 20
         }
 
-        response = self.client.get("/api/status")
+        response = client.get("/api/status")
         assert response.status_code == 200
 
-    @patch('src.innsight.health.get_cache_stats')
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_status_endpoint_returns_json(self, mock_nominatim, mock_ors, mock_overpass, mock_cache):
+    @patch('innsight.health.get_cache_stats')
+    @patch('innsight.health.check_overpass_health')
+    @patch('innsight.health.check_ors_health')
+    @patch('innsight.health.check_nominatim_health')
+    def test_status_endpoint_returns_json(self, mock_nominatim, mock_ors, mock_overpass, mock_cache, client):
         """Should return JSON content type."""
         # Mock all services as healthy
         mock_nominatim.return_value = {"service": "nominatim", "healthy": True, "response_time_ms": 123.0, "status_code": 200, "error": None}
@@ -450,22 +331,22 @@ class TestStatusEndpoint:
         mock_overpass.return_value = {"service": "overpass", "healthy": True, "response_time_ms": 789.0, "status_code": 200, "error": None}
         mock_cache.return_value = {"cache_hits": 150, "cache_misses": 50, "cache_hit_rate": 0.75, "total_requests": 200, "parsing_failures": 5, "cache_size": 15, "cache_max_size": 20}
 
-        response = self.client.get("/api/status")
+        response = client.get("/api/status")
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/json"
 
-    @patch('src.innsight.health.get_cache_stats')
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_status_endpoint_has_required_fields(self, mock_nominatim, mock_ors, mock_overpass, mock_cache):
+    @patch('innsight.health.get_cache_stats')
+    @patch('innsight.health.check_overpass_health')
+    @patch('innsight.health.check_ors_health')
+    @patch('innsight.health.check_nominatim_health')
+    def test_status_endpoint_has_required_fields(self, mock_nominatim, mock_ors, mock_overpass, mock_cache, client):
         """Should return all required top-level fields."""
         mock_nominatim.return_value = {"service": "nominatim", "healthy": True, "response_time_ms": 123.0, "status_code": 200, "error": None}
         mock_ors.return_value = {"service": "ors", "healthy": True, "response_time_ms": 456.0, "status_code": 200, "error": None}
         mock_overpass.return_value = {"service": "overpass", "healthy": True, "response_time_ms": 789.0, "status_code": 200, "error": None}
         mock_cache.return_value = {"cache_hits": 150, "cache_misses": 50, "cache_hit_rate": 0.75, "total_requests": 200, "parsing_failures": 5, "cache_size": 15, "cache_max_size": 20}
 
-        response = self.client.get("/api/status")
+        response = client.get("/api/status")
         data = response.json()
 
         # Check required top-level fields
@@ -477,18 +358,18 @@ class TestStatusEndpoint:
         assert "cache" in data
         assert "parsing_failures" in data
 
-    @patch('src.innsight.health.get_cache_stats')
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_status_endpoint_includes_all_external_services(self, mock_nominatim, mock_ors, mock_overpass, mock_cache):
+    @patch('innsight.health.get_cache_stats')
+    @patch('innsight.health.check_overpass_health')
+    @patch('innsight.health.check_ors_health')
+    @patch('innsight.health.check_nominatim_health')
+    def test_status_endpoint_includes_all_external_services(self, mock_nominatim, mock_ors, mock_overpass, mock_cache, client):
         """Should include all three external services."""
         mock_nominatim.return_value = {"service": "nominatim", "healthy": True, "response_time_ms": 123.0, "status_code": 200, "error": None}
         mock_ors.return_value = {"service": "ors", "healthy": True, "response_time_ms": 456.0, "status_code": 200, "error": None}
         mock_overpass.return_value = {"service": "overpass", "healthy": True, "response_time_ms": 789.0, "status_code": 200, "error": None}
         mock_cache.return_value = {"cache_hits": 150, "cache_misses": 50, "cache_hit_rate": 0.75, "total_requests": 200, "parsing_failures": 5, "cache_size": 15, "cache_max_size": 20}
 
-        response = self.client.get("/api/status")
+        response = client.get("/api/status")
         data = response.json()
 
         services = data["external_services"]
@@ -496,11 +377,11 @@ class TestStatusEndpoint:
         assert "ors" in services
         assert "overpass" in services
 
-    @patch('src.innsight.health.get_cache_stats')
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_status_endpoint_includes_cache_statistics(self, mock_nominatim, mock_ors, mock_overpass, mock_cache):
+    @patch('innsight.health.get_cache_stats')
+    @patch('innsight.health.check_overpass_health')
+    @patch('innsight.health.check_ors_health')
+    @patch('innsight.health.check_nominatim_health')
+    def test_status_endpoint_includes_cache_statistics(self, mock_nominatim, mock_ors, mock_overpass, mock_cache, client):
         """Should include cache statistics."""
         mock_nominatim.return_value = {"service": "nominatim", "healthy": True, "response_time_ms": 123.0, "status_code": 200, "error": None}
         mock_ors.return_value = {"service": "ors", "healthy": True, "response_time_ms": 456.0, "status_code": 200, "error": None}
@@ -515,7 +396,7 @@ class TestStatusEndpoint:
             "cache_max_size": 20
         }
 
-        response = self.client.get("/api/status")
+        response = client.get("/api/status")
         data = response.json()
 
         cache = data["cache"]
@@ -527,55 +408,51 @@ class TestStatusEndpoint:
         assert cache["max_size"] == 20
         assert data["parsing_failures"] == 5
 
-    @patch('src.innsight.health.get_cache_stats')
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_status_endpoint_timestamp_is_valid_iso8601(self, mock_nominatim, mock_ors, mock_overpass, mock_cache):
+    @patch('innsight.health.get_cache_stats')
+    @patch('innsight.health.check_overpass_health')
+    @patch('innsight.health.check_ors_health')
+    @patch('innsight.health.check_nominatim_health')
+    def test_status_endpoint_timestamp_is_valid_iso8601(self, mock_nominatim, mock_ors, mock_overpass, mock_cache, client):
         """Should return valid ISO 8601 timestamp."""
         mock_nominatim.return_value = {"service": "nominatim", "healthy": True, "response_time_ms": 123.0, "status_code": 200, "error": None}
         mock_ors.return_value = {"service": "ors", "healthy": True, "response_time_ms": 456.0, "status_code": 200, "error": None}
         mock_overpass.return_value = {"service": "overpass", "healthy": True, "response_time_ms": 789.0, "status_code": 200, "error": None}
         mock_cache.return_value = {"cache_hits": 150, "cache_misses": 50, "cache_hit_rate": 0.75, "total_requests": 200, "parsing_failures": 5, "cache_size": 15, "cache_max_size": 20}
 
-        response = self.client.get("/api/status")
+        response = client.get("/api/status")
         data = response.json()
 
         timestamp = data["ts"]
-        # Try to parse the timestamp as ISO 8601
-        try:
-            datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        except ValueError:
-            assert False, f"Invalid ISO 8601 timestamp: {timestamp}"
-
-    @patch('src.innsight.health.get_cache_stats')
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_status_endpoint_operational_when_all_services_healthy(self, mock_nominatim, mock_ors, mock_overpass, mock_cache):
+        assert _ISO8601.match(timestamp), f"Invalid ISO 8601 timestamp: {timestamp}"
+
+    @patch('innsight.health.get_cache_stats')
+    @patch('innsight.health.check_overpass_health')
+    @patch('innsight.health.check_ors_health')
+    @patch('innsight.health.check_nominatim_health')
+    def test_status_endpoint_operational_when_all_services_healthy(self, mock_nominatim, mock_ors, mock_overpass, mock_cache, client):
         """Should return 'operational' status when all services are healthy."""
         mock_nominatim.return_value = {"service": "nominatim", "healthy": True, "response_time_ms": 123.0, "status_code": 200, "error": None}
         mock_ors.return_value = {"service": "ors", "healthy": True, "response_time_ms": 456.0, "status_code": 200, "error": None}
         mock_overpass.return_value = {"service": "overpass", "healthy": True, "response_time_ms": 789.0, "status_code": 200, "error": None}
         mock_cache.return_value = {"cache_hits": 150, "cache_misses": 50, "cache_hit_rate": 0.75, "total_requests": 200, "parsing_failures": 5, "cache_size": 15, "cache_max_size": 20}
 
-        response = self.client.get("/api/status")
+        response = client.get("/api/status")
         data = response.json()
 
         assert data["status"] == "operational"
 
-    @patch('src.innsight.health.get_cache_stats')
-    @patch('src.innsight.health.check_overpass_health')
-    @patch('src.innsight.health.check_ors_health')
-    @patch('src.innsight.health.check_nominatim_health')
-    def test_status_endpoint_uptime_is_positive(self, mock_nominatim, mock_ors, mock_overpass, mock_cache):
+    @patch('innsight.health.get_cache_stats')
+    @patch('innsight.health.check_overpass_health')
+    @patch('innsight.health.check_ors_health')
+    @patch('innsight.health.check_nominatim_health')
+    def test_status_endpoint_uptime_is_positive(self, mock_nominatim, mock_ors, mock_overpass, mock_cache, client):
         """Should return positive uptime_seconds."""
         mock_nominatim.return_value = {"service": "nominatim", "healthy": True, "response_time_ms": 123.0, "status_code": 200, "error": None}
         mock_ors.return_value = {"service": "ors", "healthy": True, "response_time_ms": 456.0, "status_code": 200, "error": None}
         mock_overpass.return_value = {"service": "overpass", "healthy": True, "response_time_ms": 789.0, "status_code": 200, "error": None}
         mock_cache.return_value = {"cache_hits": 150, "cache_misses": 50, "cache_hit_rate": 0.75, "total_requests": 200, "parsing_failures": 5, "cache_size": 15, "cache_max_size": 20}
 
-        response = self.client.get("/api/status")
+        response = client.get("/api/status")
         data = response.json()
 
         assert isinstance(data["uptime_seconds"], (int, float))
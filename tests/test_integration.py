@@ -4,13 +4,135 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 import geopandas as gpd
-from shapely.geometry import Polygon
+import numpy as np
+import shapely
 import os
+from dataclasses import dataclass, field
+from types import SimpleNamespace
 
-from src.innsight.services import AccommodationSearchService
-from src.innsight.config import AppConfig
-from src.innsight.cli import main
-from src.innsight.exceptions import ParseError, GeocodeError, ConfigurationError
+from innsight.services import AccommodationSearchService
+from innsight.config import AppConfig
+from innsight.cli import main
+from innsight.exceptions import ParseError, GeocodeError, ConfigurationError
+
+# External calls made by the search service's sub-services
+_SERVICE_DEPENDENCIES = (
+    'innsight.services.query_service.parse_query',
+    'innsight.services.query_service.extract_location_from_query',
+    'innsight.services.geocode_service.NominatimClient',
+    'innsight.services.accommodation_service.fetch_overpass',
+    'innsight.services.isochrone_service.get_isochrones_by_minutes',
+    'innsight.services.tier_service.assign_tier',
+)
+
+# 15/30/60-minute isochrones around the Okinawa test location, built once
+# from a single ragged coordinate array (rings are closed automatically)
+_ISO_POLYS = shapely.from_ragged_array(
+    shapely.GeometryType.POLYGON,
+    coords=np.array([
+        (127.75, 26.25), (127.85, 26.25), (127.85, 26.35), (127.75, 26.35),
+        (127.7, 26.2), (127.9, 26.2), (127.9, 26.4), (127.7, 26.4),
+        (127.6, 26.1), (128.0, 26.1), (128.0, 26.5), (127.6, 26.5),
+    ], dtype=np.float64),
+    offsets=(np.array([0, 4, 8, 12]), np.array([0, 1, 2, 3])),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _StubConfig:
+    """Plain stand-in for the AppConfig fields the search service reads."""
+    api_endpoint: str = "http://test-nominatim.example.com"
+    nominatim_user_agent: str = "test-agent"
+    nominatim_timeout: int = 10
+    rating_weights: dict = field(default_factory=lambda: {
+        'tier': 4.0,
+        'rating': 2.0,
+        'parking': 1.0,
+        'wheelchair': 1.0,
+        'kids': 1.0,
+        'pet': 1.0
+    })
+    default_isochrone_intervals: list = field(default_factory=lambda: [15, 30, 60])
+    max_score: int = 100
+    validation_sample_size: int = 10
+    validation_large_dataset_threshold: int = 100
+    default_top_n: int = 10
+    default_missing_score: int = 50
+    max_tier_value: int = 3
+    max_rating_value: int = 5
+
+
+class _Rec:
+    """Callable stub that records its calls and returns a fixed value."""
+
+    def __init__(self, rv):
+        self.rv = rv
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.rv
+
+
+# Overpass elements for the Okinawa search: a hotel node and a guest-house way
+_OVERPASS_OKINAWA = [
+    {
+        "id": 123456,
+        "type": "node",
+        "lat": 26.3,
+        "lon": 127.8,
+        "tags": {"tourism": "hotel", "name": "沖繩海洋酒店"}
+    },
+    {
+        "id": 789012,
+        "type": "way",
+        "center": {"lat": 26.4, "lon": 127.9},
+        "tags": {"tourism": "guest_house", "name": "美ら海民宿"}
+    }
+]
+
+_OVERPASS_ONE_HOTEL = [
+    {
+        "id": 123,
+        "type": "node",
+        "lat": 26.1,
+        "lon": 127.1,
+        "tags": {"tourism": "hotel", "name": "Test Hotel"}
+    }
+]
+
+
+# Accommodations returned by the stubbed fetch; only read by the coordination test
+_TEST_DF = pd.DataFrame({
+    'osmid': np.array([1, 2], dtype=np.int64),
+    'name': np.array(['Hotel A', 'Hotel B'], dtype=object)
+})
+
+
+# Tier-assignment output for the two Okinawa accommodations
+_GDF_TIERED = gpd.GeoDataFrame({
+    'osmid': [123456, 789012],
+    'name': ['沖繩海洋酒店', '美ら海民宿'],
+    'tier': [1, 2]
+})
+
+# Scored recommender output, read-only in the CLI test
+_GDF_RECOMMENDED = gpd.GeoDataFrame({
+    'name': ['Test Hotel', 'Test Guesthouse'],
+    'tier': [1, 2],
+    'score': [80.0, 75.0]  # Add scores to avoid len() error
+})
+
+
+@pytest.fixture
+def svc_mocks(monkeypatch):
+    """Replace every external dependency of the search service with a Mock."""
+    mocks = {}
+    for target in _SERVICE_DEPENDENCIES:
+        name = target.rsplit('.', 1)[1]
+        mocks[name] = Mock()
+        monkeypatch.setattr(target, mocks[name])
+    return SimpleNamespace(**mocks)
 
 
 class TestEndToEndIntegration:
@@ -18,113 +140,65 @@ class TestEndToEndIntegration:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.mock_config = Mock(spec=AppConfig)
-        self.mock_config.api_endpoint = "http://test-nominatim.example.com"
-        self.mock_config.nominatim_user_agent = "test-agent"
-        self.mock_config.nominatim_timeout = 10
-        self.mock_config.rating_weights = {
-            'tier': 4.0,
-            'rating': 2.0,
-            'parking': 1.0,
-            'wheelchair': 1.0,
-            'kids': 1.0,
-            'pet': 1.0
-        }
-        # Add new configuration properties
-        self.mock_config.default_isochrone_intervals = [15, 30, 60]
-        self.mock_config.max_score = 100
-        self.mock_config.validation_sample_size = 10
-        self.mock_config.validation_large_dataset_threshold = 100
-        self.mock_config.default_top_n = 10
-        self.mock_config.default_missing_score = 50
-        self.mock_config.max_tier_value = 3
-        self.mock_config.max_rating_value = 5
-
-    def test_complete_accommodation_search_flow(self):
-        """Test complete flow from query to results."""
+        self.mock_config = _StubConfig()
+
+    @pytest.mark.parametrize("overpass, isochrones, expected_rows", [
+        pytest.param(_OVERPASS_OKINAWA, _ISO_POLYS,
+                     # Results are sorted by score descending; tier 2 scores higher
+                     [('美ら海民宿', 2), ('沖繩海洋酒店', 1)], id="complete-flow"),
+        pytest.param([], _ISO_POLYS, [], id="no-accommodations"),
+        pytest.param(_OVERPASS_ONE_HOTEL, Exception("Isochrone service unavailable"), [],
+                     id="isochrone-failure"),
+    ])
+    def test_accommodation_search_flow(self, svc_mocks, overpass, isochrones, expected_rows):
+        """Test the flow from query to results, including empty and isochrone-failure branches."""
         query = "我想去沖繩的美ら海水族館住兩天"
         
-        # Mock all external API calls
-        with patch('src.innsight.services.query_service.parse_query') as mock_parse, \
-             patch('src.innsight.services.query_service.extract_location_from_query') as mock_extract_location, \
-             patch('src.innsight.services.geocode_service.NominatimClient') as mock_nominatim_class, \
-             patch('src.innsight.services.accommodation_service.fetch_overpass') as mock_overpass, \
-             patch('src.innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_isochrones, \
-             patch('src.innsight.services.tier_service.assign_tier') as mock_assign_tier:
-            
-            # Setup mock returns
-            mock_parse.return_value = {'poi': 'aquarium', 'days': '2'}
-            mock_extract_location.return_value = 'Okinawa'
-            
-            mock_nominatim_client = Mock()
-            mock_nominatim_client.geocode.return_value = [(26.2042, 127.6792)]
-            mock_nominatim_class.return_value = mock_nominatim_client
-            
-            mock_overpass.return_value = [
-                {
-                    "id": 123456,
-                    "type": "node",
-                    "lat": 26.3,
-                    "lon": 127.8,
-                    "tags": {"tourism": "hotel", "name": "沖繩海洋酒店"}
-                },
-                {
-                    "id": 789012,
-                    "type": "way",
-                    "center": {"lat": 26.4, "lon": 127.9},
-                    "tags": {"tourism": "guest_house", "name": "美ら海民宿"}
-                }
-            ]
-            
-            mock_isochrones.return_value = [
-                {'geometry': Polygon([(127.75, 26.25), (127.85, 26.25), (127.85, 26.35), (127.75, 26.35)])},
-                {'geometry': Polygon([(127.7, 26.2), (127.9, 26.2), (127.9, 26.4), (127.7, 26.4)])},
-                {'geometry': Polygon([(127.6, 26.1), (128.0, 26.1), (128.0, 26.5), (127.6, 26.5)])}
-            ]
-            
-            # Mock tier assignment
-            mock_gdf = gpd.GeoDataFrame({
-                'osmid': [123456, 789012],
-                'name': ['沖繩海洋酒店', '美ら海民宿'],
-                'tier': [1, 2]
-            })
-            mock_assign_tier.return_value = mock_gdf
-            
-            # Execute the search
-            service = AccommodationSearchService(self.mock_config)
-            result = service.search_accommodations(query)
-            
-            # Verify results
-            assert isinstance(result, gpd.GeoDataFrame)
-            assert len(result) == 2
-            # Results should be sorted by score descending
-            # The service calculates scores and sorts automatically
-            assert result.iloc[0]['name'] == '美ら海民宿'  # tier 2 has higher score
-            assert result.iloc[0]['tier'] == 2
-            assert result.iloc[1]['name'] == '沖繩海洋酒店'  # tier 1 has lower score
-            assert result.iloc[1]['tier'] == 1
-            
-            # Verify all services were called with correct parameters
-            mock_parse.assert_called_once_with(query)
-            mock_extract_location.assert_called_once()
-            mock_nominatim_client.geocode.assert_called_once_with('Okinawa')
-            mock_overpass.assert_called_once()
-            mock_isochrones.assert_called_once_with((127.6792, 26.2042), [15, 30, 60])
-            mock_assign_tier.assert_called_once()
+        # Setup mock returns
+        svc_mocks.parse_query.return_value = {'poi': 'aquarium', 'days': '2'}
+        svc_mocks.extract_location_from_query.return_value = 'Okinawa'
+        
+        mock_nominatim_client = svc_mocks.NominatimClient.return_value
+        mock_nominatim_client.geocode.return_value = [(26.2042, 127.6792)]
+        
+        svc_mocks.fetch_overpass.return_value = overpass
+        
+        if isinstance(isochrones, Exception):
+            svc_mocks.get_isochrones_by_minutes.side_effect = isochrones
+        else:
+            svc_mocks.get_isochrones_by_minutes.return_value = [{'geometry': g} for g in isochrones]
+        
+        # Mock tier assignment (the service adds a score column, so hand it a copy)
+        svc_mocks.assign_tier.return_value = _GDF_TIERED.copy(deep=False)
+        
+        # Execute the search
+        service = AccommodationSearchService(self.mock_config)
+        result = service.search_accommodations(query)
+        
+        # Verify results; empty results come back as an empty GeoDataFrame
+        assert isinstance(result, gpd.GeoDataFrame)
+        rows = [] if result.empty else list(result[['name', 'tier']].itertuples(index=False, name=None))
+        assert rows == expected_rows
+        
+        # Verify each service was reached, with the correct parameters, only when expected
+        svc_mocks.parse_query.assert_called_once_with(query)
+        svc_mocks.extract_location_from_query.assert_called_once()
+        mock_nominatim_client.geocode.assert_called_once_with('Okinawa')
+        svc_mocks.fetch_overpass.assert_called_once()
+        if overpass:
+            svc_mocks.get_isochrones_by_minutes.assert_called_once_with((127.6792, 26.2042), [15, 30, 60])
+        else:
+            svc_mocks.get_isochrones_by_minutes.assert_not_called()
+        assert svc_mocks.assign_tier.called == bool(expected_rows)
 
     def test_cli_integration_with_mocked_services(self):
         """Test CLI integration with mocked services."""
         # Mock the recommender creation function
-        with patch('src.innsight.cli._create_recommender') as mock_create_recommender:
+        with patch('innsight.cli._create_recommender') as mock_create_recommender:
             
             # Setup recommender mock
             mock_recommender = Mock()
-            mock_gdf = gpd.GeoDataFrame({
-                'name': ['Test Hotel', 'Test Guesthouse'],
-                'tier': [1, 2],
-                'score': [80.0, 75.0]  # Add scores to avoid len() error
-            })
-            mock_recommender.recommend.return_value = mock_gdf
+            mock_recommender.recommend.return_value = _GDF_RECOMMENDED
             mock_create_recommender.return_value = mock_recommender
             
             # Test CLI call
@@ -134,93 +208,27 @@ class TestEndToEndIntegration:
             mock_create_recommender.assert_called_once()
             mock_recommender.recommend.assert_called_once_with('我想去東京住一天')
 
-    def test_error_propagation_through_layers(self):
+    def test_error_propagation_through_layers(self, svc_mocks):
         """Test that errors propagate correctly through service layers."""
         # Test ParseError propagation
-        with patch('src.innsight.services.query_service.parse_query') as mock_parse, \
-             patch('src.innsight.services.query_service.extract_location_from_query') as mock_extract:
-            
-            mock_parse.return_value = {'poi': ''}
-            mock_extract.return_value = ''
-            
-            service = AccommodationSearchService(self.mock_config)
-            
-            with pytest.raises(ParseError, match="無法判斷地名或主行程"):
-                service.search_accommodations("想住兩天")
+        svc_mocks.parse_query.return_value = {'poi': ''}
+        svc_mocks.extract_location_from_query.return_value = ''
+        
+        service = AccommodationSearchService(self.mock_config)
+        
+        with pytest.raises(ParseError, match="無法判斷地名或主行程"):
+            service.search_accommodations("想住兩天")
 
-    def test_geocoding_error_propagation(self):
+    def test_geocoding_error_propagation(self, svc_mocks):
         """Test geocoding error propagation."""
-        with patch('src.innsight.services.query_service.parse_query') as mock_parse, \
-             patch('src.innsight.services.query_service.extract_location_from_query') as mock_extract, \
-             patch('src.innsight.services.geocode_service.NominatimClient') as mock_nominatim_class:
-            
-            mock_parse.return_value = {'poi': 'aquarium'}
-            mock_extract.return_value = 'InvalidPlace'
-            
-            mock_nominatim_client = Mock()
-            mock_nominatim_client.geocode.return_value = []  # No results
-            mock_nominatim_class.return_value = mock_nominatim_client
-            
-            service = AccommodationSearchService(self.mock_config)
-            
-            with pytest.raises(GeocodeError, match="找不到地點"):
-                service.search_accommodations("我想去不存在的地方")
-
-    def test_empty_accommodation_results(self):
-        """Test handling of empty accommodation results."""
-        with patch('src.innsight.services.query_service.parse_query') as mock_parse, \
-             patch('src.innsight.services.query_service.extract_location_from_query') as mock_extract, \
-             patch('src.innsight.services.geocode_service.NominatimClient') as mock_nominatim_class, \
-             patch('src.innsight.services.accommodation_service.fetch_overpass') as mock_overpass:
-            
-            mock_parse.return_value = {'poi': 'aquarium'}
-            mock_extract.return_value = 'RemoteLocation'
-            
-            mock_nominatim_client = Mock()
-            mock_nominatim_client.geocode.return_value = [(26.0, 127.0)]
-            mock_nominatim_class.return_value = mock_nominatim_client
-            
-            mock_overpass.return_value = []  # No accommodations found
-            
-            service = AccommodationSearchService(self.mock_config)
-            result = service.search_accommodations("我想去偏僻地方")
-            
-            assert isinstance(result, gpd.GeoDataFrame)
-            assert len(result) == 0
-
-    def test_isochrone_failure_fallback(self):
-        """Test fallback when isochrones cannot be calculated."""
-        with patch('src.innsight.services.query_service.parse_query') as mock_parse, \
-             patch('src.innsight.services.query_service.extract_location_from_query') as mock_extract, \
-             patch('src.innsight.services.geocode_service.NominatimClient') as mock_nominatim_class, \
-             patch('src.innsight.services.accommodation_service.fetch_overpass') as mock_overpass, \
-             patch('src.innsight.services.isochrone_service.get_isochrones_by_minutes') as mock_isochrones:
-            
-            mock_parse.return_value = {'poi': 'aquarium'}
-            mock_extract.return_value = 'TestLocation'
-            
-            mock_nominatim_client = Mock()
-            mock_nominatim_client.geocode.return_value = [(26.0, 127.0)]
-            mock_nominatim_class.return_value = mock_nominatim_client
-            
-            mock_overpass.return_value = [
-                {
-                    "id": 123,
-                    "type": "node",
-                    "lat": 26.1,
-                    "lon": 127.1,
-                    "tags": {"tourism": "hotel", "name": "Test Hotel"}
-                }
-            ]
-            
-            mock_isochrones.side_effect = Exception("Isochrone service unavailable")
-            
-            service = AccommodationSearchService(self.mock_config)
-            result = service.search_accommodations("我想去測試地點")
-            
-            # Should return empty result when isochrones fail
-            assert isinstance(result, gpd.GeoDataFrame)
-            assert len(result) == 0
+        svc_mocks.parse_query.return_value = {'poi': 'aquarium'}
+        svc_mocks.extract_location_from_query.return_value = 'InvalidPlace'
+        svc_mocks.NominatimClient.return_value.geocode.return_value = []  # No results
+        
+        service = AccommodationSearchService(self.mock_config)
+        
+        with pytest.raises(GeocodeError, match="找不到地點"):
+            service.search_accommodations("我想去不存在的地方")
 
 
 class TestConfigurationIntegration:
@@ -243,32 +251,32 @@ class TestConfigurationIntegration:
             assert config.nominatim_user_agent == 'innsight'  # default value
             assert config.nominatim_timeout == 10  # default value
 
-    def test_missing_environment_variables(self):
-        """Test error handling for missing environment variables."""
-        # Test missing API_ENDPOINT
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ConfigurationError, match="API_ENDPOINT environment variable not set"):
-                AppConfig.from_env()
-        
-        # Test missing ORS_URL
-        with patch.dict(os.environ, {'API_ENDPOINT': 'http://test.com'}, clear=True):
-            with pytest.raises(ConfigurationError, match="ORS_URL environment variable not set"):
-                AppConfig.from_env()
-        
-        # Test missing ORS_API_KEY
-        with patch.dict(os.environ, {
+    @pytest.mark.parametrize("env, expected_error", [
+        ({}, "API_ENDPOINT environment variable not set"),
+        ({'API_ENDPOINT': 'http://test.com'}, "ORS_URL environment variable not set"),
+        ({
             'API_ENDPOINT': 'http://test.com',
             'ORS_URL': 'http://ors.com'
-        }, clear=True):
-            with pytest.raises(ConfigurationError, match="ORS_API_KEY environment variable not set"):
-                AppConfig.from_env()
+        }, "ORS_API_KEY environment variable not set"),
+    ])
+    def test_missing_environment_variables(self, env, expected_error, monkeypatch):
+        """Test error handling for missing environment variables."""
+        # Touch only the required keys instead of snapshotting the whole environment
+        for key in ('API_ENDPOINT', 'ORS_URL', 'ORS_API_KEY'):
+            monkeypatch.delenv(key, raising=False)
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        
+        with pytest.raises(ConfigurationError, match=expected_error):
+            AppConfig.from_env()
 
 
 class TestServiceLayerIntegration:
     """Integration tests for service layer interactions."""
 
-    def test_service_dependency_injection(self):
-        """Test that services are properly injected with dependencies."""
+    @pytest.fixture
+    def mock_app_config(self):
+        """Config mock carrying every setting the search service reads."""
         mock_config = Mock(spec=AppConfig)
         mock_config.api_endpoint = "http://test.com"
         mock_config.nominatim_user_agent = "test"
@@ -281,8 +289,24 @@ class TestServiceLayerIntegration:
             'kids': 1.0,
             'pet': 1.0
         }
-        
-        service = AccommodationSearchService(mock_config)
+        mock_config.default_isochrone_intervals = [15, 30, 60]
+        mock_config.max_score = 100
+        mock_config.validation_sample_size = 10
+        mock_config.validation_large_dataset_threshold = 100
+        mock_config.default_top_n = 10
+        mock_config.default_missing_score = 50
+        mock_config.max_tier_value = 3
+        mock_config.max_rating_value = 5
+        return mock_config
+
+    @pytest.fixture
+    def search_service(self, mock_app_config):
+        """Search service built once per test from the mocked config."""
+        return AccommodationSearchService(mock_app_config)
+
+    def test_service_dependency_injection(self, search_service, mock_app_config):
+        """Test that services are properly injected with dependencies."""
+        service = search_service
         
         # Verify all sub-services are created
         assert service.query_service is not None
@@ -292,67 +316,37 @@ class TestServiceLayerIntegration:
         assert service.tier_service is not None
         
         # Verify configuration is passed to services that need it
-        assert service.geocode_service.config == mock_config
-        assert service.isochrone_service.config == mock_config
+        assert service.geocode_service.config == mock_app_config
+        assert service.isochrone_service.config == mock_app_config
 
-    def test_service_coordination(self):
+    def test_service_coordination(self, search_service):
         """Test coordination between different services."""
-        mock_config = Mock(spec=AppConfig)
-        mock_config.rating_weights = {
-            'tier': 4.0,
-            'rating': 2.0,
-            'parking': 1.0,
-            'wheelchair': 1.0,
-            'kids': 1.0,
-            'pet': 1.0
-        }
-        # Add new configuration properties
-        mock_config.default_isochrone_intervals = [15, 30, 60]
-        mock_config.max_score = 100
-        mock_config.validation_sample_size = 10
-        mock_config.validation_large_dataset_threshold = 100
-        mock_config.default_top_n = 10
-        mock_config.default_missing_score = 50
-        mock_config.max_tier_value = 3
-        mock_config.max_rating_value = 5
-        
-        # Create service with mocked dependencies
-        service = AccommodationSearchService(mock_config)
-        service.query_service = Mock()
-        service.geocode_service = Mock()
-        service.accommodation_service = Mock()
-        service.isochrone_service = Mock()
-        service.tier_service = Mock()
-        
-        # Setup return values to trace the data flow
-        service.query_service.extract_search_term.return_value = "TestLocation"
-        service.geocode_service.geocode_location.return_value = (26.0, 127.0)
-        
-        test_df = pd.DataFrame({
-            'osmid': [1, 2],
-            'name': ['Hotel A', 'Hotel B']
-        })
-        service.accommodation_service.fetch_accommodations.return_value = test_df
-        
+        test_df = _TEST_DF
         mock_isochrones = [{'geometry': 'test_polygon'}]
-        service.isochrone_service.get_isochrones_with_fallback.return_value = mock_isochrones
-        
         result_gdf = gpd.GeoDataFrame(test_df)
         result_gdf['tier'] = [1, 2]
-        service.tier_service.assign_tiers.return_value = result_gdf
+        
+        # Replace sub-services with recording stubs that trace the data flow
+        service = search_service
+        service.query_service = SimpleNamespace(extract_search_term=_Rec("TestLocation"))
+        service.geocode_service = SimpleNamespace(geocode_location=_Rec((26.0, 127.0)))
+        service.accommodation_service = SimpleNamespace(fetch_accommodations=_Rec(test_df))
+        service.isochrone_service = SimpleNamespace(get_isochrones_with_fallback=_Rec(mock_isochrones))
+        service.tier_service = SimpleNamespace(assign_tiers=_Rec(result_gdf))
         
         # Execute search
         result = service.search_accommodations("test query")
         
         # Verify the data flows correctly through all services
-        service.query_service.extract_search_term.assert_called_once_with("test query")
-        service.geocode_service.geocode_location.assert_called_once_with("TestLocation")
-        service.accommodation_service.fetch_accommodations.assert_called_once_with(26.0, 127.0)
-        service.isochrone_service.get_isochrones_with_fallback.assert_called_once_with((127.0, 26.0), [15, 30, 60])
-        service.tier_service.assign_tiers.assert_called_once_with(test_df, mock_isochrones)
+        assert service.query_service.extract_search_term.calls == [(("test query",), {})]
+        assert service.geocode_service.geocode_location.calls == [(("TestLocation",), {})]
+        assert service.accommodation_service.fetch_accommodations.calls == [((26.0, 127.0), {})]
+        assert service.isochrone_service.get_isochrones_with_fallback.calls == [(((127.0, 26.0), [15, 30, 60]), {})]
+        # Sequence equality checks identity first, so the DataFrame is matched by identity
+        assert service.tier_service.assign_tiers.calls == [((test_df, mock_isochrones), {})]
         
         # The result should have scores calculated and be sorted by score descending
         assert len(result) == 2
         assert 'score' in result.columns
         # Verify scores are in descending order (tier 2 should have higher score)
-        assert result.iloc[0]['score'] >= result.iloc[1]['score']
\ No newline at end of file
+        assert result.iloc[0]['score'] >= result.iloc[1]['score']
@@ -1,29 +1,50 @@
 """Tests for application lifecycle events."""
 
-from fastapi.testclient import TestClient
+import asyncio
+import contextlib
+import io
+from unittest.mock import patch
+
+import pytest
 
 from innsight.app import create_app
 
 
+async def _run_lifespan(app):
+    """Drive the ASGI lifespan in-process, without an HTTP transport or portal thread."""
+    async with app.router.lifespan_context(app):
+        pass
+
+
+@pytest.fixture(scope="class")
+def lifecycle_output():
+    """Run one startup/shutdown cycle and return everything it logged."""
+    # capsys is function-scoped, so capture the shared run by redirecting stdout;
+    # create_app() binds the log handler to sys.stdout, so it must run inside too
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        asyncio.run(_run_lifespan(create_app()))
+
+    return output.getvalue()
+
+
 class TestLifecycleEvents:
     """Test application startup and shutdown events."""
 
-    def test_startup_event_logs_application_started(self, capsys):
+    def test_startup_event_logs_application_started(self, lifecycle_output):
         """Verify startup event logs 'Application started successfully'."""
-        app = create_app()
-
-        with TestClient(app):
-            pass
-
-        captured = capsys.readouterr()
-        assert "Application started successfully" in captured.out
+        assert "Application started successfully" in lifecycle_output
 
-    def test_shutdown_event_logs_application_shutting_down(self, capsys):
+    def test_shutdown_event_logs_application_shutting_down(self, lifecycle_output):
         """Verify shutdown event logs 'Application shutting down'."""
-        app = create_app()
+        assert "Application shutting down" in lifecycle_output
 
-        with TestClient(app):
-            pass
+    def test_shutdown_event_closes_pooled_sessions(self):
+        """Verify shutdown event closes the pooled ORS and Overpass sessions."""
+        with patch("innsight.ors_client.close_session") as close_ors, \
+                patch("innsight.overpass_client.close_session") as close_overpass, \
+                contextlib.redirect_stdout(io.StringIO()):
+            asyncio.run(_run_lifespan(create_app()))
 
-        captured = capsys.readouterr()
-        assert "Application shutting down" in captured.out
\ No newline at end of file
+        close_ors.assert_called_once_with()
+        close_overpass.assert_called_once_with()
@@ -3,29 +3,27 @@
 import json
 from io import StringIO
 import threading
-import time
 
 import pytest
+import structlog
+
+from innsight.logging_config import bind_trace_id, clear_trace_id, get_logger
 
 
 class TestLoggingConfig:
     """Test suite for logging configuration."""
 
-    def test_json_format_output(self, monkeypatch, app_config):
+    def test_json_format_output(self, env, app_config, log_output, configure_logged):
         """Test that JSON format outputs valid JSON."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.logging_config import configure_logging, get_logger
+        env(LOG_FORMAT="json")
 
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
+        configure_logged(app_config, stream=log_output)
 
         logger = get_logger("test")
         logger.info("test message", key="value")
 
         # Parse output as JSON
-        log_output.seek(0)
-        log_line = log_output.readline().strip()
+        (log_line,) = log_output.lines()
 
         # Should be valid JSON
         log_data = json.loads(log_line)
@@ -37,67 +35,53 @@ class TestLoggingConfig:
         assert log_data["message"] == "test message"
         assert log_data["key"] == "value"
 
-    def test_text_format_output(self, monkeypatch, app_config):
+    def test_text_format_output(self, env, app_config, log_output, configure_logged):
         """Test that text format outputs human-readable text."""
-        monkeypatch.setenv("LOG_FORMAT", "text")
+        env(LOG_FORMAT="text")
 
-        from innsight.logging_config import configure_logging, get_logger
-
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
+        configure_logged(app_config, stream=log_output)
 
         logger = get_logger("test")
         logger.info("test message")
 
         # Get output
-        log_output.seek(0)
-        log_line = log_output.readline()
+        (log_line,) = log_output.lines()
 
-        # Should NOT be JSON (will raise exception if we try to parse)
-        with pytest.raises(json.JSONDecodeError):
-            json.loads(log_line)
+        # Should NOT be JSON (no object/array opener)
+        assert not log_line.lstrip().startswith(("{", "["))
 
         # Should contain the message
         assert "test message" in log_line
 
-    def test_log_level_filtering(self, monkeypatch, app_config):
+    def test_log_level_filtering(self, env, app_config, log_output, configure_logged):
         """Test that log level filtering works correctly."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-        monkeypatch.setenv("LOG_LEVEL", "INFO")
-
-        from innsight.logging_config import configure_logging, get_logger
+        env(LOG_FORMAT="json", LOG_LEVEL="INFO")
 
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
+        configure_logged(app_config, stream=log_output)
 
         logger = get_logger("test")
         logger.debug("debug message")  # Should be filtered out
         logger.info("info message")     # Should appear
 
         # Get output
-        log_output.seek(0)
-        output = log_output.read()
+        output = log_output.getvalue()
 
         # DEBUG should be filtered
         assert "debug message" not in output
         # INFO should appear
         assert "info message" in output
 
-    def test_required_fields_present(self, monkeypatch, app_config):
+    def test_required_fields_present(self, env, app_config, log_output, configure_logged):
         """Test that JSON output contains all required fields."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
+        env(LOG_FORMAT="json")
 
-        from innsight.logging_config import configure_logging, get_logger
-
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
+        configure_logged(app_config, stream=log_output)
 
         logger = get_logger("test.module")
         logger.info("test message")
 
         # Parse output
-        log_output.seek(0)
-        log_line = log_output.readline().strip()
+        (log_line,) = log_output.lines()
         log_data = json.loads(log_line)
 
         # Verify required fields
@@ -112,144 +96,120 @@ class TestLoggingConfig:
         assert "T" in log_data["timestamp"]
         assert "Z" in log_data["timestamp"] or "+" in log_data["timestamp"]
 
-    def test_environment_variable_switching(self, monkeypatch, app_config):
+    def test_environment_variable_switching(self, env, app_config, log_output, configure_logged):
         """Test that LOG_FORMAT environment variable switches output format."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.logging_config import configure_logging, get_logger
+        env(LOG_FORMAT="json")
 
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
+        configure_logged(app_config, stream=log_output)
 
         logger = get_logger("test")
         logger.info("test")
 
-        log_output.seek(0)
-        json_line = log_output.readline().strip()
+        (json_line,) = log_output.lines()
 
         # Should be valid JSON
         json_data = json.loads(json_line)
         assert "timestamp" in json_data
 
         # Test text format
-        monkeypatch.setenv("LOG_FORMAT", "text")
+        env(LOG_FORMAT="text")
         log_output_text = StringIO()
-        configure_logging(app_config, stream=log_output_text)
+        configure_logged(app_config, stream=log_output_text)
         logger = get_logger("test")
         logger.info("test")
 
-        log_output_text.seek(0)
-        text_line = log_output_text.readline()
+        (text_line,) = log_output_text.getvalue().splitlines()
 
         # Should NOT be valid JSON
-        with pytest.raises(json.JSONDecodeError):
-            json.loads(text_line)
+        assert not text_line.lstrip().startswith(("{", "["))
+
+
+# Each case is a sequence of context actions and the fields expected on each
+# emitted log line, in order; a None value means the field must be absent.
+#   ("bind", trace_id) / ("clear",) / ("log", logger_name, message, extra_fields)
+_CONTEXT_CASES = [
+    pytest.param(
+        [("bind", "req_test1234"), ("log", "test", "test message", {})],
+        [{"trace_id": "req_test1234", "message": "test message"}],
+        id="bind-trace-id",
+    ),
+    pytest.param(
+        [("bind", "req_abcd1234"), ("log", "test", "cache hit", {"cache_key": "xyz"})],
+        [{"trace_id": "req_abcd1234", "message": "cache hit", "cache_key": "xyz"}],
+        id="trace-id-alongside-extra-fields",
+    ),
+    pytest.param(
+        [
+            ("bind", "req_shared99"),
+            ("log", "module.a", "message from logger1", {}),
+            ("log", "module.b", "message from logger2", {}),
+        ],
+        [{"trace_id": "req_shared99"}, {"trace_id": "req_shared99"}],
+        id="loggers-share-context",
+    ),
+    pytest.param(
+        [
+            ("bind", "req_temp1234"),
+            ("log", "test", "with trace_id", {}),
+            ("clear",),
+            ("log", "test", "without trace_id", {}),
+        ],
+        [{"trace_id": "req_temp1234"}, {"trace_id": None}],
+        id="clear-trace-id",
+    ),
+]
 
 
 class TestContextBinding:
     """Test suite for trace_id context binding."""
 
-    def test_bind_trace_id(self, monkeypatch, app_config):
-        """Test that trace_id can be bound to the logging context."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.logging_config import configure_logging, get_logger, bind_trace_id
-
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
-
-        # When: Bind a trace_id and log a message
-        bind_trace_id("req_test1234")
-        logger = get_logger("test")
-        logger.info("test message")
-
-        # Then: Log should contain the trace_id
-        log_output.seek(0)
-        log_line = log_output.readline().strip()
-        log_data = json.loads(log_line)
-
-        assert "trace_id" in log_data
-        assert log_data["trace_id"] == "req_test1234"
-
-    def test_trace_id_in_log_output(self, monkeypatch, app_config):
-        """Test that trace_id appears in JSON log output."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.logging_config import configure_logging, get_logger, bind_trace_id
-
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
-
-        bind_trace_id("req_abcd1234")
-
-        # When: Log a message
-        logger = get_logger("test")
-        logger.info("cache hit", cache_key="xyz")
-
-        # Then: Log should be valid JSON with trace_id field
-        log_output.seek(0)
-        log_line = log_output.readline().strip()
-        log_data = json.loads(log_line)
-
-        assert log_data["trace_id"] == "req_abcd1234"
-        assert log_data["message"] == "cache hit"
-        assert log_data["cache_key"] == "xyz"
-
-    def test_multiple_loggers_share_context(self, monkeypatch, app_config):
-        """Test that different loggers share the same trace_id context."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.logging_config import configure_logging, get_logger, bind_trace_id
-
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
-
-        bind_trace_id("req_shared99")
-
-        # When: Use two different loggers
-        logger1 = get_logger("module.a")
-        logger2 = get_logger("module.b")
-
-        logger1.info("message from logger1")
-        logger2.info("message from logger2")
-
-        # Then: Both logs should have the same trace_id
-        log_output.seek(0)
-        log_lines = log_output.readlines()
-
-        assert len(log_lines) == 2
+    @pytest.mark.parametrize("actions,expected", _CONTEXT_CASES)
+    def test_context_lifecycle(self, app_config, log_output, configure_logged, capture_events,
+                               actions, expected):
+        """Test that bound trace_ids reach every logger's output until cleared."""
+        configure_logged(app_config, stream=log_output)
+        clear_trace_id()
 
-        log_data_1 = json.loads(log_lines[0].strip())
-        log_data_2 = json.loads(log_lines[1].strip())
+        # When: Run the bind / log / clear actions in order
+        with capture_events() as events:
+            for action, *args in actions:
+                if action == "bind":
+                    bind_trace_id(*args)
+                elif action == "clear":
+                    clear_trace_id()
+                else:
+                    logger_name, message, fields = args
+                    get_logger(logger_name).info(message, **fields)
+
+        # Then: Each event carries exactly the expected context
+        for event, fields in zip(events, expected, strict=True):
+            for name, value in fields.items():
+                if value is None:
+                    assert name not in event
+                else:
+                    assert event[name] == value
 
-        assert log_data_1["trace_id"] == "req_shared99"
-        assert log_data_2["trace_id"] == "req_shared99"
+        clear_trace_id()
 
-    def test_context_isolation(self, monkeypatch, app_config):
+    def test_context_isolation(self, app_config, log_output, configure_logged, capture_events):
         """Test that different threads have isolated trace_id contexts."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.logging_config import configure_logging, get_logger, bind_trace_id, clear_trace_id
-
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
+        configure_logged(app_config, stream=log_output)
 
         # Shared data structure to collect results
         results = {}
+        # Both threads bind before either logs, so their contexts provably overlap
+        barrier = threading.Barrier(2)
 
         def thread_function(thread_id, trace_id):
             """Function to run in separate thread."""
             bind_trace_id(trace_id)
-            logger = get_logger(f"thread.{thread_id}")
-
-            # Simulate some work
-            time.sleep(0.01)
+            barrier.wait()
 
-            # Capture the current log output
+            logger = get_logger(f"thread.{thread_id}")
             logger.info(f"message from thread {thread_id}")
 
-            # Store the trace_id we used
-            results[thread_id] = trace_id
+            # Store the trace_id this thread's context still holds
+            results[thread_id] = structlog.contextvars.get_contextvars().get("trace_id")
 
             # Clean up
             clear_trace_id()
@@ -258,47 +218,20 @@ class TestContextBinding:
         thread1 = threading.Thread(target=thread_function, args=(1, "req_thread001"))
         thread2 = threading.Thread(target=thread_function, args=(2, "req_thread002"))
 
-        thread1.start()
-        thread2.start()
+        with capture_events() as events:
+            thread1.start()
+            thread2.start()
 
-        thread1.join()
-        thread2.join()
+            thread1.join()
+            thread2.join()
 
         # Then: Each thread should have used its own trace_id
-        # Note: We can't easily verify the log output in this test due to shared StringIO
-        # But we verify that contextvars kept the contexts isolated
         assert results[1] == "req_thread001"
         assert results[2] == "req_thread002"
 
-    def test_clear_trace_id(self, monkeypatch, app_config):
-        """Test that clear_trace_id removes trace_id from context."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.logging_config import configure_logging, get_logger, bind_trace_id, clear_trace_id
-
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
-
-        logger = get_logger("test")
-
-        # Bind trace_id and log
-        bind_trace_id("req_temp1234")
-        logger.info("with trace_id")
-
-        # When: Clear trace_id and log again
-        clear_trace_id()
-        logger.info("without trace_id")
-
-        # Then: First log should have trace_id, second should not
-        log_output.seek(0)
-        log_lines = log_output.readlines()
-
-        assert len(log_lines) == 2
-
-        log_data_1 = json.loads(log_lines[0].strip())
-        log_data_2 = json.loads(log_lines[1].strip())
-
-        assert "trace_id" in log_data_1
-        assert log_data_1["trace_id"] == "req_temp1234"
-
-        assert "trace_id" not in log_data_2
+        # And: Each thread's log event should carry that trace_id
+        trace_ids = {event["message"]: event["trace_id"] for event in events}
+        assert trace_ids == {
+            "message from thread 1": "req_thread001",
+            "message from thread 2": "req_thread002",
+        }
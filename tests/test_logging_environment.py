@@ -1,218 +1,86 @@
 """Tests for environment-based logging configuration."""
 
 import json
-import os
-from io import StringIO
-import pytest
-from innsight.logging_config import configure_logging, get_logger
-
-
-class TestEnvironmentBasedLogging:
-    """Test that logging configuration adapts to ENV environment variable."""
-
-    def test_production_environment_defaults_to_json_format(self, monkeypatch):
-        """In production, LOG_FORMAT should default to 'json'."""
-        monkeypatch.setenv("API_ENDPOINT", "http://test-api.com")
-        monkeypatch.setenv("ORS_URL", "http://test-ors.com")
-        monkeypatch.setenv("ORS_API_KEY", "test-ors-api-key")
-        monkeypatch.setenv("ENV", "prod")
-        # Don't set LOG_FORMAT explicitly
-        monkeypatch.delenv("LOG_FORMAT", raising=False)
-        monkeypatch.delenv("LOG_LEVEL", raising=False)
-
-        from innsight.config import AppConfig
-        prod_config = AppConfig.from_env()
-
-        output = StringIO()
-        configure_logging(prod_config, stream=output)
-
-        logger = get_logger(__name__)
-        logger.info("test message")
-
-        log_line = output.getvalue().strip()
-        # Should be valid JSON
-        log_data = json.loads(log_line)
-        assert log_data["message"] == "test message"
-
-    def test_development_environment_defaults_to_text_format(self, monkeypatch, app_config):
-        """In development, LOG_FORMAT should default to 'text'."""
-        monkeypatch.setenv("ENV", "local")
-        monkeypatch.delenv("LOG_FORMAT", raising=False)
-        monkeypatch.delenv("LOG_LEVEL", raising=False)
-
-        output = StringIO()
-        configure_logging(app_config, stream=output)
-
-        logger = get_logger(__name__)
-        logger.info("test message")
-
-        log_line = output.getvalue().strip()
-        # Should be text format (not valid JSON)
-        assert "test message" in log_line
-        with pytest.raises(json.JSONDecodeError):
-            json.loads(log_line)
-
-    def test_production_environment_defaults_to_info_level(self, monkeypatch):
-        """In production, LOG_LEVEL should default to 'INFO'."""
-        monkeypatch.setenv("API_ENDPOINT", "http://test-api.com")
-        monkeypatch.setenv("ORS_URL", "http://test-ors.com")
-        monkeypatch.setenv("ORS_API_KEY", "test-ors-api-key")
-        monkeypatch.setenv("ENV", "prod")
-        monkeypatch.setenv("LOG_FORMAT", "json")  # Force JSON for easy parsing
-        monkeypatch.delenv("LOG_LEVEL", raising=False)
-
-        from innsight.config import AppConfig
-        prod_config = AppConfig.from_env()
-
-        output = StringIO()
-        configure_logging(prod_config, stream=output)
-
-        logger = get_logger(__name__)
-        logger.debug("debug message")
-        logger.info("info message")
-
-        lines = output.getvalue().strip().split('\n')
-        # DEBUG should be filtered out, only INFO should appear
-        assert len(lines) == 1
-        log_data = json.loads(lines[0])
-        assert log_data["message"] == "info message"
-        assert log_data["level"] == "info"
-
-    def test_development_environment_defaults_to_debug_level(self, monkeypatch, app_config):
-        """In development, LOG_LEVEL should default to 'DEBUG'."""
-        monkeypatch.setenv("ENV", "local")
-        monkeypatch.setenv("LOG_FORMAT", "json")  # Force JSON for easy parsing
-        monkeypatch.delenv("LOG_LEVEL", raising=False)
-
-        output = StringIO()
-        configure_logging(app_config, stream=output)
-
-        logger = get_logger(__name__)
-        logger.debug("debug message")
-        logger.info("info message")
 
-        lines = output.getvalue().strip().split('\n')
-        # Both DEBUG and INFO should appear
-        assert len(lines) == 2
-        debug_log = json.loads(lines[0])
-        info_log = json.loads(lines[1])
-        assert debug_log["level"] == "debug"
-        assert info_log["level"] == "info"
-
-    def test_explicit_log_format_overrides_environment(self, monkeypatch):
-        """Explicit LOG_FORMAT should override ENV-based defaults."""
-        monkeypatch.setenv("API_ENDPOINT", "http://test-api.com")
-        monkeypatch.setenv("ORS_URL", "http://test-ors.com")
-        monkeypatch.setenv("ORS_API_KEY", "test-ors-api-key")
-        monkeypatch.setenv("ENV", "prod")
-        monkeypatch.setenv("LOG_FORMAT", "text")  # Override default
-
-        from innsight.config import AppConfig
-        prod_config = AppConfig.from_env()
+import pytest
 
-        output = StringIO()
-        configure_logging(prod_config, stream=output)
+from innsight.config import AppConfig
+from innsight.logging_config import get_logger
+
+
+def _is_text(line):
+    """Text renderer output never opens with a JSON object/array."""
+    return not line.lstrip().startswith(("{", "["))
+
+
+def _levels(lines):
+    return [json.loads(line)["level"] for line in lines]
+
+
+def _field(lines, name):
+    return json.loads(lines[0])[name]
+
+
+# (ENV, LOG_FORMAT, LOG_LEVEL, assertion over the emitted lines); None leaves
+# the variable unset. Every case logs one debug, one info and one warning
+# message, so level filtering shows up directly in the emitted lines.
+_ENV_MATRIX = [
+    # ENV picks the default format...
+    pytest.param("prod", None, None,
+                 lambda lines: _field(lines, "message") == "info message",
+                 id="prod-defaults-to-json"),
+    pytest.param("local", None, None,
+                 lambda lines: _is_text(lines[0]) and "debug message" in lines[0],
+                 id="local-defaults-to-text"),
+    # ...and the default level
+    pytest.param("prod", "json", None,
+                 lambda lines: _levels(lines) == ["info", "warning"],
+                 id="prod-defaults-to-info"),
+    pytest.param("local", "json", None,
+                 lambda lines: _levels(lines) == ["debug", "info", "warning"],
+                 id="local-defaults-to-debug"),
+    # Explicit LOG_FORMAT / LOG_LEVEL override the ENV-based defaults
+    pytest.param("prod", "text", None,
+                 lambda lines: _is_text(lines[0]) and "info message" in lines[0],
+                 id="explicit-format-overrides-env"),
+    pytest.param("local", "json", "WARNING",
+                 lambda lines: _levels(lines) == ["warning"],
+                 id="explicit-level-overrides-env"),
+    # Every log is enriched with environment and version information
+    pytest.param("prod", "json", None,
+                 lambda lines: _field(lines, "environment") == "prod",
+                 id="environment-field"),
+    pytest.param("local", "json", None,
+                 lambda lines: isinstance(_field(lines, "app_version"), str),
+                 id="app-version-field"),
+    pytest.param("dev", "json", None,
+                 lambda lines: _field(lines, "environment") == "dev",
+                 id="environment-field-reflects-env"),
+    pytest.param(None, "json", None,
+                 lambda lines: _field(lines, "environment") == "local",
+                 id="environment-defaults-to-local"),
+]
 
-        logger = get_logger(__name__)
-        logger.info("test message")
 
-        log_line = output.getvalue().strip()
-        # Should be text format despite ENV=prod
-        assert "test message" in log_line
-        with pytest.raises(json.JSONDecodeError):
-            json.loads(log_line)
+class TestEnvironmentBasedLogging:
+    """Test that logging format, level and enrichment adapt to ENV and its overrides."""
 
-    def test_explicit_log_level_overrides_environment(self, monkeypatch, app_config):
-        """Explicit LOG_LEVEL should override ENV-based defaults."""
-        monkeypatch.setenv("ENV", "local")
-        monkeypatch.setenv("LOG_LEVEL", "WARNING")  # Override default
-        monkeypatch.setenv("LOG_FORMAT", "json")
+    @pytest.mark.parametrize("app_env,fmt,level,assertion", _ENV_MATRIX)
+    def test_env_matrix(self, env, log_output, configure_logged, app_env, fmt, level, assertion):
+        env(
+            API_ENDPOINT="http://test-api.com",
+            ORS_URL="http://test-ors.com",
+            ORS_API_KEY="test-ors-api-key",
+            ENV=app_env,
+            LOG_FORMAT=fmt,
+            LOG_LEVEL=level,
+        )
 
-        output = StringIO()
-        configure_logging(app_config, stream=output)
+        configure_logged(AppConfig.from_env(), stream=log_output)
 
         logger = get_logger(__name__)
         logger.debug("debug message")
         logger.info("info message")
         logger.warning("warning message")
 
-        lines = output.getvalue().strip().split('\n')
-        # Only WARNING should appear
-        assert len(lines) == 1
-        log_data = json.loads(lines[0])
-        assert log_data["level"] == "warning"
-
-
-class TestLoggingContextEnrichment:
-    """Test that logs are enriched with environment and version information."""
-
-    def test_logs_include_environment_field(self, monkeypatch):
-        """All logs should include the 'environment' field."""
-        monkeypatch.setenv("API_ENDPOINT", "http://test-api.com")
-        monkeypatch.setenv("ORS_URL", "http://test-ors.com")
-        monkeypatch.setenv("ORS_API_KEY", "test-ors-api-key")
-        monkeypatch.setenv("ENV", "prod")
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.config import AppConfig
-        prod_config = AppConfig.from_env()
-
-        output = StringIO()
-        configure_logging(prod_config, stream=output)
-
-        logger = get_logger(__name__)
-        logger.info("test message")
-
-        log_data = json.loads(output.getvalue().strip())
-        assert "environment" in log_data
-        assert log_data["environment"] == "prod"
-
-    def test_logs_include_app_version_field(self, monkeypatch, app_config):
-        """All logs should include the 'app_version' field."""
-        monkeypatch.setenv("ENV", "local")
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        output = StringIO()
-        configure_logging(app_config, stream=output)
-
-        logger = get_logger(__name__)
-        logger.info("test message")
-
-        log_data = json.loads(output.getvalue().strip())
-        assert "app_version" in log_data
-        # Version could be actual version or "unknown"
-        assert isinstance(log_data["app_version"], str)
-
-    def test_environment_field_reflects_current_env(self, monkeypatch):
-        """Environment field should reflect the current ENV setting."""
-        monkeypatch.setenv("API_ENDPOINT", "http://test-api.com")
-        monkeypatch.setenv("ORS_URL", "http://test-ors.com")
-        monkeypatch.setenv("ORS_API_KEY", "test-ors-api-key")
-        monkeypatch.setenv("ENV", "dev")
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.config import AppConfig
-        dev_config = AppConfig.from_env()
-
-        output = StringIO()
-        configure_logging(dev_config, stream=output)
-
-        logger = get_logger(__name__)
-        logger.info("test message")
-
-        log_data = json.loads(output.getvalue().strip())
-        assert log_data["environment"] == "dev"
-
-    def test_default_environment_is_local(self, monkeypatch, app_config):
-        """If ENV is not set, default should be 'local'."""
-        monkeypatch.delenv("ENV", raising=False)
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        output = StringIO()
-        configure_logging(app_config, stream=output)
-
-        logger = get_logger(__name__)
-        logger.info("test message")
-
-        log_data = json.loads(output.getvalue().strip())
-        assert log_data["environment"] == "local"
+        assert assertion(log_output.lines())
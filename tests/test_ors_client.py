@@ -3,29 +3,43 @@
 測試 ORS Client 的完整功能
 包括正常功能、錯誤處理、API 超時、503 錯誤、rate-limit 重試、快取回退等場景
 """
-import json
 import os
-import sys
+import pickle
+import threading
 import time
-from unittest.mock import Mock, patch, call
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from unittest.mock import Mock, patch
 import pytest
 from requests.exceptions import HTTPError, Timeout, ConnectionError
-from json import JSONDecodeError
-from io import StringIO
-
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from json import dumps as _dumps
 
+from innsight import ors_client
 from innsight.ors_client import (
-    get_isochrones_by_minutes, 
-    _fallback_cache
+    get_isochrones_batch, get_isochrones_batch_async, get_isochrones_by_minutes
 )
 from innsight.exceptions import IsochroneError, APIError
 from shapely.geometry import Polygon
 
+# orjson 僅在環境中已安裝時使用（非專案依賴），否則退回標準庫 json
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 
 # 測試常數
 TEST_COORD = (8.681495, 49.41461)
 TEST_ENV = {'ORS_URL': 'https://api.openrouteservice.org/v2/directions', 'ORS_API_KEY': 'test_key'}
+# ORS 請求應帶的 headers（Authorization 取自 TEST_ENV）
+EXPECTED_HEADERS = {
+    "Accept": "application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8",
+    "Content-Type": "application/json; charset=utf-8",
+    "Authorization": TEST_ENV["ORS_API_KEY"],
+}
+# SAMPLE_GEOJSON 唯一的等時圈，及其解析後應得的 Polygon（模組載入時建立一次）
+SAMPLE_POLYGON_COORDS = [[8.6, 49.4], [8.7, 49.4], [8.7, 49.5], [8.6, 49.5], [8.6, 49.4]]
+SAMPLE_POLYGON = Polygon(SAMPLE_POLYGON_COORDS)
 SAMPLE_GEOJSON = {
     "features": [
         {
@@ -33,7 +47,7 @@ SAMPLE_GEOJSON = {
             "properties": {"value": 900},
             "geometry": {
                 "type": "Polygon", 
-                "coordinates": [[[8.6, 49.4], [8.7, 49.4], [8.7, 49.5], [8.6, 49.5], [8.6, 49.4]]]
+                "coordinates": [SAMPLE_POLYGON_COORDS]
             }
         }
     ]
@@ -54,29 +68,103 @@ SAMPLE_MULTI_GEOJSON = {
 }
 
 
-class TestGetIsochronesByMinutes:
-    """測試 get_isochrones_by_minutes 函數的完整功能"""
-    
-    def setup_method(self):
-        """每個測試前清理快取"""
-        _fallback_cache.clear()
-        get_isochrones_by_minutes.cache_clear()
-    
-    def _create_mock_response(self, status_code=200, json_data=None, error_text="", 
-                             raise_error=None):
-        """建立 mock response 的輔助方法"""
-        mock_response = Mock()
-        mock_response.status_code = status_code
-        mock_response.text = error_text
-        
-        if json_data is not None:
-            mock_response.json.return_value = json_data
-        if raise_error:
-            mock_response.raise_for_status.side_effect = raise_error
-        else:
-            mock_response.raise_for_status.return_value = None
-            
-        return mock_response
+@pytest.fixture(autouse=True)
+def ors_config(monkeypatch):
+    """以 TEST_ENV 的 ORS 設定取代 ors_client 從環境變數解析的設定"""
+    monkeypatch.setattr(
+        ors_client, "_CFG", ors_client.OrsConfig(url=TEST_ENV['ORS_URL'], api_key=TEST_ENV['ORS_API_KEY'])
+    )
+
+
+@pytest.fixture(autouse=True)
+def fallback_cache(monkeypatch):
+    """
+    Give each test its own empty ORS fallback cache. The decorator looks the
+    module global up on every call, so swapping it keeps tests independent of
+    run order and of whichever tests share an xdist worker.
+
+    The disk tier is switched off too, so a developer's ORS_CACHE_DIR (from the
+    shell or .env) is never read or wiped; disk tests opt in with tmp_path.
+    """
+    monkeypatch.delenv("ORS_CACHE_DIR", raising=False)
+    cache = {}
+    monkeypatch.setattr(ors_client, "_fallback_cache", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def mock_post(monkeypatch):
+    """Stand-in for the pooled session's post, installed for every test so none reaches ORS."""
+    mock = Mock()
+    monkeypatch.setattr(ors_client._session, "post", mock)
+    return mock
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """以 mock 取代 time.sleep，重試只記錄退避時間而不實際等待"""
+    mock = Mock()
+    monkeypatch.setattr('time.sleep', mock)
+    return mock
+
+
+@dataclass(frozen=True)
+class FakeResponse:
+    """輕量的 response 替身；status_code >= 400 時 raise_for_status() 拋出 HTTPError"""
+    status_code: int = 200
+    content: bytes = b""
+    text: str = ""
+    headers: dict = field(default_factory=dict)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            error = HTTPError(f"{self.status_code} {self.text}")
+            error.response = self
+            raise error
+
+
+def _stub_response(payload, status=200):
+    """建立 content 為 payload 序列化後 bytes 的 response 替身"""
+    return FakeResponse(status, _dumps(payload).encode())
+
+
+# 成功回應在整個模組共用；測試只讀取回應內容，不檢查其呼叫紀錄
+@pytest.fixture(scope="module")
+def success_response_single():
+    return _stub_response(SAMPLE_GEOJSON)
+
+
+@pytest.fixture(scope="module")
+def success_response_multi():
+    return _stub_response(SAMPLE_MULTI_GEOJSON)
+
+
+@pytest.fixture(scope="module")
+def success_response_empty():
+    return _stub_response({"features": []})
+
+# 快取回退測試用：TEST_COORD 15 分鐘請求的快取鍵、預先建好的結果與必定過期的時間戳
+STALE_CACHE_KEY = ('_fetch_isochrones_from_api', ('driving-car', (TEST_COORD,), (900,)), ())
+STALE_RESULT = [SAMPLE_POLYGON]
+STALE_TIMESTAMP = 0.0
+
+
+def _assert_retry_backoff(mock_sleep, retries=2):
+    """驗證重試間的 sleep：第 n 次約為 1·2ⁿ 秒，另加至多 DEFAULT_RETRY_JITTER 比例的 jitter"""
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert len(delays) == retries
+    for n, delay in enumerate(delays):
+        base = ors_client.DEFAULT_RETRY_DELAY * ors_client.DEFAULT_BACKOFF_MULTIPLIER ** n
+        assert base <= delay <= base * (1 + ors_client.DEFAULT_RETRY_JITTER)
+
+
+def _error_response(status_code, reason):
+    """建立 raise_for_status() 會拋出 HTTPError 的 response 替身"""
+    return FakeResponse(status_code, text=reason)
+
+
+class _IsochroneTestBase:
+    """get_isochrones_by_minutes 測試共用的輔助方法"""
     
     def _assert_basic_result_structure(self, result, expected_count=1):
         """驗證基本結果結構的輔助方法"""
@@ -85,37 +173,36 @@ class TestGetIsochronesByMinutes:
         assert all(isinstance(iso_list, list) for iso_list in result)
         assert all(len(iso_list) == 1 for iso_list in result)
         assert all(isinstance(iso_list[0], Polygon) for iso_list in result)
-    
+
+
+class TestGetIsochronesByMinutes(_IsochroneTestBase):
+    """測試 get_isochrones_by_minutes 函數的完整功能"""
+
     # === 正常功能測試 ===
     
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
-    def test_success_multiple_intervals(self, mock_post):
-        """測試成功取得多個時間間隔的等時圈"""
-        mock_post.return_value = self._create_mock_response(json_data=SAMPLE_MULTI_GEOJSON)
+    def test_success_multiple_intervals(self, mock_post, success_response_multi):
+        """測試成功取得多個時間間隔的等時圈：所有間隔合併為一次請求"""
+        mock_post.return_value = success_response_multi
         
         result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15, 30])
         
         self._assert_basic_result_structure(result, expected_count=2)
-        mock_post.assert_called_once_with(
-            url="https://api.openrouteservice.org/v2/directions/isochrones/driving-car",
-            json={
-                "locations": (TEST_COORD,),
-                "range": (900, 1800)  # 15*60, 30*60
-            },
-            headers={
-                "Accept": "application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8",
-                "Content-Type": "application/json; charset=utf-8", 
-                "Authorization": "test_key"
-            },
-            timeout=(5, 30)
-        )
-
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
-    def test_caching_mechanism(self, mock_post):
+        assert [iso_list[0].area for iso_list in result] == [1.0, 4.0]  # 依回應順序對應各時間間隔
+        mock_post.assert_called_once()
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["url"] == f"{TEST_ENV['ORS_URL']}/isochrones/driving-car"
+        assert kwargs["json"] == {"locations": (TEST_COORD,), "range": (900, 1800)}  # 15*60, 30*60
+        assert kwargs["headers"] == EXPECTED_HEADERS
+        assert kwargs["timeout"] == (5, 30)
+
+    def test_empty_intervals(self, mock_post):
+        """測試空的時間間隔清單：直接回傳空結果且不送出請求"""
+        assert get_isochrones_by_minutes(coord=TEST_COORD, intervals=[]) == []
+        mock_post.assert_not_called()
+
+    def test_caching_mechanism(self, mock_post, success_response_single):
         """測試快取機制"""
-        mock_post.return_value = self._create_mock_response(json_data={"features": []})
+        mock_post.return_value = success_response_single
         
         # 兩次相同調用
         result1 = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
@@ -125,40 +212,379 @@ class TestGetIsochronesByMinutes:
         assert result1 == result2
         assert get_isochrones_by_minutes.cache_info()['size'] == 1
 
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
-    def test_different_profile(self, mock_post):
+    def test_empty_result_not_cached(self, mock_post, success_response_empty):
+        """測試空的等時圈結果不寫入快取，下次請求會重新呼叫 API"""
+        mock_post.return_value = success_response_empty
+
+        get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+
+        assert mock_post.call_count == 2
+        assert get_isochrones_by_minutes.cache_info()['size'] == 0
+
+    def test_different_profile(self, mock_post, success_response_empty):
         """測試不同的交通模式"""
-        mock_post.return_value = self._create_mock_response(json_data={"features": []})
+        mock_post.return_value = success_response_empty
         
         result = get_isochrones_by_minutes(
             coord=TEST_COORD, intervals=[10], profile='foot-walking'
         )
         
-        mock_post.assert_called_once_with(
-            url="https://api.openrouteservice.org/v2/directions/isochrones/foot-walking",
-            json={"locations": (TEST_COORD,), "range": (600,)},
-            headers={
-                "Accept": "application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8",
-                "Content-Type": "application/json; charset=utf-8",
-                "Authorization": "test_key"
-            },
-            timeout=(5, 30)
-        )
+        # 只驗證與交通模式相關的欄位，共用欄位已由 test_success_multiple_intervals 涵蓋
+        mock_post.assert_called_once()
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["url"].endswith("/isochrones/foot-walking")
+        assert kwargs["json"]["range"] == (600,)
+        assert result == []
+
+    # === API 錯誤響應測試 ===
+    
+    def test_api_error_response_handling(self, mock_post):
+        """測試 API 錯誤響應處理"""
+        error_json = {
+            "error": {
+                "code": 2004,
+                "message": "Request parameters exceed the server configuration limits."
+            }
+        }
+        mock_post.return_value = _stub_response(error_json)
+        
+        with pytest.raises(APIError) as exc_info:
+            get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        
+        error_msg = str(exc_info.value)
+        assert "ORS API error 2004" in error_msg
+        assert "Request parameters exceed" in error_msg
+
+    # === 快取管理測試 ===
+    
+    def test_cache_info_and_clear(self):
+        """測試快取資訊和清理功能"""
+        get_isochrones_by_minutes.cache_clear()
+
+        cache_info = get_isochrones_by_minutes.cache_info()
+        assert isinstance(cache_info, dict)
+        assert 'size' in cache_info
+        assert cache_info['size'] == 0
+
+    def test_cache_accepts_list_coord(self, mock_post, success_response_single):
+        """測試座標以 list 傳入時仍可作為快取鍵，且與 tuple 共用同一筆快取"""
+        mock_post.return_value = success_response_single
+
+        get_isochrones_by_minutes(coord=list(TEST_COORD), intervals=[15])
+        get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+
+        assert mock_post.call_count == 1
+
+    def test_cache_normalizes_float_noise(self, mock_post, success_response_single):
+        """測試座標的浮點誤差不會造成快取未命中"""
+        mock_post.return_value = success_response_single
+
+        get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        get_isochrones_by_minutes(coord=(TEST_COORD[0] + 1e-12, TEST_COORD[1]), intervals=[15])
+
+        assert mock_post.call_count == 1
+
+    def test_expired_cache_refetched(self, mock_post, success_response_empty, fallback_cache):
+        """測試過期快取不會被直接回傳，而是重新呼叫 API"""
+        mock_post.return_value = success_response_empty
+        fallback_cache[STALE_CACHE_KEY] = (STALE_RESULT, STALE_TIMESTAMP)
+
+        result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+
+        mock_post.assert_called_once()
         assert result == []
 
+    def test_cache_ttl_boundary(self, mock_post, success_response_single, monkeypatch):
+        """測試快取在 TTL 內命中、超過 TTL 後重新呼叫 API（以注入的時鐘控制時間）"""
+        mock_post.return_value = success_response_single
+        ttl_seconds = ors_client.DEFAULT_CACHE_TTL_HOURS * 3600
+        now = [0.0]
+        monkeypatch.setattr(ors_client, "_clock", lambda: now[0])
+
+        get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        now[0] = ttl_seconds
+        get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        assert mock_post.call_count == 1
+
+        now[0] = ttl_seconds + 1
+        get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        assert mock_post.call_count == 2
+
+    def test_cache_bounded_by_maxsize(self, monkeypatch):
+        """測試快取超過 maxsize 時淘汰最舊的項目"""
+        clock = iter(range(1, 10))
+        monkeypatch.setattr(ors_client, "_clock", lambda: next(clock))
+
+        @ors_client.fallback_cache(maxsize=2)
+        def fetch(n):
+            return [n]
+
+        for n in range(3):
+            fetch(n)
+
+        assert [key[1] for key in fetch.cache_info()['items']] == [(1,), (2,)]
+
+    def test_disk_cache_survives_memory_loss(self, mock_post, success_response_single,
+                                             fallback_cache, monkeypatch, tmp_path):
+        """測試設定 ORS_CACHE_DIR 後，記憶體快取遺失（如程序重啟）仍可從磁碟快取取得結果"""
+        monkeypatch.setenv('ORS_CACHE_DIR', str(tmp_path))
+        mock_post.return_value = success_response_single
+
+        first = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        fallback_cache.clear()  # 模擬程序重啟
+        second = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+
+        assert mock_post.call_count == 1
+        assert second == first == [[SAMPLE_POLYGON]]
+
+        get_isochrones_by_minutes.cache_clear()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_disk_cache_stale_entry_serves_outage_after_restart(self, mock_post, success_response_single,
+                                                                fallback_cache, monkeypatch, tmp_path, no_sleep):
+        """測試程序重啟後遇到 ORS 故障時，已過 TTL 的磁碟快取仍作為備援回傳"""
+        monkeypatch.setenv('ORS_CACHE_DIR', str(tmp_path))
+        now = [time.time()]
+        monkeypatch.setattr(ors_client, "_clock", lambda: now[0])
+        mock_post.return_value = success_response_single
+
+        first = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        fallback_cache.clear()  # 模擬程序重啟
+        now[0] += ors_client.DEFAULT_CACHE_TTL_HOURS * 3600 + 1
+        mock_post.side_effect = ConnectionError("Connection failed")
+
+        result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+
+        assert result == first == [[SAMPLE_POLYGON]]
+        assert mock_post.call_count == 1 + ors_client.DEFAULT_MAX_ATTEMPTS  # 過期後確實重新呼叫 API
+        assert len(list(tmp_path.iterdir())) == 1  # 過期但未超過保留期限的檔案不會被刪除
+
+    def test_disk_cache_entry_past_stale_horizon_deleted(self, mock_post, success_response_single,
+                                                         fallback_cache, monkeypatch, tmp_path):
+        """測試磁碟快取檔案超過備援保留期限後不再使用：載入時刪除並重新呼叫 API"""
+        monkeypatch.setenv('ORS_CACHE_DIR', str(tmp_path))
+        mock_post.return_value = success_response_single
+        stale_seconds = ors_client.DEFAULT_CACHE_STALE_HOURS * 3600
+
+        get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        (cache_file,) = tmp_path.iterdir()
+        old_mtime = time.time() - stale_seconds - 1
+        os.utime(cache_file, (old_mtime, old_mtime))
+        fallback_cache.clear()  # 模擬程序重啟
+
+        get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+
+        assert mock_post.call_count == 2
+        assert cache_file.stat().st_mtime > old_mtime  # 重新取得後寫入新的檔案
+
+    def test_disk_cache_bounded_by_maxsize(self, monkeypatch, tmp_path):
+        """測試磁碟快取檔案數超過 maxsize 時刪除最舊的檔案"""
+        monkeypatch.setenv('ORS_CACHE_DIR', str(tmp_path))
+
+        @ors_client.fallback_cache(maxsize=2)
+        def fetch(n):
+            return [SAMPLE_POLYGON]
+
+        paths = [ors_client._disk_cache_path(("fetch", (n,), ())) for n in range(3)]
+        base = time.time() - 60
+        for n, path in enumerate(paths):
+            fetch(n)
+            os.utime(path, (base + n, base + n))  # 讓寫入順序明確反映在修改時間上
+
+        assert sorted(tmp_path.iterdir()) == sorted(paths[1:])
+
+    def test_disk_cache_key_includes_base_url(self, monkeypatch, tmp_path):
+        """測試磁碟快取的檔名包含 ORS 基底 URL：不同環境共用目錄時不會互相命中"""
+        monkeypatch.setenv('ORS_CACHE_DIR', str(tmp_path))
+        key = ("_fetch_isochrones_from_api", ("driving-car", (TEST_COORD,), (900,)), ())
+
+        path = ors_client._disk_cache_path(key)
+        monkeypatch.setattr(ors_client, "_CFG", ors_client.OrsConfig(url="https://other.example", api_key=None))
+
+        assert ors_client._disk_cache_path(key) != path
+
+    def test_cache_entry_roundtrip_is_compact(self):
+        """測試磁碟快取格式（壓縮的 WKB）可完整還原，且比 pickle 更小"""
+        polygons = [SAMPLE_POLYGON, SAMPLE_POLYGON.buffer(0.01)]
+
+        encoded = ors_client._encode_cache_entry(polygons, 123.5)
+
+        assert ors_client._decode_cache_entry(encoded) == (polygons, 123.5)
+        assert len(encoded) < len(pickle.dumps(polygons))
+
+    # === 批次請求測試 ===
+
+    def test_get_isochrones_batch_parallel(self, mock_post, success_response_single):
+        """測試批次請求並行送出：總耗時小於逐一請求的總和，結果依輸入順序回傳"""
+        delay = 0.05
+
+        def slow_post(**kwargs):
+            time.sleep(delay)
+            return success_response_single
+
+        mock_post.side_effect = slow_post
+        items = [((TEST_COORD[0] + i, TEST_COORD[1]), [15]) for i in range(4)]
+
+        start = time.perf_counter()
+        results = get_isochrones_batch(items)
+        elapsed = time.perf_counter() - start
+
+        assert mock_post.call_count == len(items)
+        assert elapsed < len(items) * delay
+        assert results == [[[SAMPLE_POLYGON]]] * len(items)
+
+    def test_get_isochrones_batch_shares_cache_across_workers(self, mock_post, success_response_single):
+        """測試 16 個批次任務（8 個座標各出現兩次）在多執行緒下每個座標只請求一次"""
+        def slow_post(**kwargs):
+            time.sleep(0.01)
+            return success_response_single
+
+        mock_post.side_effect = slow_post
+        items = [((TEST_COORD[0] + i % 8, TEST_COORD[1]), [15]) for i in range(16)]
+
+        results = get_isochrones_batch(items)
+
+        assert mock_post.call_count == 8
+        assert results == [[[SAMPLE_POLYGON]]] * 16
+
+    async def test_get_isochrones_batch_async(self, mock_post, success_response_single):
+        """測試非同步批次請求：每個座標各送出一次請求，結果依輸入順序回傳"""
+        mock_post.return_value = success_response_single
+        items = [((TEST_COORD[0] + i, TEST_COORD[1]), [15]) for i in range(3)]
+
+        results = await get_isochrones_batch_async(items)
+
+        assert mock_post.call_count == len(items)
+        sent = [call.kwargs["json"]["locations"] for call in mock_post.call_args_list]
+        assert sorted(sent) == [(coord,) for coord, _ in items]
+        assert results == [[[SAMPLE_POLYGON]]] * len(items)
+
+    async def test_get_isochrones_batch_async_limits_concurrency(self, mock_post, success_response_single):
+        """測試非同步批次請求同時進行的請求數不超過 max_concurrency"""
+        lock = threading.Lock()
+        active = peak = 0
+
+        def slow_post(**kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return success_response_single
+
+        mock_post.side_effect = slow_post
+        items = [((TEST_COORD[0] + i, TEST_COORD[1]), [15]) for i in range(6)]
+
+        await get_isochrones_batch_async(items, max_concurrency=2)
+
+        assert mock_post.call_count == len(items)
+        assert peak <= 2
+
+    def test_inflight_deduplication(self, mock_post, success_response_single):
+        """測試多執行緒同時以相同參數請求時，只送出一次 API 請求並共用結果"""
+        def slow_post(**kwargs):
+            time.sleep(0.05)
+            return success_response_single
+
+        mock_post.side_effect = slow_post
+        barrier = threading.Barrier(10)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15]))
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_post.call_count == 1
+        assert results == [[[SAMPLE_POLYGON]]] * 10
+
+    def test_inflight_waiters_released_on_base_exception(self, mock_post, success_response_single, monkeypatch):
+        """測試負責請求的呼叫因 BaseException（如 KeyboardInterrupt）中斷時，等待中的呼叫會收到 IsochroneError 而不會永久阻塞"""
+        owner_started = threading.Event()
+        waiter_blocked = threading.Event()
+        release = threading.Event()
+
+        class SignallingFuture(Future):
+            """只有等待者會呼叫 result()，藉此得知等待者確實已在等待共用的請求"""
+            def result(self, timeout=None):
+                waiter_blocked.set()
+                return super().result(timeout)
+
+        monkeypatch.setattr(ors_client, "Future", SignallingFuture)
+
+        def interrupted_post(**kwargs):
+            if mock_post.call_count > 1:
+                return success_response_single
+            owner_started.set()
+            release.wait(timeout=5)
+            raise KeyboardInterrupt
+
+        mock_post.side_effect = interrupted_post
+        outcomes = {}
+
+        def call(name):
+            try:
+                outcomes[name] = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+            except BaseException as e:
+                outcomes[name] = e
+
+        owner = threading.Thread(target=call, args=("owner",), daemon=True)
+        owner.start()
+        if not owner_started.wait(timeout=5):
+            pytest.fail("owner never reached the ORS request")
+        waiter = threading.Thread(target=call, args=("waiter",), daemon=True)
+        waiter.start()
+        if not waiter_blocked.wait(timeout=5):
+            pytest.fail("waiter never blocked on the in-flight request")
+        release.set()
+        owner.join(timeout=1)
+        waiter.join(timeout=1)
+
+        assert not waiter.is_alive()
+        assert isinstance(outcomes["owner"], KeyboardInterrupt)
+        assert isinstance(outcomes["waiter"], IsochroneError)
+        assert mock_post.call_count == 1
+        assert not ors_client._inflight
+
+    # === 連線池測試 ===
+
+    def test_session_uses_pooled_adapter_without_retries(self):
+        """測試 ORS session 使用連線池，且重試交由 retry_on_network_error 處理"""
+        adapter = ors_client._session.get_adapter(TEST_ENV['ORS_URL'])
+
+        assert adapter._pool_connections == ors_client.DEFAULT_POOL_CONNECTIONS
+        assert adapter._pool_maxsize == ors_client.DEFAULT_POOL_MAXSIZE
+        assert adapter.max_retries.total == 0
+
+    def test_session_advertises_compression(self):
+        """測試 session 宣告可接受壓縮回應，大型等時圈回應以 gzip 傳輸並自動解壓"""
+        assert "gzip" in ors_client._session.headers["Accept-Encoding"]
+
+
+class TestORSRetries(_IsochroneTestBase):
+    """測試重試、退避與快取回退；time.sleep 以 mock 取代，只記錄不等待"""
+
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, no_sleep):
+        self.mock_sleep = no_sleep
+
     # === HTTP 錯誤處理測試 ===
     
-    @patch('time.sleep')
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
-    def test_503_service_unavailable_no_cache(self, mock_post, mock_sleep):
-        """測試 503 Service Unavailable 且無快取時拋出 IsochroneError"""
-        error = HTTPError("503 Service Unavailable")
-        error.response = Mock(status_code=503)
-        mock_post.return_value = self._create_mock_response(
-            status_code=503, error_text="Service Unavailable", raise_error=error
-        )
+    @pytest.mark.parametrize("failure", [
+        pytest.param(_error_response(503, "Service Unavailable"), id="503"),
+        pytest.param(ConnectionError("Connection failed"), id="connection-error"),
+    ])
+    def test_retries_exhausted_no_cache(self, mock_post, failure):
+        """測試持續失敗（可重試的 HTTP 錯誤或網路錯誤）且無快取時，重試 3 次後拋出 IsochroneError"""
+        mock_post.side_effect = [failure] * 3
         
         with pytest.raises(IsochroneError) as exc_info:
             get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15, 30])
@@ -166,152 +592,83 @@ class TestGetIsochronesByMinutes:
         assert "no cache available" in str(exc_info.value)
         assert mock_post.call_count == 3  # 重試 3 次
         
-        # 驗證 sleep 被正確調用 (1秒, 2秒) - 重試3次但只sleep 2次
-        expected_calls = [call(1), call(2)]
-        mock_sleep.assert_has_calls(expected_calls)
-        assert mock_sleep.call_count == 2
-
-    @patch('time.sleep')
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
-    def test_429_rate_limit_retry_success(self, mock_post, mock_sleep):
-        """測試 429 Rate Limit 重試後成功"""
-        def side_effect(*args, **kwargs):
-            if mock_post.call_count <= 2:
-                error = HTTPError("429 Too Many Requests")
-                error.response = Mock(status_code=429)
-                return self._create_mock_response(
-                    status_code=429, error_text="Too Many Requests", raise_error=error
-                )
-            else:
-                return self._create_mock_response(json_data=SAMPLE_GEOJSON)
-        
-        mock_post.side_effect = side_effect
+        # 驗證 sleep 被正確調用 (約1秒, 約2秒) - 重試3次但只sleep 2次
+        _assert_retry_backoff(self.mock_sleep)
+
+    @pytest.mark.parametrize("failure", [
+        pytest.param(_error_response(429, "Too Many Requests"), id="429"),
+        pytest.param(_error_response(500, "Internal Server Error"), id="500"),
+        pytest.param(_error_response(502, "Bad Gateway"), id="502"),
+        pytest.param(_error_response(503, "Service Unavailable"), id="503"),
+        pytest.param(Timeout("Connection timeout"), id="timeout"),
+        pytest.param(ConnectionError("Connection failed"), id="connection-error"),
+        pytest.param(FakeResponse(content=b"Invalid JSON"), id="invalid-json"),
+    ])
+    def test_transient_failure_retry_success(self, mock_post, success_response_single, failure):
+        """測試暫時性失敗（429/5xx、網路錯誤、JSON 解析錯誤）重試後成功"""
+        mock_post.side_effect = [failure, failure, success_response_single]
         
         result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
         
         assert mock_post.call_count == 3
-        self._assert_basic_result_structure(result)
+        assert result == [[SAMPLE_POLYGON]]
         
-        # 驗證 sleep 被正確調用 (1秒, 2秒)
-        expected_calls = [call(1), call(2)]
-        mock_sleep.assert_has_calls(expected_calls)
-        assert mock_sleep.call_count == 2
+        # 驗證 sleep 被正確調用 (約1秒, 約2秒) - 重試3次但只sleep 2次
+        _assert_retry_backoff(self.mock_sleep)
 
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
     def test_400_bad_request_not_retried(self, mock_post):
         """測試 400 Bad Request 不會重試"""
-        error = HTTPError("400 Bad Request")
-        error.response = Mock(status_code=400)
-        mock_post.return_value = self._create_mock_response(
-            status_code=400, error_text="Bad Request", raise_error=error
-        )
+        mock_post.return_value = _error_response(400, "Bad Request")
         
         with pytest.raises(IsochroneError):
             get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
         
         assert mock_post.call_count == 1  # 不重試
+        _assert_retry_backoff(self.mock_sleep, retries=0)
+
+    @pytest.mark.parametrize("retry_after,expected_delay", [
+        ("7", 7.0),
+        ("120", ors_client.DEFAULT_MAX_RETRY_DELAY),  # 超過上限時截斷
+    ])
+    def test_retry_after_header_overrides_backoff(self, mock_post, success_response_single,
+                                                  retry_after, expected_delay):
+        """測試 429 回應帶 Retry-After 時依其等待，且不超過 max_delay"""
+        rate_limited = FakeResponse(429, text="Too Many Requests", headers={"Retry-After": retry_after})
+        mock_post.side_effect = [rate_limited, success_response_single]
 
-    # === 網路連線錯誤測試 ===
-    
-    @patch('time.sleep')
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
-    def test_connection_timeout_retry_success(self, mock_post, mock_sleep):
-        """測試連接超時重試後成功"""
-        def side_effect(*args, **kwargs):
-            if mock_post.call_count <= 2:
-                raise Timeout("Connection timeout")
-            else:
-                return self._create_mock_response(json_data=SAMPLE_GEOJSON)
-        
-        mock_post.side_effect = side_effect
-        
         result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
-        
-        assert mock_post.call_count == 3
-        self._assert_basic_result_structure(result)
-        
-        # 驗證 sleep 被正確調用 (1秒, 2秒)
-        expected_calls = [call(1), call(2)]
-        mock_sleep.assert_has_calls(expected_calls)
-        assert mock_sleep.call_count == 2
-
-    @patch('time.sleep')
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
-    def test_connection_error_max_retries_exceeded(self, mock_post, mock_sleep):
-        """測試連接錯誤超過最大重試次數"""
-        mock_post.side_effect = ConnectionError("Connection failed")
-        
-        with pytest.raises(IsochroneError) as exc_info:
-            get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
-        
-        assert "no cache available" in str(exc_info.value)
-        assert mock_post.call_count == 3
-        
-        # 驗證 sleep 被正確調用 (1秒, 2秒) - 重試3次但只sleep 2次
-        expected_calls = [call(1), call(2)]
-        mock_sleep.assert_has_calls(expected_calls)
-        assert mock_sleep.call_count == 2
-
-    @patch('time.sleep')
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
-    def test_json_decode_error_retry_success(self, mock_post, mock_sleep):
-        """測試 JSON 解析錯誤重試後成功"""
-        def side_effect(*args, **kwargs):
-            if mock_post.call_count <= 2:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.json.side_effect = JSONDecodeError("Invalid JSON", "response", 0)
-                return mock_response
-            else:
-                return self._create_mock_response(json_data=SAMPLE_GEOJSON)
-        
-        mock_post.side_effect = side_effect
-        
-        result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
-        
-        assert mock_post.call_count == 3
-        self._assert_basic_result_structure(result)
-        
-        # 驗證 sleep 被正確調用 (1秒, 2秒)
-        expected_calls = [call(1), call(2)]
-        mock_sleep.assert_has_calls(expected_calls)
-        assert mock_sleep.call_count == 2
+
+        assert result == [[SAMPLE_POLYGON]]
+        assert [c.args[0] for c in self.mock_sleep.call_args_list] == [expected_delay]
+
+    def test_retry_backoff_monotonic(self):
+        """測試退避等待時間逐次增加（jitter 不會讓後一次短於前一次）"""
+        @ors_client.retry_on_network_error(max_attempts=5, delay=0.01)
+        def always_times_out():
+            raise Timeout("Connection timeout")
+
+        with pytest.raises(Timeout):
+            always_times_out()
+
+        delays = [c.args[0] for c in self.mock_sleep.call_args_list]
+        assert len(delays) == 4
+        assert all(earlier < later for earlier, later in zip(delays, delays[1:]))
 
     # === 快取回退測試 ===
     
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
     @patch('innsight.ors_client.logger')
-    def test_cache_fallback_with_warning(self, mock_logger, mock_post):
+    def test_cache_fallback_with_warning(self, mock_logger, mock_post, fallback_cache):
         """測試快取回退機制"""
-        # 先建立快取
-        mock_post.return_value = self._create_mock_response(json_data=SAMPLE_GEOJSON)
-        first_result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
-        assert len(first_result) == 1
-        
+        # 直接放入一筆過期快取（時間戳為 epoch）
+        fallback_cache[STALE_CACHE_KEY] = (STALE_RESULT, STALE_TIMESTAMP)
+
         # 模擬 API 永遠回 503
-        error = HTTPError("503 Service Unavailable")
-        error.response = Mock(status_code=503)
-        mock_post.return_value = self._create_mock_response(
-            status_code=503, error_text="Service Unavailable", raise_error=error
-        )
-        
-        # 手動設置快取為過期狀態
-        cache_key = ('_fetch_isochrones_from_api', ('driving-car', (TEST_COORD,), (900,)), ())
-        if cache_key in _fallback_cache:
-            cached_result, _ = _fallback_cache[cache_key]
-            old_timestamp = time.time() - 25 * 3600  # 25小時前
-            _fallback_cache[cache_key] = (cached_result, old_timestamp)
-        
-        # 再次調用，使用過期快取
+        mock_post.return_value = _error_response(503, "Service Unavailable")
+
+        # 呼叫 API 失敗，應回退到過期快取
         fallback_result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
 
-        assert len(fallback_result) == 1
+        assert fallback_result == [[polygon] for polygon in STALE_RESULT]
         mock_logger.warning.assert_called()
 
         # 驗證有快取回退的 warning
@@ -319,81 +676,48 @@ class TestGetIsochronesByMinutes:
         fallback_warnings = [call for call in warning_calls if 'using stale cache' in call]
         assert len(fallback_warnings) > 0
 
-    # === API 錯誤響應測試 ===
-    
-    @patch.dict(os.environ, TEST_ENV)
-    @patch('requests.post')
-    def test_api_error_response_handling(self, mock_post):
-        """測試 API 錯誤響應處理"""
-        error_json = {
-            "error": {
-                "code": 2004,
-                "message": "Request parameters exceed the server configuration limits."
-            }
-        }
-        mock_post.return_value = self._create_mock_response(json_data=error_json)
-        
-        with pytest.raises(APIError) as exc_info:
-            get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
-        
-        error_msg = str(exc_info.value)
-        assert "ORS API error 2004" in error_msg
-        assert "Request parameters exceed" in error_msg
-
-    # === 快取管理測試 ===
-    
-    def test_cache_info_and_clear(self):
-        """測試快取資訊和清理功能"""
-        get_isochrones_by_minutes.cache_clear()
 
-        cache_info = get_isochrones_by_minutes.cache_info()
-        assert isinstance(cache_info, dict)
-        assert 'size' in cache_info
-        assert cache_info['size'] == 0
+def _classify_logs(buf):
+    """Sort captured JSON log lines into success / retry / error in one pass."""
+    logs = {"success": [], "retry": [], "error": []}
+    for line in buf.lines():
+        lowered = line.lower()
+        if "succeeded" in lowered:
+            logs["success"].append(line)
+        elif "retry" in lowered:
+            logs["retry"].append(line)
+        elif '"level": "error"' in line or '"level":"error"' in line:
+            logs["error"].append(line)
+    return logs
 
 
 class TestStructuredLogging:
     """Test suite for structured logging in ORS client."""
 
-    def setup_method(self):
-        """Clear cache before each test."""
-        _fallback_cache.clear()
-        get_isochrones_by_minutes.cache_clear()
+    @pytest.fixture
+    def log_capture(self, env, app_config, log_output, configure_logged):
+        """JSON logging routed into an in-memory buffer."""
+        env(LOG_FORMAT="json")
+        configure_logged(app_config, stream=log_output)
+        return log_output
 
-    def test_api_success_logged_with_latency(self, monkeypatch, app_config):
+    def test_api_success_logged_with_latency(self, log_capture, mock_post):
         """Test that successful API call logs include latency."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.logging_config import configure_logging
-
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
-
         # Mock successful API call
-        with patch.dict(os.environ, TEST_ENV):
-            with patch('requests.post') as mock_post:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.json.return_value = SAMPLE_GEOJSON
-                mock_response.raise_for_status.return_value = None
-                mock_post.return_value = mock_response
+        mock_post.return_value = _stub_response(SAMPLE_GEOJSON)
 
-                # When: Call API
-                result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        # When: Call API
+        result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
 
         # Then: Should succeed
         assert len(result) == 1
 
         # And: Log should contain success with latency
-        log_output.seek(0)
-        log_lines = log_output.readlines()
-
-        # Find the success log
-        success_logs = [line for line in log_lines if 'succeeded' in line.lower()]
+        success_logs = _classify_logs(log_capture)["success"]
         assert len(success_logs) > 0, "No API success log found"
 
         # Parse the JSON log
-        log_data = json.loads(success_logs[0].strip())
+        log_data = _loads(success_logs[0].strip())
 
         # Verify structured fields
         assert log_data["message"] == "External API call succeeded"
@@ -405,46 +729,27 @@ class TestStructuredLogging:
         assert log_data["latency_ms"] > 0
         assert log_data["success"] is True
 
-    def test_retry_logged_with_details(self, monkeypatch, app_config):
+    def test_retry_logged_with_details(self, log_capture, mock_post, no_sleep):
         """Test that retry attempts log structured details."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.logging_config import configure_logging
-
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
-
         # Mock: First call fails with Timeout, second succeeds
-        with patch.dict(os.environ, TEST_ENV):
-            with patch('requests.post') as mock_post:
-                # First call raises Timeout
-                timeout_error = Timeout("Connection timed out")
+        # First call raises Timeout
+        timeout_error = Timeout("Connection timed out")
 
-                # Second call succeeds
-                success_response = Mock()
-                success_response.status_code = 200
-                success_response.json.return_value = SAMPLE_GEOJSON
-                success_response.raise_for_status.return_value = None
+        # Second call succeeds
+        mock_post.side_effect = [timeout_error, _stub_response(SAMPLE_GEOJSON)]
 
-                mock_post.side_effect = [timeout_error, success_response]
-
-                # When: Call API (will retry once)
-                with patch('time.sleep'):  # Skip actual sleep
-                    result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        # When: Call API (will retry once)
+        result = get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
 
         # Then: Should eventually succeed
         assert len(result) == 1
 
         # And: Log should contain retry warning
-        log_output.seek(0)
-        log_lines = log_output.readlines()
-
-        # Find the retry log
-        retry_logs = [line for line in log_lines if 'retrying' in line.lower() or 'retry' in line.lower()]
+        retry_logs = _classify_logs(log_capture)["retry"]
         assert len(retry_logs) > 0, "No retry log found"
 
         # Parse the JSON log
-        log_data = json.loads(retry_logs[0].strip())
+        log_data = _loads(retry_logs[0].strip())
 
         # Verify structured fields
         assert "retry" in log_data["message"].lower() or "retrying" in log_data["message"].lower()
@@ -457,35 +762,21 @@ class TestStructuredLogging:
         assert log_data["error_type"] == "Timeout"
         assert "retry_delay_seconds" in log_data
 
-    def test_failure_logged_with_error_type(self, monkeypatch, app_config):
+    def test_failure_logged_with_error_type(self, log_capture, mock_post, no_sleep):
         """Test that final failure logs include error type and total attempts."""
-        monkeypatch.setenv("LOG_FORMAT", "json")
-
-        from innsight.logging_config import configure_logging
-
-        log_output = StringIO()
-        configure_logging(app_config, stream=log_output)
-
         # Mock: All attempts fail with Timeout
-        with patch.dict(os.environ, TEST_ENV):
-            with patch('requests.post') as mock_post:
-                mock_post.side_effect = Timeout("Connection timed out")
+        mock_post.side_effect = Timeout("Connection timed out")
 
-                # When: Call API (will fail after retries)
-                with patch('time.sleep'):  # Skip actual sleep
-                    with pytest.raises(IsochroneError):
-                        get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
+        # When: Call API (will fail after retries)
+        with pytest.raises(IsochroneError):
+            get_isochrones_by_minutes(coord=TEST_COORD, intervals=[15])
 
         # Then: Log should contain final failure
-        log_output.seek(0)
-        log_lines = log_output.readlines()
-
-        # Find the error log (should be last retry-related log before exception)
-        error_logs = [line for line in log_lines if '"level": "error"' in line or '"level":"error"' in line]
+        error_logs = _classify_logs(log_capture)["error"]
         assert len(error_logs) > 0, "No error log found"
 
         # Parse the JSON log
-        log_data = json.loads(error_logs[0].strip())
+        log_data = _loads(error_logs[0].strip())
 
         # Verify structured fields
         assert "failed" in log_data["message"].lower()
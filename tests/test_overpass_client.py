@@ -1,18 +1,66 @@
 """Unit tests for overpass_client module with comprehensive mocking."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 import requests
 from requests.exceptions import RequestException, Timeout, ConnectionError
-import os
+from json import dumps
+from types import SimpleNamespace
 
-from src.innsight.overpass_client import fetch_overpass
-from src.innsight.exceptions import NetworkError, APIError
+from innsight import overpass_client
+from innsight.overpass_client import fetch_overpass
+from innsight.exceptions import NetworkError, APIError
+
+
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+
+
+def _response(content, status_code=200):
+    """Lightweight read-only response stand-in; none of its attributes are asserted on."""
+    return SimpleNamespace(status_code=status_code, content=content, raise_for_status=lambda: None)
+
+
+def _json_response(payload):
+    """Successful response whose content is the serialized payload."""
+    return _response(dumps(payload).encode())
+
+
+def _error_response(status_code, reason, headers=None):
+    """Response whose raise_for_status() raises an HTTPError carrying it."""
+    response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+    def raise_for_status():
+        http_error = requests.HTTPError(reason)
+        http_error.response = response
+        raise http_error
+
+    response.raise_for_status = raise_for_status
+    return response
+
+
+@pytest.fixture(autouse=True)
+def overpass_env(monkeypatch):
+    """OVERPASS_URL for every test; read by fetch_overpass at request time."""
+    monkeypatch.setenv("OVERPASS_URL", OVERPASS_URL)
+
+
+@pytest.fixture(autouse=True)
+def mock_post(monkeypatch):
+    """Stand-in for the pooled session's post, installed for every test so none reaches Overpass."""
+    mock = Mock()
+    monkeypatch.setattr(overpass_client._session, "post", mock)
+    return mock
 
 
 class TestOverpassClient:
     """Test cases for overpass_client with mocked API calls."""
 
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        """Record retry backoff without actually waiting."""
+        self.mock_sleep = Mock()
+        monkeypatch.setattr(overpass_client.time, "sleep", self.mock_sleep)
+
     def setup_method(self):
         """Set up test fixtures."""
         self.test_query = """
@@ -21,12 +69,9 @@ class TestOverpassClient:
         out center;
         """
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_success(self, mock_post):
         """Test successful Overpass API request."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _json_response({
             "elements": [
                 {
                     "type": "node",
@@ -51,8 +96,7 @@ class TestOverpassClient:
                     }
                 }
             ]
-        }
-        mock_post.return_value = mock_response
+        })
         
         result = fetch_overpass(self.test_query)
         
@@ -71,36 +115,24 @@ class TestOverpassClient:
         assert call_args[1]['data'] == {"data": self.test_query}
         assert call_args[1]['timeout'] == 30
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_empty_results(self, mock_post):
         """Test Overpass API request with no results."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _json_response({
             "elements": []
-        }
-        mock_post.return_value = mock_response
+        })
         
         result = fetch_overpass(self.test_query)
         
         assert result == []
 
-    @patch('src.innsight.overpass_client.requests.post')
-    @patch.dict('os.environ', {'OVERPASS_URL': 'https://overpass-api.de/api/interpreter'})
     def test_fetch_overpass_http_error(self, mock_post):
         """Test Overpass API request with HTTP error."""
-        mock_response = Mock()
-        mock_response.status_code = 429  # Too Many Requests
-        http_error = requests.HTTPError("Too Many Requests")
-        http_error.response = mock_response  # Add response to the exception
-        mock_response.raise_for_status.side_effect = http_error
-        mock_post.return_value = mock_response
+        mock_post.return_value = _error_response(429, "Too Many Requests")
         
         # For HTTP 429, the code will retry and eventually raise the error
         with pytest.raises(requests.HTTPError):
             fetch_overpass(self.test_query)
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_timeout(self, mock_post):
         """Test Overpass API request timeout."""
         mock_post.side_effect = Timeout("Request timed out")
@@ -108,7 +140,6 @@ class TestOverpassClient:
         with pytest.raises(NetworkError, match="Connection timeout or failure"):
             fetch_overpass(self.test_query)
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_connection_error(self, mock_post):
         """Test Overpass API connection error."""
         mock_post.side_effect = ConnectionError("Connection failed")
@@ -116,39 +147,28 @@ class TestOverpassClient:
         with pytest.raises(NetworkError, match="Connection timeout or failure"):
             fetch_overpass(self.test_query)
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_invalid_json(self, mock_post):
         """Test Overpass API with invalid JSON response."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_post.return_value = mock_response
+        mock_post.return_value = _response(b"Invalid JSON")
         
         with pytest.raises(APIError, match="Invalid response format"):
             fetch_overpass(self.test_query)
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_missing_elements_key(self, mock_post):
         """Test Overpass API response without elements key."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _json_response({
             "version": "0.7.56.8",
             "generator": "Overpass API 0.7.56.8"
             # Missing "elements" key
-        }
-        mock_post.return_value = mock_response
+        })
         
         result = fetch_overpass(self.test_query)
         
         assert result == []
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_malformed_elements(self, mock_post):
         """Test Overpass API with malformed elements."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _json_response({
             "elements": [
                 {
                     "type": "node",
@@ -179,8 +199,7 @@ class TestOverpassClient:
                     }
                 }
             ]
-        }
-        mock_post.return_value = mock_response
+        })
         
         result = fetch_overpass(self.test_query)
         
@@ -190,7 +209,6 @@ class TestOverpassClient:
         assert result[0]["tags"]["name"] == "Valid Hotel"
         assert result[2]["tags"]["name"] == "Valid Apartment"
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_large_response(self, mock_post):
         """Test Overpass API with large number of results."""
         # Generate a large number of mock elements
@@ -207,12 +225,9 @@ class TestOverpassClient:
                 }
             })
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _json_response({
             "elements": elements
-        }
-        mock_post.return_value = mock_response
+        })
         
         result = fetch_overpass(self.test_query)
         
@@ -220,48 +235,31 @@ class TestOverpassClient:
         assert result[0]["tags"]["name"] == "Hotel 0"
         assert result[999]["tags"]["name"] == "Hotel 999"
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_server_error(self, mock_post):
         """Test Overpass API server error."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        http_error = requests.HTTPError("Internal Server Error")
-        http_error.response = mock_response  # Add response to the exception
-        mock_response.raise_for_status.side_effect = http_error
-        mock_post.return_value = mock_response
+        mock_post.return_value = _error_response(500, "Internal Server Error")
         
         with pytest.raises(requests.HTTPError):
             fetch_overpass(self.test_query)
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_query_error_response(self, mock_post):
         """Test Overpass API query syntax error."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        http_error = requests.HTTPError("Bad Request")
-        http_error.response = mock_response  # Add response to the exception
-        mock_response.raise_for_status.side_effect = http_error
-        mock_post.return_value = mock_response
+        mock_post.return_value = _error_response(400, "Bad Request")
         
         bad_query = "[invalid syntax"
         
         with pytest.raises(requests.HTTPError):
             fetch_overpass(bad_query)
 
-    def test_fetch_overpass_empty_query(self):
+    def test_fetch_overpass_empty_query(self, mock_post):
         """Test Overpass API with empty query."""
-        with patch('src.innsight.overpass_client.requests.post') as mock_post:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"elements": []}
-            mock_post.return_value = mock_response
-            
-            result = fetch_overpass("")
-            
-            assert result == []
-            mock_post.assert_called_once()
-
-    @patch('src.innsight.overpass_client.requests.post')
+        mock_post.return_value = _json_response({"elements": []})
+        
+        result = fetch_overpass("")
+        
+        assert result == []
+        mock_post.assert_called_once()
+
     def test_fetch_overpass_unicode_query(self, mock_post):
         """Test Overpass API with Unicode characters in query."""
         unicode_query = """
@@ -270,9 +268,7 @@ class TestOverpassClient:
         out center;
         """
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = _json_response({
             "elements": [
                 {
                     "type": "node",
@@ -285,8 +281,7 @@ class TestOverpassClient:
                     }
                 }
             ]
-        }
-        mock_post.return_value = mock_response
+        })
         
         result = fetch_overpass(unicode_query)
         
@@ -297,7 +292,6 @@ class TestOverpassClient:
         call_args = mock_post.call_args
         assert "東京" in call_args[1]['data']['data']
 
-    @patch('src.innsight.overpass_client.requests.post')
     def test_fetch_overpass_request_exception(self, mock_post):
         """Test Overpass API with generic request exception."""
         mock_post.side_effect = RequestException("Generic request error")
@@ -305,4 +299,24 @@ class TestOverpassClient:
         # RequestException is not specifically caught by fetch_overpass,
         # so it will bubble up as-is
         with pytest.raises(RequestException):
-            fetch_overpass(self.test_query)
\ No newline at end of file
+            fetch_overpass(self.test_query)
+
+    def test_session_uses_pooled_adapter_without_retries(self):
+        """Test that the Overpass session pools connections and leaves retries to fetch_overpass."""
+        adapter = overpass_client._session.get_adapter(OVERPASS_URL)
+
+        assert adapter._pool_connections == overpass_client.DEFAULT_POOL_CONNECTIONS
+        assert adapter._pool_maxsize == overpass_client.DEFAULT_POOL_MAXSIZE
+        assert adapter.max_retries.total == 0
+
+    def test_fetch_overpass_retries_with_backoff(self, mock_post):
+        """Test that retryable failures back off exponentially and honor Retry-After."""
+        rate_limited = _error_response(429, "Too Many Requests", headers={"Retry-After": "7"})
+        mock_post.side_effect = [Timeout("Request timed out"), rate_limited, _json_response({"elements": []})]
+
+        assert fetch_overpass(self.test_query) == []
+
+        first, second = [c.args[0] for c in self.mock_sleep.call_args_list]
+        max_first = overpass_client.DEFAULT_RETRY_DELAY * (1 + overpass_client.DEFAULT_RETRY_JITTER)
+        assert overpass_client.DEFAULT_RETRY_DELAY <= first <= max_first
+        assert second == 7.0
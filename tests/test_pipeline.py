@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch, MagicMock
 import geopandas as gpd
 import pandas as pd
 
-from src.innsight.pipeline import Recommender
+from innsight.pipeline import Recommender
 
 
 class TestRecommenderPipeline:
@@ -14,11 +14,11 @@ class TestRecommenderPipeline:
     def setup_method(self):
         """Set up test fixtures before each test method."""
         # Start patches
-        self.config_patcher = patch('src.innsight.pipeline.AppConfig.from_env')
-        self.search_service_patcher = patch('src.innsight.pipeline.AccommodationSearchService')
-        self.geocode_service_patcher = patch('src.innsight.pipeline.GeocodeService')
-        self.isochrone_service_patcher = patch('src.innsight.pipeline.IsochroneService')
-        self.recommender_core_patcher = patch('src.innsight.pipeline.RecommenderCore')
+        self.config_patcher = patch('innsight.pipeline.AppConfig.from_env')
+        self.search_service_patcher = patch('innsight.pipeline.AccommodationSearchService')
+        self.geocode_service_patcher = patch('innsight.pipeline.GeocodeService')
+        self.isochrone_service_patcher = patch('innsight.pipeline.IsochroneService')
+        self.recommender_core_patcher = patch('innsight.pipeline.RecommenderCore')
 
         self.mock_config = self.config_patcher.start()
         self.mock_search_service = self.search_service_patcher.start()
@@ -164,8 +164,8 @@ class TestRecommenderPipeline:
         # Then: should keep original order from parsed, no duplicates
         assert result == ["parking", "kids", "pet", "wheelchair"]
 
-    @patch('src.innsight.pipeline.parse_query')
-    @patch('src.innsight.pipeline.extract_location_from_query') 
+    @patch('innsight.pipeline.parse_query')
+    @patch('innsight.pipeline.extract_location_from_query') 
     def test_run_integrates_parsed_filters_with_api_filters(self, mock_extract_location, mock_parse_query):
         """Test that run() method correctly integrates parsed and API filters."""
         # Given: query with parsed filters and API filters
@@ -221,8 +221,8 @@ class TestRecommenderPipeline:
         assert len(result['top']) == 1
         assert result['top'][0]['name'] == 'Hotel A'
 
-    @patch('src.innsight.pipeline.parse_query')
-    @patch('src.innsight.pipeline.extract_location_from_query')
+    @patch('innsight.pipeline.parse_query')
+    @patch('innsight.pipeline.extract_location_from_query')
     def test_run_handles_empty_parsed_filters(self, mock_extract_location, mock_parse_query):
         """Test that run() method handles empty parsed filters correctly."""
         # Given: query with no parsed filters but API filters
@@ -253,7 +253,7 @@ class TestRecommenderPipeline:
             "台北住宿推薦", expected_merged_filters, 10, None
         )
 
-    @patch('src.innsight.pipeline.parse_query')
+    @patch('innsight.pipeline.parse_query')
     def test_run_handles_parse_query_failure(self, mock_parse_query):
         """Test that run() method handles parse_query failures gracefully."""
         # Given: query that causes parse_query to fail
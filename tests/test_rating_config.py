@@ -3,9 +3,9 @@
 import os
 import pytest
 from unittest.mock import patch
-from src.innsight.config import AppConfig
-from src.innsight.rating_service import RatingService, score_accommodation
-from src.innsight.exceptions import ConfigurationError
+from innsight.config import AppConfig
+from innsight.rating_service import RatingService, score_accommodation
+from innsight.exceptions import ConfigurationError
 
 
 class TestRatingConfiguration:
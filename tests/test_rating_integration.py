@@ -4,8 +4,8 @@ import pytest
 import pandas as pd
 import geopandas as gpd
 from unittest.mock import Mock, patch
-from src.innsight.services import AccommodationSearchService
-from src.innsight.config import AppConfig
+from innsight.services import AccommodationSearchService
+from innsight.config import AppConfig
 
 
 class TestRatingIntegration:
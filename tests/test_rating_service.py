@@ -4,7 +4,7 @@ import pytest
 import pandas as pd
 import time
 import warnings
-from src.innsight.rating_service import RatingService, score_accommodation
+from innsight.rating_service import RatingService, score_accommodation
 
 
 class TestScoreAccommodation:
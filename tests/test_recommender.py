@@ -5,8 +5,8 @@ import pandas as pd
 import geopandas as gpd
 from unittest.mock import Mock
 
-from src.innsight.recommender import Recommender
-from src.innsight.exceptions import NoAccommodationError
+from innsight.recommender import Recommender
+from innsight.exceptions import NoAccommodationError
 
 
 class TestRecommender:
@@ -5,7 +5,7 @@ import shutil
 from unittest.mock import patch, MagicMock
 import geopandas as gpd
 
-from src.innsight.reporter import generate_markdown_report
+from innsight.reporter import generate_markdown_report
 
 
 class TestMarkdownReportGeneration:
@@ -67,7 +67,7 @@ class TestMarkdownReportGeneration:
         })
         
         # Mock datetime to specific time
-        with patch('src.innsight.reporter.datetime') as mock_datetime:
+        with patch('innsight.reporter.datetime') as mock_datetime:
             mock_now = MagicMock()
             mock_now.strftime.return_value = "20250723_1345"
             mock_now.isoformat.return_value = "2025-07-23T13:45:00.000000"
@@ -1,7 +1,9 @@
 """Tests for utility functions."""
 
+from types import SimpleNamespace
+
 import pytest
-from src.innsight.utils import combine_tokens
+from innsight.utils import backoff_delay, combine_tokens, parse_retry_after
 
 
 class TestCombineTokens:
@@ -70,4 +72,39 @@ class TestCombineTokens:
         """Test with string tokens including empty strings."""
         tokens = ["hello", "", "world", ""]
         result = combine_tokens(tokens)
-        assert result == "helloworld"
\ No newline at end of file
+        assert result == "helloworld"
+
+
+class TestParseRetryAfter:
+    """Test suite for parse_retry_after function."""
+
+    @pytest.mark.parametrize("headers,expected", [
+        ({"Retry-After": "7"}, 7.0),
+        ({"Retry-After": "-3"}, 0.0),
+        ({"Retry-After": "Thu, 01 Jan 1970 00:00:00 GMT"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+        ({}, None),
+    ])
+    def test_parse_retry_after(self, headers, expected):
+        """Test delta-seconds, past HTTP-dates, garbage and missing headers."""
+        assert parse_retry_after(SimpleNamespace(headers=headers)) == expected
+
+    def test_parse_retry_after_without_headers(self):
+        """Test a response object that has no headers attribute."""
+        assert parse_retry_after(object()) is None
+
+
+class TestBackoffDelay:
+    """Test suite for backoff_delay function."""
+
+    def test_backoff_delay_grows_within_jitter(self):
+        """Test exponential growth with the jitter bound applied."""
+        for attempt in range(3):
+            base = 1 * 2 ** attempt
+            assert base <= backoff_delay(attempt, 1, 2, 30, 0.5) <= base * 1.5
+
+    def test_backoff_delay_capped_and_retry_after_preferred(self):
+        """Test that Retry-After wins over backoff and both respect max_delay."""
+        assert backoff_delay(10, 1, 2, 30, 0.5) == 30
+        assert backoff_delay(0, 1, 2, 30, 0.5, retry_after=7.0) == 7.0
+        assert backoff_delay(0, 1, 2, 30, 0.5, retry_after=120.0) == 30